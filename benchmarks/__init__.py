@@ -0,0 +1,4 @@
+"""
+Benchmarks of manim-beamer's components (lists, blocks, tables, .bib files and whole decks) on
+synthetic workloads. Run them from the repository's root with: python -m benchmarks --help
+"""
@@ -0,0 +1,73 @@
+"""
+Run the benchmarks, optionally saving the results as a baseline or comparing them against one.
+
+Examples:
+    python -m benchmarks --quick --save baseline.json
+    python -m benchmarks --quick --compare baseline.json
+"""
+
+import re
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import (
+    measure,
+    save_results,
+    load_results,
+    compare_results,
+    format_results,
+)
+from benchmarks.workloads import get_benchmarks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--filter", default=None, help="only run the benchmarks matching this regex"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="the number of timed repetitions"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="only use the smallest workloads"
+    )
+    parser.add_argument("--save", default=None, help="save the results to this file")
+    parser.add_argument(
+        "--compare", default=None, help="compare the results against this baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative increase of a metric that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    baseline = None if args.compare is None else load_results(args.compare)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="manim_beamer_bench_") as folder:
+        for benchmark in get_benchmarks(Path(folder), quick=args.quick):
+            if (
+                args.filter is not None
+                and re.search(args.filter, benchmark.name) is None
+            ):
+                continue
+            results.append(measure(benchmark, repeat=args.repeat))
+            print(format_results(results[-1:], baseline).splitlines()[-1], flush=True)
+
+    print()
+    print(format_results(results, baseline))
+    if args.save is not None:
+        save_results(results, args.save)
+    if baseline is not None:
+        regressions = compare_results(results, baseline, threshold=args.threshold)
+        if len(regressions) > 0:
+            print("\nRegressions:\n" + "\n".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
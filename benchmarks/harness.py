@@ -0,0 +1,211 @@
+"""
+Implements the measurement of the benchmarks (wall time, peak and retained memory) and the
+comparison of their results against a saved baseline.
+"""
+
+import gc
+import json
+import time
+import platform
+import statistics
+import tracemalloc
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Union
+
+# the metrics that are compared against a baseline (lower is better for all of them); the
+# retained memory is only reported, as the memoization of a run can shift it considerably
+METRICS = ("time", "peak_memory")
+
+
+@dataclass
+class Benchmark:
+    """
+    A benchmark: the setup prepares a fresh workload (untimed) before every repetition, and
+    the run performs the work that is measured.
+    """
+
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The measurements of a benchmark. The time is the median over the repetitions, while the
+    memory metrics come from one additional (traced) repetition.
+    """
+
+    name: str
+    time: float  # seconds
+    min_time: float  # seconds
+    peak_memory: int  # bytes
+    retained_memory: int  # bytes still allocated after the run (e.g., its result)
+    repeat: int
+
+
+def measure(benchmark: Benchmark, repeat: int = 3) -> BenchmarkResult:
+    """
+    Measure a benchmark.
+
+    Args:
+        benchmark: The benchmark.
+        repeat: The number of timed repetitions.
+
+    Returns:
+        The measurements.
+    """
+    times: List[float] = []
+    for _ in range(repeat):
+        state = benchmark.setup()
+        gc.collect()
+        start = time.perf_counter()
+        result = benchmark.run(state)
+        times.append(time.perf_counter() - start)
+        del state, result
+
+    # tracing slows the run down considerably, so the memory is measured separately
+    state = benchmark.setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = benchmark.run(state)
+        retained_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del state, result
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        time=statistics.median(times),
+        min_time=min(times),
+        peak_memory=peak_memory,
+        retained_memory=retained_memory,
+        repeat=repeat,
+    )
+
+
+def get_environment() -> Dict[str, str]:
+    """
+    Describe the environment the benchmarks ran in, so that baselines from different machines
+    or library versions are not compared unknowingly.
+
+    Returns:
+        The versions of Python and of the main dependencies.
+    """
+    environment = {"python": platform.python_version(), "machine": platform.machine()}
+    for package in ("manim", "manim_slides", "bibtexparser"):
+        try:
+            environment[package] = __import__(package).__version__
+        except (ImportError, AttributeError):
+            environment[package] = "unknown"
+    return environment
+
+
+def save_results(results: List[BenchmarkResult], path: Union[str, Path]) -> None:
+    """
+    Save the results (e.g., as a baseline) to a JSON file.
+
+    Args:
+        results: The results.
+        path: The path to the JSON file.
+    """
+    Path(path).write_text(
+        json.dumps(
+            {
+                "environment": get_environment(),
+                "results": {result.name: asdict(result) for result in results},
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, dict]:
+    """
+    Load the results saved with save_results.
+
+    Args:
+        path: The path to the JSON file.
+
+    Returns:
+        The results, keyed by the name of the benchmark.
+    """
+    return json.loads(Path(path).read_text(encoding="utf-8"))["results"]
+
+
+def compare_results(
+    results: List[BenchmarkResult], baseline: Dict[str, dict], threshold: float = 0.1
+) -> List[str]:
+    """
+    Compare the results against a baseline.
+
+    Args:
+        results: The results.
+        baseline: The baseline results (see load_results).
+        threshold: The relative increase of a metric that counts as a regression.
+
+    Returns:
+        A description of every regression, e.g., "lists_100 time: +25.3%".
+    """
+    regressions: List[str] = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+        for metric in METRICS:
+            old, new = baseline[result.name][metric], getattr(result, metric)
+            if old > 0 and (new - old) / old > threshold:
+                regressions.append(
+                    f"{result.name} {metric}: {100 * (new - old) / old:+.1f}%"
+                )
+    return regressions
+
+
+def format_size(size: float) -> str:
+    """
+    Format a number of bytes for humans, e.g., 1536 as "1.5 KiB".
+    """
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_results(
+    results: List[BenchmarkResult], baseline: Union[None, Dict[str, dict]] = None
+) -> str:
+    """
+    Format the results as a table; if a baseline is given, the relative change of the time and
+    peak memory is shown as well.
+
+    Args:
+        results: The results.
+        baseline: The baseline results (see load_results).
+
+    Returns:
+        The table.
+    """
+    lines: List[str] = [
+        f"{'benchmark':<32} {'time (s)':>10} {'min (s)':>10} "
+        f"{'peak memory':>12} {'retained':>12}"
+    ]
+    for result in results:
+        line = (
+            f"{result.name:<32} {result.time:>10.4f} {result.min_time:>10.4f} "
+            f"{format_size(result.peak_memory):>12} "
+            f"{format_size(result.retained_memory):>12}"
+        )
+        if baseline is not None and result.name in baseline:
+            changes = []
+            for metric in METRICS:
+                old = baseline[result.name][metric]
+                if old > 0:
+                    changes.append(
+                        f"{metric} {100 * (getattr(result, metric) - old) / old:+.1f}%"
+                    )
+            line += "  (" + ", ".join(changes) + ")"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,323 @@
+"""
+Implements the synthetic workloads of the benchmarks: lists, blocks, tables, .bib files and
+whole decks of configurable size.
+"""
+
+import os
+import random
+from pathlib import Path
+from functools import partial
+from contextlib import contextmanager
+from typing import Dict, List
+
+from manim import Table, Text, tempconfig
+
+from manim_beamer.assets import clear_svg_prototypes
+from manim_beamer.bibtex import BibTexManager
+from manim_beamer.blocks import Block, RemarkBlock, ExampleBlock, AlertBlock
+from manim_beamer.cache import CACHE_DIR_ENV_VAR
+from manim_beamer.export import StaticSlideShow
+from manim_beamer.lists import BeamerList, BulletedList, ItemizedList
+from manim_beamer.slides import SlideWithList, light_themed_table
+from manim_beamer.text_factory import text_factory
+from manim_beamer.theme import LIGHT_THEME, DARK_THEME
+
+from benchmarks.harness import Benchmark
+
+WORDS = (
+    "fuzzy neural network learning reinforcement policy rule graph deep model "
+    "inference logic reward agent state action value function"
+).split()
+LAST_NAMES = ("Smith", "Jones", "{van der Berg}", "Zhang", "Lee", "Hostetter", "Chi")
+
+
+def clear_caches() -> None:
+    """
+    Forget the mobjects memoized by manim-beamer, so that every repetition does the same work.
+    """
+    text_factory.cache_clear()
+    clear_svg_prototypes()
+
+
+@contextmanager
+def using_cache_dir(folder: Path):
+    """
+    Keep manim-beamer's on-disk caches in the given folder (instead of the user's cache
+    directory) within the context.
+
+    Args:
+        folder: The folder.
+    """
+    previous = os.environ.get(CACHE_DIR_ENV_VAR)
+    os.environ[CACHE_DIR_ENV_VAR] = str(folder)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[CACHE_DIR_ENV_VAR]
+        else:
+            os.environ[CACHE_DIR_ENV_VAR] = previous
+
+
+def make_sentence(rng: random.Random, num_of_words: int = 6) -> str:
+    return " ".join(rng.choices(WORDS, k=num_of_words)).capitalize()
+
+
+def make_list(
+    num_of_items: int, depth: int, list_class=BulletedList, seed: int = 0
+) -> BeamerList:
+    """
+    Make a list with the given number of items at its top level; every other item is followed
+    by a sublist (of half as many items) until the given depth is reached.
+
+    Args:
+        num_of_items: The number of items at the top level.
+        depth: The number of nested levels (at most BeamerList.max_allowed_lists).
+        list_class: The BeamerList subclass to make.
+        seed: The seed of the random sentences.
+
+    Returns:
+        The list.
+    """
+    rng = random.Random(seed)
+    items: List = []
+    for index in range(num_of_items):
+        items.append(make_sentence(rng))
+        if depth > 1 and index % 2 == 1:
+            items.append(
+                make_list(max(num_of_items // 2, 1), depth - 1, ItemizedList, seed + 1)
+            )
+    return list_class(items)
+
+
+def make_table(num_of_rows: int, num_of_cols: int) -> Table:
+    return Table(
+        [[f"{row}.{col}" for col in range(num_of_cols)] for row in range(num_of_rows)],
+        col_labels=[Text(f"Column {col}") for col in range(num_of_cols)],
+    )
+
+
+def write_bib_file(path: Path, num_of_entries: int, seed: int = 0) -> Path:
+    """
+    Write a .bib file of random (but realistic looking) articles.
+
+    Args:
+        path: The path to the .bib file.
+        num_of_entries: The number of entries.
+        seed: The seed of the random entries.
+
+    Returns:
+        The path to the .bib file.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("@string{jmlr = {Journal of Machine Learning Research}}\n\n")
+        for index in range(num_of_entries):
+            authors = " and ".join(
+                f"{chr(65 + rng.randrange(26))}. {rng.choice(LAST_NAMES)}"
+                for _ in range(rng.randint(1, 4))
+            )
+            file.write(
+                f"@article{{key{index},\n"
+                f"  author = {{{authors}}},\n"
+                f"  title = {{{make_sentence(rng, 8)}}},\n"
+                f"  journal = jmlr,\n"
+                f"  year = {{{1990 + index % 35}}},\n"
+                f"  month = jan\n"
+                f"}}\n\n"
+            )
+    return path
+
+
+def list_benchmarks(sizes=(10, 50), depths=(1, 3)) -> List[Benchmark]:
+    def setup(num_of_items, depth):
+        clear_caches()
+        return make_list(num_of_items, depth)
+
+    return [
+        Benchmark(
+            f"list_get_list_{size}x{depth}",
+            partial(setup, size, depth),
+            lambda beamer_list: beamer_list.get_list(scale_factor=1.0),
+        )
+        for size in sizes
+        for depth in depths
+    ]
+
+
+def block_benchmarks(num_of_items: int = 5) -> List[Benchmark]:
+    def setup(block_class, content):
+        clear_caches()
+        if content == "list":
+            return block_class("Block title", make_list(num_of_items, 2))
+        return block_class("Block title", make_sentence(random.Random(0), 12))
+
+    def run(block: Block) -> Block:
+        block.update_position_and_scale(scale_factor=1.0)
+        return block
+
+    return [
+        Benchmark(
+            f"block_{block_class.__name__}_{content}",
+            partial(setup, block_class, content),
+            run,
+        )
+        for block_class in (RemarkBlock, ExampleBlock, AlertBlock)
+        for content in ("text", "list")
+    ]
+
+
+def table_benchmarks(shapes=((5, 5), (20, 10), (50, 10))) -> List[Benchmark]:
+    def setup_themed(rows, cols):
+        return light_themed_table(make_table(rows, cols))
+
+    benchmarks: List[Benchmark] = []
+    for rows, cols in shapes:
+        benchmarks += [
+            Benchmark(
+                f"light_themed_table_{rows}x{cols}",
+                partial(make_table, rows, cols),
+                light_themed_table,
+            ),
+            Benchmark(
+                f"theme_recolor_table_{rows}x{cols}",
+                partial(setup_themed, rows, cols),
+                partial(DARK_THEME.recolor, source=LIGHT_THEME),
+            ),
+        ]
+    return benchmarks
+
+
+def bibtex_benchmarks(folder: Path, sizes=(1_000, 10_000, 100_000)) -> List[Benchmark]:
+    # the .bib files and their caches are kept out of the user's cache directory
+    bib_paths: Dict[int, Path] = {}
+
+    def get_bib_path(size: int) -> Path:
+        if size not in bib_paths:
+            bib_paths[size] = write_bib_file(folder / f"{size}.bib", size)
+        return bib_paths[size]
+
+    def prepare(size: int) -> int:
+        get_bib_path(size)  # the .bib file is written once, outside the measurement
+        return size
+
+    def load(size: int, use_cache: bool = False, lazy: bool = False):
+        bib_path = get_bib_path(size)
+        with using_cache_dir(folder / "cache"):
+            return BibTexManager(bib_path, use_cache=use_cache, lazy=lazy)
+
+    def warm_up(size: int) -> int:
+        load(size, use_cache=True)  # writes the cache that the measured load then reads
+        return size
+
+    def lookup(bib_manager: BibTexManager, num_of_lookups: int = 1_000):
+        rng = random.Random(0)
+        num_of_entries = len(bib_manager.entries_by_key) or len(
+            bib_manager.entry_offsets
+        )
+        return [
+            bib_manager.slide_short_cite(f"key{rng.randrange(num_of_entries)}")
+            for _ in range(num_of_lookups)
+        ]
+
+    def load_indexed(size: int) -> BibTexManager:
+        bib_manager = load(size)
+        bib_manager.index  # the inverted index is built outside the measurement
+        return bib_manager
+
+    def search(bib_manager: BibTexManager, num_of_queries: int = 100):
+        rng = random.Random(0)
+        results = []
+        for _ in range(num_of_queries):
+            year = rng.randrange(1990, 2025)
+            results += [
+                bib_manager.search(
+                    author=rng.choice(LAST_NAMES), years=(year, year + 2)
+                ),
+                bib_manager.search(title=rng.choice(WORDS)[:3], prefix=True),
+                bib_manager.index.find_similar_keys(f"kye{rng.randrange(1000)}"),
+            ]
+        return results
+
+    benchmarks: List[Benchmark] = []
+    for size in sizes:
+        benchmarks += [
+            Benchmark(f"bibtex_load_{size}", partial(prepare, size), load),
+            Benchmark(
+                f"bibtex_load_cached_{size}",
+                partial(warm_up, size),
+                partial(load, use_cache=True),
+            ),
+            Benchmark(
+                f"bibtex_load_lazy_{size}",
+                partial(prepare, size),
+                partial(load, lazy=True),
+            ),
+            Benchmark(f"bibtex_lookup_{size}", partial(load, size), lookup),
+            Benchmark(
+                f"bibtex_lookup_lazy_{size}", partial(load, size, lazy=True), lookup
+            ),
+            Benchmark(
+                f"bibtex_index_{size}",
+                partial(load, size),
+                lambda bib_manager: bib_manager.index,
+            ),
+            Benchmark(f"bibtex_search_{size}", partial(load_indexed, size), search),
+        ]
+    return benchmarks
+
+
+def deck_benchmarks(sizes=(5, 20), num_of_items: int = 5) -> List[Benchmark]:
+    def setup(num_of_slides):
+        clear_caches()
+        return [
+            SlideWithList(
+                title=f"Slide {index}",
+                subtitle="A synthetic slide",
+                beamer_list=make_list(num_of_items, 2, seed=index),
+            )
+            for index in range(num_of_slides)
+        ]
+
+    def run(slides):
+        # the animate=False path of every slide, without writing any video
+        with tempconfig(
+            {"write_to_movie": False, "save_last_frame": False, "disable_caching": True}
+        ):
+            scene = StaticSlideShow(slides=slides, steps=False, batch_tex=False)
+            scene.construct()
+        return scene
+
+    return [
+        Benchmark(f"slide_show_construct_{size}", partial(setup, size), run)
+        for size in sizes
+    ]
+
+
+def get_benchmarks(folder: Path, quick: bool = False) -> List[Benchmark]:
+    """
+    Get all the benchmarks.
+
+    Args:
+        folder: The folder for the files of the workloads (e.g., the .bib files and their
+            caches); the caller removes it once the benchmarks have run.
+        quick: Whether to only use the smallest size of every workload.
+
+    Returns:
+        The benchmarks.
+    """
+    if quick:
+        return (
+            list_benchmarks(sizes=(10,), depths=(1, 3))
+            + block_benchmarks()
+            + table_benchmarks(shapes=((5, 5),))
+            + bibtex_benchmarks(folder, sizes=(1_000,))
+            + deck_benchmarks(sizes=(5,))
+        )
+    return (
+        list_benchmarks()
+        + block_benchmarks()
+        + table_benchmarks()
+        + bibtex_benchmarks(folder)
+        + deck_benchmarks()
+    )
@@ -1,8 +1,44 @@
 """
-Contains constant colors used in the manim beamer theme.
+Slides in the style of LaTeX beamer for manim and manim-slides: lists, blocks, tables, images,
+citations and whole slide shows (see the submodules), as well as the theme constants (e.g.,
+MANIM_BLUE and light_theme_style, which used to live in manim_beamer.blocks).
+
+The submodules and the theme constants are only imported on first use, so that the parts of
+the package that do not need manim (e.g., manim_beamer.bibtex) load quickly.
 """
 
-from manim import ManimColor
+import importlib
+
+SUBMODULES = (
+    "assets",
+    "bibtex",
+    "blocks",
+    "build",
+    "cache",
+    "export",
+    "fingerprint",
+    "images",
+    "latex",
+    "lists",
+    "slides",
+    "text_factory",
+    "text_metrics",
+    "theme",
+    "tracing",
+)
+THEME_CONSTANTS = ("MANIM_BLUE", "light_theme_style")
+
+
+def __getattr__(name: str):
+    if name in THEME_CONSTANTS:
+        value = getattr(importlib.import_module("manim_beamer.theme"), name)
+    elif name in SUBMODULES:
+        value = importlib.import_module(f"manim_beamer.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # resolve it only once
+    return value
 
 
-MANIM_BLUE = ManimColor("#58C4DD")
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES) | set(THEME_CONSTANTS))
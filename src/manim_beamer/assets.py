@@ -0,0 +1,315 @@
+"""
+Implements the asset pipeline for images:
+
+- raster images are decoded once, downsampled to (at most) the output resolution and kept in a
+  content-addressed on-disk cache, from which their pixels are loaded as they are (without
+  decoding the source again). Hence, the time and memory needed to show an image scale with
+  the output resolution rather than with the resolution of the source file.
+- SVG files are parsed once; the geometry (points) and styles of their submobjects are kept in
+  a content-addressed on-disk cache, and shared between the draws of the same file.
+"""
+
+import gc
+import pickle
+import hashlib
+from pathlib import Path
+from collections import OrderedDict
+from typing import Union, Dict, Tuple
+
+import numpy as np
+from PIL import Image
+from manim import ImageMobject, SVGMobject, VMobject, config
+from manim.constants import QUALITIES, DEFAULT_QUALITY
+from manim.utils.images import get_full_raster_image_path, get_full_vector_image_path
+
+from manim_beamer.cache import atomic_write, get_cache_dir, hash_file
+from manim_beamer.fingerprint import fingerprint
+
+# bump this whenever a change alters the cached pixel arrays or SVG geometry
+ASSET_CACHE_VERSION: int = 1
+
+# the attributes of a VMobject that are kept (besides its points) in the SVG geometry cache
+SVG_STYLE_ATTRIBUTES = (
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "joint_type",
+    "color",
+)
+
+# the most recently used SVGs parsed (or loaded from the disk cache) by this process, keyed
+# by their cache key; the least recently used one is evicted beyond MAX_SVG_PROTOTYPES
+MAX_SVG_PROTOTYPES: int = 16
+_svg_prototypes: "OrderedDict[str, VMobject]" = OrderedDict()
+
+# the content hashes of the asset files, keyed by (path, modification time, size)
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def get_file_hash(path: Path) -> str:
+    """
+    Get the content hash of a file, hashing it only once per process while it is unchanged.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The hexadecimal digest of the file's contents.
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        _file_hashes[key] = hash_file(path)
+    return _file_hashes[key]
+
+
+def get_target_size(size: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Get the largest size an image can be shown at with the configured quality. The slides
+    focus the camera on their content, so an image never occupies more pixels than the
+    output's width and height; it is never upsampled either.
+
+    Args:
+        size: The width and height of the source image, in pixels.
+
+    Returns:
+        The width and height to downsample the image to, in pixels.
+    """
+    width, height = size
+    factor = min(1.0, config.pixel_width / width, config.pixel_height / height)
+    return max(1, round(width * factor)), max(1, round(height * factor))
+
+
+def cache_scaled_image(path: Union[str, Path]) -> Tuple[Path, Tuple[int, int]]:
+    """
+    Decode and downsample (see get_target_size) an image into the asset cache, unless it is
+    there already. Only files are read and written, so this can run in a background thread
+    (see SlideShow.prefetch).
+
+    Args:
+        path: The path to the image file.
+
+    Returns:
+        The path to the cached RGBA pixels (a .npy file), and the size of the source image.
+    """
+    path = Path(path)
+    with Image.open(path) as image:  # only reads the header until the pixels are needed
+        source_size = image.size
+        target_size = get_target_size(source_size)
+        key = hashlib.sha256(
+            f"{ASSET_CACHE_VERSION}:{get_file_hash(path)}:{target_size}".encode()
+        ).hexdigest()
+        cache_path = get_cache_dir("images") / f"{key}.npy"
+        if not cache_path.exists():
+            # let JPEG decoding skip straight to a reduced scale that is still large enough
+            image.draft("RGB", target_size)
+            image = image.convert("RGBA")
+            if image.size != target_size:
+                image = image.resize(target_size, Image.Resampling.LANCZOS)
+            # concurrent builds never read a partial file, see atomic_write
+            with atomic_write(cache_path) as file:
+                np.save(file, np.asarray(image))
+    return cache_path, source_size
+
+
+def load_scaled_image(path: Union[str, Path]) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Load the (downsampled, see get_target_size) RGBA pixels of an image from the asset
+    cache, decoding and caching the image first if necessary.
+
+    Args:
+        path: The path to the image file.
+
+    Returns:
+        The pixels, and the size of the source image.
+    """
+    cache_path, source_size = cache_scaled_image(path)
+    # not memory-mapped, as ImageMobject copies the pixels into an array of its own anyway
+    return np.load(cache_path), source_size
+
+
+def load_image_mobject(path: Union[str, Path], **kwargs) -> ImageMobject:
+    """
+    Create an ImageMobject from the asset cache. It has the same size (in scene units) as
+    ImageMobject(path) would have, but holds only as many pixels as can be shown.
+
+    Args:
+        path: The path to the image file (resolved like ImageMobject does, e.g., within the
+            assets directory).
+        **kwargs: Additional keyword arguments for the ImageMobject.
+
+    Returns:
+        The image.
+    """
+    pixels, (_, source_height) = load_scaled_image(get_full_raster_image_path(path))
+    # ImageMobject derives its height from its number of pixels, so the downsampling is
+    # compensated by the resolution it is scaled to
+    scale_to_resolution = QUALITIES[DEFAULT_QUALITY]["pixel_height"]
+    kwargs.setdefault(
+        "scale_to_resolution", scale_to_resolution * pixels.shape[0] / source_height
+    )
+    return ImageMobject(pixels, **kwargs)
+
+
+def serialize_vmobject(m_object: VMobject) -> dict:
+    """
+    Convert a VMobject (and its submobjects) into plain data: its points and style.
+
+    Args:
+        m_object: The VMobject.
+
+    Returns:
+        The data, which can be pickled and turned back into a VMobject with
+        deserialize_vmobject.
+    """
+    return {
+        "points": np.asarray(m_object.points),
+        "style": {
+            attribute: getattr(m_object, attribute)
+            for attribute in SVG_STYLE_ATTRIBUTES
+            if hasattr(m_object, attribute)
+        },
+        "submobjects": [
+            serialize_vmobject(submobject) for submobject in m_object.submobjects
+        ],
+    }
+
+
+def deserialize_vmobject(data: dict) -> VMobject:
+    """
+    Rebuild a VMobject (and its submobjects) from the data given by serialize_vmobject,
+    without parsing the SVG again.
+
+    Args:
+        data: The data.
+
+    Returns:
+        The VMobject.
+    """
+    m_object = VMobject()
+    m_object.points = data["points"]
+    for attribute, value in data["style"].items():
+        setattr(m_object, attribute, value)
+    m_object.add(
+        *[deserialize_vmobject(submobject) for submobject in data["submobjects"]]
+    )
+    return m_object
+
+
+def get_svg_cache_path(path: Path, kwargs: dict) -> Path:
+    """
+    Get the path of an SVG file's entry in the geometry cache (keyed by the file's contents
+    and the SVGMobject options).
+
+    Args:
+        path: The (resolved) path to the SVG file.
+        kwargs: The keyword arguments for the SVGMobject.
+
+    Returns:
+        The path to the cache entry.
+    """
+    key = fingerprint(ASSET_CACHE_VERSION, get_file_hash(path), kwargs)[:32]
+    return get_cache_dir("svg") / f"{key}.pickle"
+
+
+def write_svg_cache(svg_mobject: VMobject, cache_path: Path) -> None:
+    # concurrent builds never read a partial file, see atomic_write
+    with atomic_write(cache_path) as file:
+        pickle.dump(
+            serialize_vmobject(svg_mobject), file, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+
+def read_svg_cache(cache_path: Path) -> Union[None, VMobject]:
+    """
+    Read an SVG's geometry from its entry in the on-disk cache.
+
+    Args:
+        cache_path: The path to the cache entry.
+
+    Returns:
+        The mobject, or None if the entry is missing or cannot be read (e.g., it is
+        truncated or was written by another version).
+    """
+    # the tree is made of many small objects, see BibTexManager.load_cache
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(cache_path, "rb") as file:
+            return deserialize_vmobject(pickle.load(file))
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ):
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def prefetch_svg(path: Union[str, Path], **kwargs) -> Path:
+    """
+    Do the I/O that loading an SVG file needs, ahead of time: resolve and hash the file (the
+    hash is memoized, see get_file_hash), which also locates its entry in the geometry cache.
+    The file is not parsed, as that constructs mobjects; load_svg_mobject does it on the
+    scene's thread if the entry is missing. Hence, this can run in a background thread (see
+    SlideShow.iter_prepared_slides).
+
+    Args:
+        path: The path to the SVG file (resolved like SVGMobject does).
+        **kwargs: Additional keyword arguments for the SVGMobject.
+
+    Returns:
+        The path to the cache entry.
+    """
+    return get_svg_cache_path(get_full_vector_image_path(path), kwargs)
+
+
+def load_svg_mobject(path: Union[str, Path], **kwargs) -> VMobject:
+    """
+    Get a copy of the mobject that SVGMobject(path, **kwargs) would create. The file is only
+    parsed (and its cache entry rewritten) if its geometry is neither in memory nor readable
+    from the on-disk cache (keyed by the file's contents and the SVGMobject options).
+
+    Args:
+        path: The path to the SVG file (resolved like SVGMobject does, e.g., within the
+            assets directory).
+        **kwargs: Additional keyword arguments for the SVGMobject.
+
+    Returns:
+        A copy of the SVG's mobject; its submobjects have the same points and styles as
+        those of the SVGMobject.
+    """
+    path = get_full_vector_image_path(path)
+    cache_path = get_svg_cache_path(path, kwargs)
+    key = cache_path.stem
+    if key in _svg_prototypes:
+        _svg_prototypes.move_to_end(key)
+    else:
+        prototype = read_svg_cache(cache_path)
+        if prototype is None:
+            prototype = SVGMobject(path, **kwargs)
+            write_svg_cache(prototype, cache_path)
+        _svg_prototypes[key] = prototype
+        if len(_svg_prototypes) > MAX_SVG_PROTOTYPES:
+            # evict the least recently used SVG
+            _svg_prototypes.popitem(last=False)
+    return _svg_prototypes[key].copy()
+
+
+def clear_svg_prototypes() -> None:
+    """
+    Forget the SVGs kept in memory by load_svg_mobject (they are loaded from the on-disk
+    cache again when needed).
+    """
+    _svg_prototypes.clear()
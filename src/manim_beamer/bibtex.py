@@ -2,13 +2,286 @@
 Implements the necessary classes and features to process and handle .bib references.
 """
 
+import gc
+import os
+import re
+import math
+import heapq
+import mmap
+import bisect
+import pickle
+import hashlib
+import unicodedata
 from pathlib import Path
-from typing import Union, Tuple, List
-
-from manim import DARK_BLUE
+from collections import defaultdict
+from typing import Union, Tuple, List, Dict, Set, Iterable
 
 import bibtexparser
 from bibtexparser.model import Entry
+from bibtexparser.library import Library
+
+from manim_beamer.cache import atomic_write, get_cache_dir, hash_file
+
+# bump this whenever the contents of the cached (pickled) library change
+CACHE_FORMAT_VERSION: int = 1
+
+# matches the start of a block in a .bib file, e.g., "@article{key," or "@string{"
+BLOCK_HEADER_PATTERN = re.compile(
+    rb"^[ \t]*@[ \t]*([A-Za-z]+)[ \t]*[{(][ \t]*([^,\s{}()]*)", re.MULTILINE
+)
+
+# matches a word (letters and digits) of a normalized title or name
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# matches a LaTeX accent command, e.g., \\" in {\\"o}
+LATEX_ACCENT_PATTERN = re.compile(r"\\[^A-Za-z\s]")
+
+# matches a four-digit year within the year field of an entry, e.g., "2020" in "{2020}"
+YEAR_PATTERN = re.compile(r"\d{4}")
+
+
+def normalize_words(text: str) -> List[str]:
+    """
+    Split a title or name into normalized words: lowercase, without accents, braces or
+    punctuation, so that, e.g., "{G}{\\\"o}del's" and "Godel s" give the same words.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The words.
+    """
+    text = LATEX_ACCENT_PATTERN.sub("", text.lower())
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return WORD_PATTERN.findall(text.replace("{", "").replace("}", ""))
+
+
+def get_trigrams(key: str) -> Set[str]:
+    """
+    Get the trigrams (three-character substrings) of a key, padded so that its first and last
+    characters are weighted like the others.
+
+    Args:
+        key: The key.
+
+    Returns:
+        The trigrams of the lowercase key.
+    """
+    padded = f"  {key.lower()} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+class BibTexIndex:
+    """
+    The BibTexIndex is an in-memory inverted index over the entries of a library: it maps the
+    normalized words of the titles, the words of the authors' last names and the years to the
+    keys of the entries, and it keeps the keys sorted (for prefix matches) and indexed by their
+    trigrams (for fuzzy matches). Queries then only touch the matching keys.
+    """
+
+    def __init__(
+        self, entries_by_key: Dict[str, Entry], author_last_names: Dict[str, List[str]]
+    ):
+        """
+        Build the index.
+
+        Args:
+            entries_by_key: The entries, keyed by their key.
+            author_last_names: The normalized last names of each entry's authors.
+        """
+        title_words: Dict[str, Set[str]] = defaultdict(set)
+        author_words: Dict[str, Set[str]] = defaultdict(set)
+        keys_by_year: Dict[int, Set[str]] = defaultdict(set)
+        trigrams: Dict[str, Set[str]] = defaultdict(set)
+        # the same last names recur throughout a bibliography, so they are normalized once
+        last_name_words: Dict[str, List[str]] = {}
+        # the index is made of many small objects, see load_cache
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for key, entry in entries_by_key.items():
+                fields = {field.key: field.value for field in entry.fields}
+                if "title" in fields:
+                    for word in normalize_words(fields["title"]):
+                        title_words[word].add(key)
+                for last_name in author_last_names.get(key, []):
+                    if last_name not in last_name_words:
+                        last_name_words[last_name] = normalize_words(last_name)
+                    for word in last_name_words[last_name]:
+                        author_words[word].add(key)
+                if "year" in fields:
+                    match = YEAR_PATTERN.search(str(fields["year"]))
+                    if match is not None:
+                        keys_by_year[int(match.group())].add(key)
+                for trigram in get_trigrams(key):
+                    trigrams[trigram].add(key)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self.title_words: Dict[str, Set[str]] = dict(title_words)
+        self.author_words: Dict[str, Set[str]] = dict(author_words)
+        self.keys_by_year: Dict[int, Set[str]] = dict(keys_by_year)
+        self.trigrams: Dict[str, Set[str]] = dict(trigrams)
+        self.sorted_lowercase_keys: List[str] = sorted(
+            key.lower() for key in entries_by_key
+        )
+        self.keys_by_lowercase_key: Dict[str, List[str]] = {}
+        for key in entries_by_key:
+            self.keys_by_lowercase_key.setdefault(key.lower(), []).append(key)
+        self.sorted_years: List[int] = sorted(self.keys_by_year)
+        self.sorted_title_words: List[str] = sorted(self.title_words)
+
+    @staticmethod
+    def intersect(sets: Iterable[Set[str]]) -> Set[str]:
+        """
+        Intersect sets of keys, starting from the smallest one.
+
+        Args:
+            sets: The sets of keys.
+
+        Returns:
+            The keys that are in every set (or no keys, if no sets are given).
+        """
+        sets = sorted(sets, key=len)
+        if len(sets) == 0:
+            return set()
+        result = set(sets[0])
+        for other in sets[1:]:
+            result &= other
+        return result
+
+    def find_by_author(self, name: str) -> Set[str]:
+        """
+        Find the entries with an author whose last name contains all the words of the given
+        name, e.g., "van der Berg" or "berg".
+
+        Args:
+            name: The (last) name of the author.
+
+        Returns:
+            The keys of the entries.
+        """
+        words = normalize_words(name)
+        return self.intersect(self.author_words.get(word, set()) for word in words)
+
+    def find_by_year(self, start: int, end: Union[None, int] = None) -> Set[str]:
+        """
+        Find the entries published within a range of years.
+
+        Args:
+            start: The first year of the range.
+            end: The last year of the range (inclusive); if None, only the first year.
+
+        Returns:
+            The keys of the entries.
+        """
+        if end is None:
+            end = start
+        first = bisect.bisect_left(self.sorted_years, start)
+        last = bisect.bisect_right(self.sorted_years, end)
+        keys: Set[str] = set()
+        for year in self.sorted_years[first:last]:
+            keys |= self.keys_by_year[year]
+        return keys
+
+    def find_by_title(self, keywords: str, prefix: bool = False) -> Set[str]:
+        """
+        Find the entries whose title contains all the given keywords.
+
+        Args:
+            keywords: The keywords, e.g., "fuzzy reinforcement".
+            prefix: Whether the last keyword may be the beginning of a word (e.g., while the
+                keywords are being typed).
+
+        Returns:
+            The keys of the entries.
+        """
+        words = normalize_words(keywords)
+        if len(words) == 0:
+            return set()
+        sets = [self.title_words.get(word, set()) for word in words[:-1]]
+        if prefix:
+            last_word_keys: Set[str] = set()
+            for word in self.find_prefix(self.sorted_title_words, words[-1]):
+                last_word_keys |= self.title_words[word]
+            sets.append(last_word_keys)
+        else:
+            sets.append(self.title_words.get(words[-1], set()))
+        return self.intersect(sets)
+
+    @staticmethod
+    def find_prefix(sorted_strings: List[str], prefix: str) -> List[str]:
+        """
+        Find the strings that start with a prefix in a sorted list, with a binary search.
+
+        Args:
+            sorted_strings: The sorted strings.
+            prefix: The prefix.
+
+        Returns:
+            The matching strings, in sorted order.
+        """
+        first = bisect.bisect_left(sorted_strings, prefix)
+        last = bisect.bisect_left(sorted_strings, prefix + "\U0010ffff")
+        return sorted_strings[first:last]
+
+    def find_by_key_prefix(self, prefix: str) -> List[str]:
+        """
+        Find the keys that start with a prefix (ignoring the case).
+
+        Args:
+            prefix: The prefix, e.g., "smith20".
+
+        Returns:
+            The matching keys, sorted (case-insensitively).
+        """
+        return [
+            key
+            for lowercase_key in self.find_prefix(
+                self.sorted_lowercase_keys, prefix.lower()
+            )
+            for key in self.keys_by_lowercase_key[lowercase_key]
+        ]
+
+    def find_similar_keys(
+        self, key: str, limit: int = 5, cutoff: float = 0.3
+    ) -> List[str]:
+        """
+        Find the keys that are most similar to a (possibly misspelled) key, by the overlap of
+        their trigrams (i.e., their Jaccard similarity).
+
+        A key with a similarity of at least the cutoff shares at least
+        ceil(cutoff * len(trigrams)) trigrams with the query, so it necessarily contains one of
+        the query's rarest len(trigrams) - ceil(cutoff * len(trigrams)) + 1 trigrams; only the
+        keys of those (short) posting lists are scored.
+
+        Args:
+            key: The key.
+            limit: The maximum number of keys to return.
+            cutoff: The minimum similarity (between 0 and 1) of the keys to return.
+
+        Returns:
+            The similar keys, the most similar first.
+        """
+        trigrams = get_trigrams(key)
+        min_overlap = max(1, math.ceil(cutoff * len(trigrams)))
+        rarest = sorted(
+            trigrams, key=lambda trigram: len(self.trigrams.get(trigram, ()))
+        )
+        candidates: Set[str] = set()
+        for trigram in rarest[: len(trigrams) - min_overlap + 1]:
+            candidates |= self.trigrams.get(trigram, set())
+        scored: List[Tuple[float, str]] = []
+        for candidate in candidates:
+            candidate_trigrams = get_trigrams(candidate)
+            similarity = len(trigrams & candidate_trigrams) / len(
+                trigrams | candidate_trigrams
+            )
+            if similarity >= cutoff:
+                scored.append((-similarity, candidate))
+        return [candidate for _, candidate in heapq.nsmallest(limit, scored)]
 
 
 class BibTexManager:
@@ -17,15 +290,121 @@ class BibTexManager:
     stored in a .bib file.
     """
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, use_cache: bool = True, lazy: bool = False):
         """
         Given the path to a .bib file containing the references, an instance of this class will be
         created to efficiently manage and query it.
+
+        The parsed library is cached on disk (see manim_beamer.cache.get_cache_dir) and reused
+        as long as the .bib file's modification time or contents are unchanged, so that warm
+        starts skip parsing entirely.
+
+        In lazy mode, only the byte offsets of the entries' headers (e.g., "@article{key,") are
+        indexed over a memory-mapped file, and an entry is parsed (with the same middleware
+        layers) the first time it is looked up. Most decks only cite a few dozen entries of a
+        large bibliography, so the load time then depends on the number of cited entries
+        rather than on the size of the .bib file. Accessing the library attribute still parses
+        the whole file.
+
+        Args:
+            path: The path to the .bib file.
+            use_cache: Whether to read and write the on-disk cache of the parsed library.
+            lazy: Whether to parse the entries on demand instead of all at once.
         """
-        self.path: Path = path
+        self.path: Path = Path(path)
+        self.use_cache: bool = use_cache
+        self.lazy: bool = lazy
+        self._library: Union[None, Library] = None
+        # the index to look up entries by their key; the first entry wins in case of duplicates
+        self.entries_by_key: Dict[str, Entry] = {}
+        # the normalized (i.e., no braces) last names of each entry's authors
+        self.author_last_names: Dict[str, List[str]] = {}
+        # the short citation string (see cite_short_entry) of each entry, if it has one
+        self.short_cites: Dict[str, str] = {}
+        # the keys cited with slide_short_cite, in the order of their first citation
+        self.cited_keys: Dict[str, None] = {}
+        # the inverted index for queries, built on first use (see the index property)
+        self._index: Union[None, BibTexIndex] = None
+
+        # lazy mode only: the (start, end) byte offsets of each entry within the .bib file,
+        # and the @string definitions that entries may refer to
+        self.entry_offsets: Dict[str, Tuple[int, int]] = {}
+        self.string_definitions: bytes = b""
+        self._mmap: Union[None, mmap.mmap, bytes] = None
+
+        if self.lazy:
+            self.build_offset_index()
+        else:
+            self.load_library()
 
+    def __getitem__(self, item: str):
+        return self.get_entry_by_key(item)
+
+    @property
+    def library(self) -> Library:
+        """
+        The parsed library. In lazy mode, the whole .bib file is parsed on first access.
+        """
+        if self._library is None:
+            self.load_library()
+        return self._library
+
+    @property
+    def index(self) -> BibTexIndex:
+        """
+        The inverted index over the library, built on first access. In lazy mode, this parses
+        the whole .bib file (see the library property).
+        """
+        if self._index is None:
+            if self._library is None:
+                self.load_library()  # lazy mode: every entry must be indexed by its key
+            self._index = BibTexIndex(self.entries_by_key, self.author_last_names)
+        return self._index
+
+    def search(
+        self,
+        author: Union[None, str] = None,
+        years: Union[None, int, Tuple[int, int]] = None,
+        title: Union[None, str] = None,
+        key: Union[None, str] = None,
+        prefix: bool = False,
+    ) -> List[str]:
+        """
+        Find the entries that match all the given criteria (see BibTexIndex), e.g., to
+        suggest citations while a deck is being written.
+
+        Args:
+            author: The (last) name of an author.
+            years: A year, or a range of years (first and last, inclusive).
+            title: Keywords that the title must contain.
+            key: The beginning of the key.
+            prefix: Whether the last title keyword may be the beginning of a word.
+
+        Returns:
+            The keys of the matching entries, sorted; no keys if no criteria are given.
+        """
+        sets: List[Set[str]] = []
+        if author is not None:
+            sets.append(self.index.find_by_author(author))
+        if years is not None:
+            start, end = (years, years) if isinstance(years, int) else years
+            sets.append(self.index.find_by_year(start, end))
+        if title is not None:
+            sets.append(self.index.find_by_title(title, prefix=prefix))
+        if key is not None:
+            sets.append(set(self.index.find_by_key_prefix(key)))
+        return sorted(BibTexIndex.intersect(sets))
+
+    @staticmethod
+    def get_middleware_layers() -> list:
+        """
+        Get the middleware layers that are appended to bibtexparser's default parse stack.
+
+        Returns:
+            The middleware layers.
+        """
         # We want to add three new middleware layers to our parse stack:
-        layers = [
+        return [
             bibtexparser.middlewares.MonthIntMiddleware(),
             # Months should be represented as int (0-12)
             bibtexparser.middlewares.SeparateCoAuthors(),  # Co-authors should be separated
@@ -33,10 +412,188 @@ class BibTexManager:
             # Names should be split into first, von, last, jr parts
         ]
 
-        self.library = bibtexparser.parse_file(str(self.path), append_middleware=layers)
+    def parse(self) -> Library:
+        """
+        Parse the .bib file with the middleware layers this class relies on.
 
-    def __getitem__(self, item: str):
-        return self.get_entry_by_key(item)
+        Returns:
+            The parsed library.
+        """
+        return bibtexparser.parse_file(
+            str(self.path), append_middleware=self.get_middleware_layers()
+        )
+
+    def load_library(self) -> None:
+        """
+        Load the whole library (from the on-disk cache, if allowed and valid) and index it.
+        """
+        if self.use_cache:
+            self.load_cache()
+        if self._library is None:
+            self._library = self.parse()
+            self.precompute()
+            if self.use_cache:
+                self.save_cache()
+
+        self.entries_by_key = {}
+        for entry in self._library.entries:
+            self.entries_by_key.setdefault(entry.key, entry)
+
+    def build_offset_index(self) -> None:
+        """
+        Index the byte offsets of the entries' headers (e.g., "@article{key,") in the
+        memory-mapped .bib file, without parsing the entries themselves. An entry is assumed
+        to extend until the next line that starts a new block (i.e., with "@").
+        """
+        with open(self.path, "rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file cannot be memory-mapped
+                self._mmap = b""
+
+        headers = [
+            (match.start(), match.group(1).decode().lower(), match.group(2).decode())
+            for match in BLOCK_HEADER_PATTERN.finditer(self._mmap)
+        ]
+        string_definitions: List[bytes] = []
+        for index, (start, block_type, key) in enumerate(headers):
+            end = headers[index + 1][0] if index + 1 < len(headers) else len(self._mmap)
+            if block_type == "string":
+                string_definitions.append(self._mmap[start:end])
+            elif block_type not in ("comment", "preamble"):
+                self.entry_offsets.setdefault(key, (start, end))
+        self.string_definitions = b"".join(string_definitions)
+
+    def parse_entry(self, key: str) -> Union[None, Entry]:
+        """
+        Parse a single entry of the memory-mapped .bib file (lazy mode only).
+
+        Args:
+            key: The key of the entry to parse.
+
+        Returns:
+            The parsed entry, or None if the key is not in the .bib file.
+        """
+        if key not in self.entry_offsets:
+            return None
+        start, end = self.entry_offsets[key]
+        library = bibtexparser.parse_string(
+            (self.string_definitions + self._mmap[start:end]).decode("utf-8"),
+            append_middleware=self.get_middleware_layers(),
+        )
+        if len(library.entries) == 0:
+            return None
+        entry = library.entries[0]
+        self.entries_by_key[key] = entry
+        self.precompute_entry(entry)
+        return entry
+
+    def precompute(self) -> None:
+        """
+        Precompute the normalized author last names and the short citation string of every
+        entry in the library, so they are stored along with the (cached) library.
+        """
+        self.author_last_names, self.short_cites = {}, {}
+        seen_keys = set()
+        for entry in self._library.entries:
+            if entry.key in seen_keys:
+                continue  # duplicate key; only the first entry is ever looked up
+            seen_keys.add(entry.key)
+            self.precompute_entry(entry)
+
+    def precompute_entry(self, entry: Entry) -> None:
+        """
+        Precompute the normalized author last names and the short citation string of an entry.
+
+        Args:
+            entry: The bibtex entry.
+        """
+        if "author" in entry and isinstance(entry["author"], list):
+            self.author_last_names[entry.key] = [
+                " ".join(name_parts.last).replace("{", "").replace("}", "")
+                for name_parts in entry["author"]
+            ]
+        try:
+            self.short_cites[entry.key] = self.cite_short_entry(entry)
+        except (KeyError, IndexError, AttributeError):
+            pass  # e.g., no author or year; cite_short_entry will complain if used
+
+    @property
+    def cache_path(self) -> Path:
+        """
+        The path to the on-disk cache of this .bib file's parsed library.
+        """
+        path_digest = hashlib.sha256(str(self.path.resolve()).encode()).hexdigest()
+        return get_cache_dir("bibtex") / f"{path_digest[:16]}.pickle"
+
+    def load_cache(self) -> bool:
+        """
+        Load the parsed library from the on-disk cache if it is still valid. The cache is valid
+        if the .bib file's modification time is unchanged or, failing that, if its contents
+        still hash to the same value.
+
+        Returns:
+            True if the library was loaded from the cache, otherwise False.
+        """
+        # the library is made of many small objects; the cyclic garbage collector would
+        # otherwise repeatedly (and needlessly) traverse them while they are unpickled
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(self.cache_path, "rb") as file:
+                cached = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != CACHE_FORMAT_VERSION
+        ):
+            return False
+
+        mtime_ns: int = os.stat(self.path).st_mtime_ns
+        if cached["mtime_ns"] != mtime_ns:
+            if cached["sha256"] != hash_file(self.path):
+                return False
+            # the file was touched but not modified; remember its new modification time
+            cached["mtime_ns"] = mtime_ns
+            self.write_cache(cached)
+
+        self._library = cached["library"]
+        self.author_last_names = cached["author_last_names"]
+        self.short_cites = cached["short_cites"]
+        return True
+
+    def save_cache(self) -> None:
+        """
+        Save the parsed library (and the precomputed values) to the on-disk cache.
+        """
+        self.write_cache(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "mtime_ns": os.stat(self.path).st_mtime_ns,
+                "sha256": hash_file(self.path),
+                "library": self._library,
+                "author_last_names": self.author_last_names,
+                "short_cites": self.short_cites,
+            }
+        )
+
+    def write_cache(self, cached: dict) -> None:
+        """
+        Atomically write the given contents to the on-disk cache.
+
+        Args:
+            cached: The contents of the cache.
+        """
+        try:
+            # concurrent writers never read a partial file, see atomic_write
+            with atomic_write(self.cache_path) as file:
+                pickle.dump(cached, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # the cache is only an optimization, so failing to write it is not an error
 
     def get_entry_by_key(self, key: str) -> Union[None, Entry]:
         """
@@ -48,10 +605,10 @@ class BibTexManager:
         Returns:
             The entry if found, otherwise None.
         """
-        for entry in self.library.entries:
-            if entry.key == key:
-                return entry
-        return None
+        entry = self.entries_by_key.get(key, None)
+        if entry is None and self._library is None:
+            entry = self.parse_entry(key)  # lazy mode
+        return entry
 
     @staticmethod
     def get_author_last_names_only(entry: Entry) -> str:
@@ -109,21 +666,35 @@ class BibTexManager:
         return wrapped_text
 
     @staticmethod
-    def cite_entry(entry: Entry, num_of_words: int = 6) -> str:
+    def cite_entry(
+        entry: Entry,
+        num_of_words: int = 6,
+        max_width: Union[None, float] = None,
+        font_size: float = 48.0,
+    ) -> str:
         """
         Convert a bibtex entry to a citation string.
 
         Args:
             entry: The bibtex entry.
-            num_of_words: The number of words to wrap by.
+            num_of_words: The number of words to wrap by (if no max_width is given).
+            max_width: The maximum width of a line of the citation when it is shown as a Text
+                (see manim_beamer.text_metrics); if None, the title is wrapped by word count.
+            font_size: The font size of the Text (if a max_width is given).
 
         Returns:
             The citation string for the entry. Format is "Author et al. (Year)".
         """
+        if max_width is not None:
+            # imported here so that manim is only loaded if needed
+            from manim_beamer.text_metrics import text_metrics
+
+            citation = BibTexManager.cite_entry(entry, num_of_words=0)
+            return text_metrics.wrap(citation, max_width, font_size=font_size)
         # cite the paper as "Paper title (Author et al., Year)"
-        title = BibTexManager.wrap_by_word(
-            entry["title"].replace("{", "").replace("}", ""), num_of_words=num_of_words
-        )
+        title = entry["title"].replace("{", "").replace("}", "")
+        if num_of_words > 0:
+            title = BibTexManager.wrap_by_word(title, num_of_words=num_of_words)
         if "year" not in entry:
             return f"{title} ({BibTexManager.get_author_last_names_only(entry)})"
         return f"{title} ({BibTexManager.get_author_last_names_only(entry)}, {entry['year']})"
@@ -142,4 +713,64 @@ class BibTexManager:
         Returns:
             The citation string for the entry. Format is "[Author et al., Year]".
         """
-        return self.cite_short_entry(self[key]), DARK_BLUE, item_marker_opacity
+        short_cite = self.short_cites.get(key, None)
+        if short_cite is None:
+            short_cite = self.cite_short_entry(self[key])
+        self.cited_keys[key] = None  # for the bibliography, see get_cited_keys
+        # imported here so that manim is only loaded if needed
+        from manim_beamer.theme import get_theme
+
+        return short_cite, get_theme().citation, item_marker_opacity
+
+    def get_cited_keys(self) -> List[str]:
+        """
+        Get the (distinct) keys cited with slide_short_cite so far, sorted like a
+        bibliography: by the last names of the authors, then by year and title.
+
+        Returns:
+            The sorted keys.
+        """
+
+        def sort_key(key: str) -> tuple:
+            entry = self[key]
+            last_names = [name.lower() for name in self.author_last_names.get(key, [])]
+            year = str(entry["year"]) if "year" in entry else ""
+            title = entry["title"].lower() if "title" in entry else ""
+            return last_names, year, title, key
+
+        return sorted(self.cited_keys, key=sort_key)
+
+    def get_references(
+        self,
+        num_of_words: int = 6,
+        max_width: Union[None, float] = None,
+        font_size: float = 48.0,
+    ) -> List[str]:
+        """
+        Get the bibliography of the keys cited so far (see get_cited_keys), with one
+        (wrapped) citation string per entry (see cite_entry).
+
+        Args:
+            num_of_words: The number of words to wrap the titles by (if no max_width is
+                given).
+            max_width: The maximum width of a line of a citation, see cite_entry.
+            font_size: The font size of the citations (if a max_width is given).
+
+        Returns:
+            The citation strings, without trailing newlines.
+        """
+        references: List[str] = []
+        for key in self.get_cited_keys():
+            entry = self[key]
+            try:
+                reference = self.cite_entry(
+                    entry,
+                    num_of_words=num_of_words,
+                    max_width=max_width,
+                    font_size=font_size,
+                )
+            except (KeyError, IndexError, AttributeError):
+                reference = self.short_cites.get(key, key)  # e.g., no title
+            # keep the authors and year on the last line of the (wrapped) title
+            references.append(reference.replace("\n (", " (").rstrip("\n"))
+        return references
@@ -1,28 +1,22 @@
-from typing import Union
+from typing import Union, Dict
 from abc import abstractmethod
 
 from manim import (
-    WHITE,
-    BLACK,
     DOWN,
     LEFT,
     VGroup,
     SurroundingRectangle,
     LaggedStart,
     Create,
-    Text,
     ManimColor,
     Title,
-    config,
 )
 
 from manim_beamer.lists import BeamerList
-
-config.background_color = WHITE
-light_theme_style = {
-    "fill_color": BLACK,
-    "background_stroke_color": WHITE,
-}
+from manim_beamer.theme import Theme, get_theme
+from manim_beamer.text_factory import text_factory
+from manim_beamer.text_metrics import text_metrics
+from manim_beamer.tracing import traced
 
 
 class BlockTitle(Title):
@@ -39,7 +33,20 @@ class BlockTitle(Title):
 
 
 class Block:
-    def __init__(self, title: Union[None, str], content: Union[str, BeamerList]):
+    def __init__(
+        self,
+        title: Union[None, str],
+        content: Union[str, BeamerList],
+        max_width: Union[None, float] = None,
+    ):
+        """
+        Args:
+            title: The title of the block, if any.
+            content: The content of the block: a string (shown as a Text) or a BeamerList.
+            max_width: The maximum width of a line of string content (before the block is
+                scaled); the string is wrapped to it (see manim_beamer.text_metrics). If None,
+                the string is shown as is.
+        """
         if title is None or isinstance(title, str):
             # automatically convert the str title to a RemarkTitle object
             self.title_str: Union[None, str] = title
@@ -49,11 +56,14 @@ class Block:
             ), "The argument 'title' must be a 'string' or a 'Title' object"
 
         self.content = content
+        self.max_width: Union[None, float] = max_width
         if isinstance(content, str):
-            # automatically convert the str content to a Text object
-            self.content = Text(
-                content, font="TeX Gyre Termes", color=BLACK, font_size=30
-            )
+            # the str content is converted to a Text object by make_layout, in the theme
+            # that is current then (like the title and the background)
+            if max_width is not None:
+                self.content = text_metrics.wrap(
+                    content, max_width, font_size=30, font="TeX Gyre Termes"
+                )
         elif isinstance(content, BeamerList):
             self.update_beamer_list_color(content)
 
@@ -63,6 +73,8 @@ class Block:
         self.title = None
         self.text_group = None
         self.block_background = None
+        # the block's (background, text group) at each scale factor, see get_layout
+        self._layouts: Dict[float, VGroup] = {}
 
         # some settings to control the amount of buffer between the elements
         self.title_header_buff = 0.5
@@ -83,122 +95,209 @@ class Block:
                 item.list_color = self.get_foreground_color()
                 self.update_beamer_list_color(item)
 
-    def update_position_and_scale(self, scale_factor: float) -> None:
-        if (
-            self.title is None
-            and self.text_group is None
-            and self.block_background is None
-        ):
-            if self.title_str is not None:
-                self.title = BlockTitle(
-                    self.title_str,
-                    underline_color=self.get_foreground_color(),
-                    underline_thickness=4.0 * scale_factor,
-                    color=ManimColor(self.get_foreground_color()),
-                    underline_buff=0.1,
-                )
+    def get_fingerprint_inputs(self) -> tuple:
+        """
+        Get the inputs that determine how the block is drawn (see manim_beamer.fingerprint).
+
+        Returns:
+            The inputs of the block.
+        """
+        return (
+            type(self).__name__,
+            self.title_str,
+            self.content,
+            self.get_foreground_color(),
+            self.get_background_color(),
+            self.title_header_buff,
+            self.content_block_buff,
+        )
 
-            content = self.content
-            if isinstance(self.content, BeamerList):
-                content = self.content.get_list(scale_factor=scale_factor)
-
-            if self.title is not None:
-                content.next_to(self.title, (DOWN * scale_factor))
-                self.text_group = VGroup(self.title, content)
-            else:
-                self.text_group = VGroup(content)
-            # left align the title and content
-            self.text_group.arrange((DOWN * scale_factor), aligned_edge=LEFT, buff=0.25)
-            # create a surrounding rectangle around the title and content
-            self.block_background = SurroundingRectangle(
-                self.text_group,
+    def add_tex_expressions(self, tex_batch) -> None:
+        """
+        Add the MathTex/Tex expressions of the block (i.e., its title, which is typeset with
+        LaTeX, and its content) to a TexBatch.
+
+        Args:
+            tex_batch: The manim_beamer.latex.TexBatch to add the expressions to.
+        """
+        if self.title_str is not None:
+            tex_batch.add_tex(self.title_str)
+        if isinstance(self.content, BeamerList):
+            self.content.add_tex_expressions(tex_batch)
+        elif not isinstance(self.content, str):
+            tex_batch.add_mobject(self.content)
+
+    def make_layout(self, scale_factor: float) -> VGroup:
+        """
+        Construct the block's background and text group at the given scale (the thickness of
+        the title's underline and of the background's outline depend on it).
+
+        Args:
+            scale_factor: The scale factor of the block.
+
+        Returns:
+            The block background and the text group (title - if any - and content).
+        """
+        title = None
+        if self.title_str is not None:
+            title = BlockTitle(
+                self.title_str,
+                underline_color=self.get_foreground_color(),
+                underline_thickness=4.0 * scale_factor,
                 color=ManimColor(self.get_foreground_color()),
-                fill_color=ManimColor(self.get_background_color()),
-                fill_opacity=1,
-                corner_radius=0.25,
-                stroke_width=4.0 * scale_factor,
-                buff=0.1,  # controls the top and bottom buffer
-            ).scale(
-                1.025
-            )  # controls the left and right buffer
+                underline_buff=0.1,
+            )
+
+        if isinstance(self.content, BeamerList):
+            # in case the theme changed since the block was created
+            self.update_beamer_list_color(self.content)
+            content = self.content.get_list(scale_factor=scale_factor)
+        elif isinstance(self.content, str):
+            # automatically convert the str content to a Text object
+            content = text_factory.text(
+                self.content,
+                font="TeX Gyre Termes",
+                color=get_theme().foreground,
+                font_size=30,
+            )
+        else:
+            content = self.content.copy()  # the layouts of other scales use it too
+
+        if title is not None:
+            content.next_to(title, (DOWN * scale_factor))
+            text_group = VGroup(title, content)
+        else:
+            text_group = VGroup(content)
+        # left align the title and content
+        text_group.arrange((DOWN * scale_factor), aligned_edge=LEFT, buff=0.25)
+        # create a surrounding rectangle around the title and content
+        block_background = SurroundingRectangle(
+            text_group,
+            color=ManimColor(self.get_foreground_color()),
+            fill_color=ManimColor(self.get_background_color()),
+            fill_opacity=1,
+            corner_radius=0.25,
+            stroke_width=4.0 * scale_factor,
+            buff=0.1,  # controls the top and bottom buffer
+        ).scale(
+            1.025
+        )  # controls the left and right buffer
+        # both share the same center, so this is the same as scaling each of them
+        return VGroup(block_background, text_group).scale(scale_factor)
+
+    def get_layout(self, scale_factor: float) -> VGroup:
+        """
+        Get a copy of the block's layout at the given scale (see make_layout). The layout of
+        each scale is only constructed once and is never modified, so drawing the block
+        again (at any scale it was drawn at before) only costs a copy.
+
+        Args:
+            scale_factor: The scale factor of the block.
+
+        Returns:
+            The block background and the text group, centered where they were constructed.
+        """
+        if scale_factor not in self._layouts:
+            self._layouts[scale_factor] = self.make_layout(scale_factor)
+        return self._layouts[scale_factor].copy()
+
+    @traced()
+    def update_position_and_scale(self, scale_factor: float) -> None:
+        """
+        Set the block's title, text group and background to a fresh copy of its layout at
+        the given scale (see get_layout).
+
+        Args:
+            scale_factor: The scale factor of the block.
+        """
+        self.block_background, self.text_group = self.get_layout(scale_factor)
+        self.title = self.text_group[0] if self.title_str is not None else None
+
+    def recolor(self, theme: Theme, source: Theme) -> None:
+        """
+        Switch the block's content and its memoized layouts from the source theme to another
+        theme in place (see Theme.recolor), without laying them out again.
+
+        Args:
+            theme: The theme to switch to.
+            source: The theme the block was constructed with.
+        """
+        m_objects = list(self._layouts.values())
+        if not isinstance(self.content, (str, BeamerList)):
+            m_objects.append(self.content)
+        for m_object in m_objects:
+            theme.recolor(m_object, source)
+
+    def release(self) -> None:
+        """
+        Forget the block's memoized layouts and its title, text group and background (e.g.,
+        once it has been drawn); they are constructed again if the block is drawn again.
+        """
+        self._layouts = {}
+        self.title = self.text_group = self.block_background = None
 
     def get_vgroup(self) -> VGroup:
         return VGroup(self.block_background, self.text_group)
 
+    @traced()
     def get_animation(
         self, scale_factor: float, below=None, animate=True
     ) -> Union[LaggedStart, VGroup]:
+        """
+        Position a copy of the block's layout at the given scale (see get_layout) beneath
+        another block or mobject, if any. The copy also becomes the block's title, text group
+        and background, so that another block can be placed below this one.
+
+        Args:
+            scale_factor: The scale factor of the block.
+            below: The Block or mobject to place the block beneath, if any.
+            animate: Whether to return the animation that creates the block, or the block.
+
+        Returns:
+            The animation that creates the block, or its background and text group.
+        """
         title_header_buff = self.title_header_buff  # * scale_factor
         content_block_buff = self.content_block_buff  # * scale_factor
         self.update_position_and_scale(scale_factor)
+        block_background, text_group = self.block_background, self.text_group
 
-        if below is None:
-            block_background = self.block_background.scale(scale_factor)
-            text_group = self.text_group.scale(scale_factor)
-            if animate:
-                return LaggedStart(
-                    Create(block_background),
-                    Create(text_group),
-                )
-            else:
-                return VGroup(block_background, text_group)
-        # scale the block FIRST before positioning it below the previous block
-        # otherwise it will not be positioned correctly
-        elif isinstance(below, Block):
-            block_background = self.block_background.scale(scale_factor).next_to(
-                below.block_background,
-                (DOWN * scale_factor),
-                buff=title_header_buff,
-            )
-            text_group = self.text_group.scale(scale_factor).next_to(
-                below.block_background,
-                (DOWN * scale_factor),
-                buff=content_block_buff,
-            )
-            if animate:
-                return LaggedStart(
-                    Create(block_background),
-                    Create(text_group),
-                )
-            else:
-                return VGroup(block_background, text_group)
-        else:  # e.g. isinstance(below, Text)
-            block_background = self.block_background.scale(scale_factor).next_to(
+        if below is not None:
+            if isinstance(below, Block):
+                below = below.block_background
+            # e.g., a Text, or the background of the previous block
+            block_background.next_to(
                 below, (DOWN * scale_factor), buff=title_header_buff
             )
-            text_group = self.text_group.scale(scale_factor).next_to(
-                below, (DOWN * scale_factor), buff=content_block_buff
+            text_group.next_to(below, (DOWN * scale_factor), buff=content_block_buff)
+        if animate:
+            return LaggedStart(
+                Create(block_background),
+                Create(text_group),
             )
-            if animate:
-                return LaggedStart(
-                    Create(block_background),
-                    Create(text_group),
-                )
-            else:
-                return VGroup(block_background, text_group)
+        return VGroup(block_background, text_group)
 
 
 class RemarkBlock(Block):
     def get_foreground_color(self) -> str:
-        return "#bf0040"
+        return get_theme().remark_block[0]
 
     def get_background_color(self) -> str:
-        return "#f9e6ec"
+        return get_theme().remark_block[1]
 
 
 class ExampleBlock(Block):
     def get_foreground_color(self) -> str:
-        return "#007f5f"
+        return get_theme().example_block[0]
 
     def get_background_color(self) -> str:
-        return "#e5f9f6"
+        return get_theme().example_block[1]
 
 
 class AlertBlock(Block):
     def get_foreground_color(self) -> str:
-        # return "#ffa600"  # orange yellow
-        return "#ff0f20"
+        # e.g., "#ffa600" for an orange yellow (see the light theme)
+        return get_theme().alert_block[0]
 
     def get_background_color(self) -> str:
-        # return "#fff2e6"  # orange yellow
-        return "#ffe6e6"
+        # e.g., "#fff2e6" for an orange yellow (see the light theme)
+        return get_theme().alert_block[1]
@@ -0,0 +1,270 @@
+"""
+Implements parallel builds of a SlideShow: every slide is rendered by a separate worker process,
+and the partial presentations are then stitched into a single manim-slides presentation that
+matches a serial build (i.e., SlideShow.render).
+
+Builds are incremental: the rendered presentation of every slide is kept, keyed by the slide's
+fingerprint, so that rebuilding a deck only renders the slides that have changed.
+"""
+
+import shutil
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, Callable, Iterable, List, Type
+
+from manim import Scene, config, logger, tempconfig
+from manim_slides.config import PresentationConfig, SlideConfig
+from manim_slides.utils import (
+    concatenate_video_files,
+    merge_basenames,
+    reverse_video_file,
+)
+
+from manim_beamer.slides import SlideShow, make_slide
+from manim_beamer.fingerprint import fingerprint
+
+# the config options that the worker processes inherit from the calling process
+INHERITED_CONFIG_KEYS = (
+    "pixel_width",
+    "pixel_height",
+    "frame_rate",
+    "frame_width",
+    "frame_height",
+    "background_color",
+    "disable_caching",
+    "max_files_cached",
+)
+
+
+def render_slide(
+    deck: Callable[[], Iterable],
+    index: int,
+    build_folder: Path,
+    slide_show_class: Type[SlideShow],
+    config_overrides: dict,
+    slide_show_kwargs: dict,
+) -> Path:
+    """
+    Render a single slide of the deck as a one-slide SlideShow (this runs in a worker process).
+
+    Args:
+        deck: A picklable callable (e.g., a module-level function) that returns the slide
+            specs (see SlideSpec).
+        index: The index of the slide to render.
+        build_folder: The folder to write the slide's media and presentation to.
+        slide_show_class: The SlideShow (sub)class to render the slide with.
+        config_overrides: The manim config options to render with.
+        slide_show_kwargs: Additional keyword arguments for the SlideShow.
+
+    Returns:
+        The path to the slide's presentation configuration (i.e., its .json file).
+    """
+    config_overrides = dict(
+        config_overrides, media_dir=str(build_folder / "media"), progress_bar="none"
+    )
+    with tempconfig(config_overrides):
+        # the deck may be a generator; only the slide rendered here is created
+        spec = next(islice(deck(), index, None))
+        scene = slide_show_class(
+            slides=[spec], output_folder=build_folder, **slide_show_kwargs
+        )
+        scene.render()
+    return build_folder / f"{scene}.json"
+
+
+def stitch_presentations(
+    presentation_paths: List[Path], output_folder: Path, scene_name: str
+) -> Path:
+    """
+    Stitch the presentations of consecutive slides into one presentation.
+
+    A SlideShow ends each slide by fading it out after a final next_slide, and the next slide
+    begins with a wait before its own first next_slide; in a serial build, both belong to the
+    same section. Hence, the last section of each partial presentation is merged with the first
+    section of the following one.
+
+    Args:
+        presentation_paths: The paths to the partial presentations, in order.
+        output_folder: The folder to write the stitched presentation to.
+        scene_name: The name of the stitched presentation.
+
+    Returns:
+        The path to the stitched presentation configuration (i.e., its .json file).
+    """
+    files_folder = output_folder / "files" / scene_name
+    files_folder.mkdir(parents=True, exist_ok=True)
+
+    slides: List[SlideConfig] = []
+    resolution, background_color = None, None
+    for presentation_path in presentation_paths:
+        presentation = PresentationConfig.from_file(presentation_path)
+        presentation.copy_to(files_folder)
+        resolution = resolution or presentation.resolution
+        background_color = background_color or presentation.background_color
+        sections: List[SlideConfig] = list(presentation.slides)
+        if len(slides) > 0:
+            slides[-1] = merge_sections(slides[-1], sections.pop(0), files_folder)
+        slides.extend(sections)
+
+    slides_path = output_folder / f"{scene_name}.json"
+    PresentationConfig(
+        slides=slides, resolution=resolution, background_color=background_color
+    ).to_file(slides_path)
+    return slides_path
+
+
+def merge_sections(
+    first: SlideConfig, second: SlideConfig, files_folder: Path
+) -> SlideConfig:
+    """
+    Merge two consecutive sections into one, keeping the options (e.g., loop) of the first.
+
+    Args:
+        first: The first section.
+        second: The section that directly follows it.
+        files_folder: The folder to write the merged video files to.
+
+    Returns:
+        The merged section.
+    """
+    file = files_folder / merge_basenames([first.file, second.file]).name
+    rev_file = file.with_name(f"{file.stem}_reversed{file.suffix}")
+    if not file.exists():
+        concatenate_video_files([first.file, second.file], file)
+    if not rev_file.exists():
+        reverse_video_file(file, rev_file)
+    return first.model_copy(update={"file": file, "rev_file": rev_file})
+
+
+def get_build_key(
+    slide,
+    slide_show_class: Type[SlideShow],
+    config_overrides: dict,
+    slide_show_kwargs: dict,
+) -> Union[None, str]:
+    """
+    Get the key under which a slide's rendered presentation is kept between builds; it changes
+    whenever the slide's inputs (see BeamerSlide.fingerprint) or the render settings change.
+
+    Args:
+        slide: The slide.
+        slide_show_class: The SlideShow (sub)class the slide is rendered with.
+        config_overrides: The manim config options the slide is rendered with.
+        slide_show_kwargs: Additional keyword arguments for the SlideShow.
+
+    Returns:
+        The build key, or None if the slide cannot be fingerprinted (it is then always rendered).
+    """
+    if not hasattr(slide, "fingerprint"):
+        return None
+    return fingerprint(
+        slide.fingerprint(),
+        slide_show_class.__name__,
+        config_overrides,
+        slide_show_kwargs,
+    )[:32]
+
+
+def build_parallel(
+    deck: Callable[[], Iterable],
+    output_folder: Union[str, Path] = "slides",
+    max_workers: Union[None, int] = None,
+    slide_show_class: Type[SlideShow] = SlideShow,
+    incremental: bool = True,
+    **slide_show_kwargs,
+) -> Path:
+    """
+    Build a SlideShow by rendering each of its slides in a separate worker process, and then
+    stitching the results into a single presentation (as if the SlideShow had been rendered).
+
+    The slides are independent (each one is faded out before the next), except for the camera:
+    slides that do not position it themselves (e.g., PromptSlide) start from the default frame
+    rather than from wherever the previous slide left it.
+
+    The deck must be given as slide specs (see SlideSpec), not as slides: every worker calls
+    the deck, so creating every slide (each a Scene of its own) there would cost O(N^2) for N
+    slides. With specs, a worker only creates the slide it renders, and this process creates
+    each slide once, to fingerprint it (if incremental), and drops it right after. A deck
+    without slides raises a ValueError, as a presentation has at least one slide.
+
+    Args:
+        deck: A picklable callable (e.g., a module-level function) that returns the slide
+            specs (e.g., functools.partial(SlideWithList, ...)), possibly as a generator.
+        output_folder: The folder to write the presentation to, as with manim-slides.
+        max_workers: The maximum number of worker processes; defaults to the number of CPUs.
+        slide_show_class: The SlideShow (sub)class to render the slides with.
+        incremental: Whether to reuse the rendered presentations of the slides whose
+            fingerprint (see BeamerSlide.fingerprint) has not changed since the last build,
+            and only render the others.
+        **slide_show_kwargs: Additional keyword arguments for the SlideShow.
+
+    Returns:
+        The path to the presentation configuration (i.e., its .json file).
+    """
+    output_folder = Path(output_folder).absolute()
+    build_root = output_folder / ".build"
+    scene_name = slide_show_class.__name__
+    config_overrides = {key: config[key] for key in INHERITED_CONFIG_KEYS}
+
+    # every slide is rendered in a folder named after its build key, which doubles as the
+    # cache of incremental builds (slides without a key are always rendered)
+    build_folders: List[Path] = []
+    dirty_indices: List[int] = []
+    for index, spec in enumerate(deck()):
+        if isinstance(spec, Scene) or hasattr(spec, "draw"):
+            raise TypeError(
+                f"The deck of a parallel build must return slide specs (e.g., "
+                f"functools.partial(SlideWithList, ...)), but slide {index} is a "
+                f"{type(spec).__name__} instance"
+            )
+        build_key = None
+        if incremental:
+            build_key = get_build_key(
+                make_slide(spec),
+                slide_show_class,
+                config_overrides,
+                slide_show_kwargs,
+            )
+        build_folder = build_root / (build_key or f"slide_{index}")
+        if build_folder in build_folders:
+            pass  # an identical slide earlier in the deck is rendered (or reused) already
+        elif build_key is None or not (build_folder / f"{scene_name}.json").exists():
+            shutil.rmtree(build_folder, ignore_errors=True)
+            dirty_indices.append(index)
+        build_folders.append(build_folder)
+    if len(build_folders) == 0:
+        # manim-slides' presentation configuration needs at least one slide
+        raise ValueError("The deck of a parallel build has no slides")
+    logger.info(
+        "Rendering %(dirty)d of %(total)d slides",
+        {"dirty": len(dirty_indices), "total": len(build_folders)},
+    )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                render_slide,
+                deck,
+                index,
+                build_folders[index],
+                slide_show_class,
+                config_overrides,
+                slide_show_kwargs,
+            )
+            for index in dirty_indices
+        ]
+        for future in futures:
+            future.result()
+
+    slides_path = stitch_presentations(
+        [build_folder / f"{scene_name}.json" for build_folder in build_folders],
+        output_folder,
+        scene_name,
+    )
+    # forget the renders that this build no longer uses
+    if build_root.exists():
+        for build_folder in build_root.iterdir():
+            if build_folder not in build_folders or not incremental:
+                shutil.rmtree(build_folder, ignore_errors=True)
+    return slides_path
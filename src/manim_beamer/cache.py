@@ -0,0 +1,80 @@
+"""
+Helpers for the on-disk caches kept by manim-beamer (e.g., parsed .bib libraries).
+"""
+
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Union
+
+CACHE_DIR_ENV_VAR = "MANIM_BEAMER_CACHE_DIR"
+
+
+def get_cache_dir(namespace: Union[None, str] = None) -> Path:
+    """
+    Get (and create, if necessary) the directory where manim-beamer stores its caches.
+
+    The location defaults to ~/.cache/manim_beamer and can be overridden with the
+    MANIM_BEAMER_CACHE_DIR environment variable.
+
+    Args:
+        namespace: An optional subdirectory to separate the caches of different features.
+
+    Returns:
+        The path to the cache directory.
+    """
+    cache_dir = Path(
+        os.environ.get(CACHE_DIR_ENV_VAR, Path.home() / ".cache" / "manim_beamer")
+    )
+    if namespace is not None:
+        cache_dir = cache_dir / namespace
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        path: The path to the file.
+        chunk_size: The number of bytes to read at a time.
+
+    Returns:
+        The hexadecimal digest of the file's contents.
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb"):
+    """
+    Write a cache file atomically: the body of the context manager writes to a temporary file
+    of its own (see tempfile.mkstemp) in the same directory, which then replaces the file. So
+    concurrent writers (processes or threads) never see a partial file, nor share their
+    temporary file; if writing fails, the temporary file is removed.
+
+    Args:
+        path: The path to the cache file.
+        mode: The mode to open the temporary file with, "wb" or "w" (as UTF-8 text).
+
+    Yields:
+        The temporary file, open for writing.
+    """
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        encoding = None if "b" in mode else "utf-8"
+        with os.fdopen(descriptor, mode, encoding=encoding) as file:
+            yield file
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
@@ -0,0 +1,179 @@
+"""
+Implements a static export of a SlideShow: instead of rendering (and encoding) the animations,
+every step of the presentation is captured as a still image, and the images are written as a
+multi-page PDF or as one PNG per step. This is meant for handouts and quick proofreading builds.
+"""
+
+from pathlib import Path
+from typing import Union, List, Sequence
+
+from PIL import Image
+from manim import ORIGIN, Group, tempconfig
+
+from manim_beamer.slides import SlideShow, BeamerSlide
+
+
+class StaticSlideShow(SlideShow):
+    """
+    A SlideShow that captures still images instead of rendering video: animations jump straight
+    to their final state, waits are skipped, and nothing is passed to ffmpeg.
+    """
+
+    def __init__(self, slides, steps: bool = True, **kwargs):
+        """
+        Create the static slide show.
+
+        Args:
+            slides: The slides (or slide specs, see SlideSpec) to export.
+            steps: Whether to capture an image at every next_slide step (e.g., every revealed
+                block) or only the final state of each slide (using its animate=False path).
+            **kwargs: Additional keyword arguments for the SlideShow.
+        """
+        # set before initializing the scene, which may already add mobjects
+        self.changed_since_last_frame: bool = False
+        super().__init__(slides, **kwargs)
+        self.steps: bool = steps
+        self.frames: List[Image.Image] = []
+
+    def add(self, *mobjects):
+        self.changed_since_last_frame = True
+        return super().add(*mobjects)
+
+    def remove(self, *mobjects):
+        self.changed_since_last_frame = True
+        return super().remove(*mobjects)
+
+    def play(self, *args, **kwargs):
+        """
+        Apply the animations instantly, i.e., leave the scene as it would be once they are over
+        (e.g., a Write shows the whole text, a FadeOut removes its mobject and a Circumscribe
+        leaves nothing behind).
+        """
+        animations = self.compile_animations(*args, **kwargs)
+        self.add_mobjects_from_animations(animations)
+        for animation in animations:
+            animation._setup_scene(self)
+            animation.begin()
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        self.changed_since_last_frame = True
+
+    def wait(self, *args, **kwargs):
+        pass  # a still image has no duration
+
+    def next_slide(self, *args, **kwargs):
+        self.capture_frame()
+
+    def capture_frame(self) -> None:
+        """
+        Capture the scene as seen by the camera, unless it is empty or has not changed since
+        the previous capture (e.g., several consecutive next_slide calls).
+        """
+        if not self.changed_since_last_frame or len(self.mobjects) == 0:
+            return
+        self.renderer.update_frame(self, ignore_skipping=True)
+        self.frames.append(self.camera.get_image().convert("RGB"))
+        self.changed_since_last_frame = False
+
+    def focus_camera(self, content, slide) -> None:
+        """
+        Position the camera so that the slide content, with the slide's buffers around it,
+        fits in the frame.
+
+        Args:
+            content: The slide content.
+            slide: The slide.
+        """
+        width_buffer = getattr(slide, "width_buffer", 3.0)
+        height_buffer = getattr(slide, "height_buffer", 1.0)
+        frame = self.camera.frame
+        frame.move_to(content.get_center()).set(width=content.width + width_buffer)
+        if frame.height < content.height + height_buffer:
+            frame.set(height=content.height + height_buffer)
+
+    def construct(self):
+        if self.steps:
+            super().construct()
+        else:
+            if self.batch_tex:
+                self.compile_tex()
+            # switched to the theme of the show (see prepare_slide), like SlideShow.construct
+            for slide in self.iter_prepared_slides():
+                self.clear()
+                content = slide.draw(
+                    origin=ORIGIN, scale=1.0, target_scene=self, animate=False
+                )
+                if not isinstance(slide, BeamerSlide):
+                    content = Group(*self.mobjects)
+                self.focus_camera(content, slide)
+                self.capture_frame()
+        self.capture_frame()
+
+    def export(self) -> List[Image.Image]:
+        """
+        Capture the images of the slide show (in place of Scene.render).
+
+        Returns:
+            The captured images, in order.
+        """
+        self.setup()
+        self.construct()
+        self.tear_down()
+        return self.frames
+
+
+def save_frames(frames: Sequence[Image.Image], output_path: Path) -> List[Path]:
+    """
+    Write the images either as the pages of a single PDF (if the output path ends with .pdf)
+    or as numbered PNG files within the output folder.
+
+    Args:
+        frames: The images.
+        output_path: The path of the PDF file, or the folder to write the PNG files to.
+
+    Returns:
+        The paths of the written files.
+    """
+    if len(frames) == 0:
+        raise ValueError("There are no frames to save.")
+    if output_path.suffix.lower() == ".pdf":
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        frames[0].save(output_path, save_all=True, append_images=list(frames[1:]))
+        return [output_path]
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    for index, frame in enumerate(frames, start=1):
+        path = output_path / f"slide_{index:03d}.png"
+        frame.save(path)
+        paths.append(path)
+    return paths
+
+
+def export_static(
+    slides,
+    output_path: Union[str, Path] = "slides.pdf",
+    steps: bool = True,
+    slide_show_class=StaticSlideShow,
+    **slide_show_kwargs,
+) -> List[Path]:
+    """
+    Export a deck as still images, without rendering any animation or video.
+
+    Args:
+        slides: The slides (or slide specs, see SlideSpec) to export.
+        output_path: The path of the PDF file to write, or the folder to write one PNG file
+            per image to.
+        steps: Whether to export an image per next_slide step, or one per slide.
+        slide_show_class: The StaticSlideShow (sub)class to capture the slides with.
+        **slide_show_kwargs: Additional keyword arguments for the slide show.
+
+    Returns:
+        The paths of the written files.
+    """
+    with tempconfig(
+        {"write_to_movie": False, "save_last_frame": False, "disable_caching": True}
+    ):
+        scene = slide_show_class(slides=slides, steps=steps, **slide_show_kwargs)
+        frames = scene.export()
+    return save_frames(frames, Path(output_path))
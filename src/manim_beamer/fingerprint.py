@@ -0,0 +1,93 @@
+"""
+Implements stable fingerprints (content hashes) of the inputs of slides, so that a build can tell
+which slides have changed since they were last rendered.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+from manim import Mobject, ManimColor, SingleStringMathTex, Text
+
+from manim_beamer.cache import hash_file
+
+# bump this whenever a change to manim-beamer alters how unchanged inputs are rendered
+FINGERPRINT_VERSION: int = 1
+
+
+def update_hasher(hasher, value) -> None:
+    """
+    Feed a value (and, recursively, its contents) into a hasher. Every value is tagged with
+    its type, so that, e.g., the string "1" and the integer 1 do not collide.
+
+    Supported values are None, booleans, numbers, strings, paths (hashed by file contents),
+    colors, NumPy arrays, mobjects, sequences, dictionaries and objects that define a
+    get_fingerprint_inputs method (e.g., BeamerList and Block).
+
+    Args:
+        hasher: A hashlib hash object.
+        value: The value to hash.
+    """
+    hasher.update(type(value).__name__.encode())
+    if value is None or isinstance(value, (bool, int, float, str)):
+        hasher.update(repr(value).encode())
+    elif isinstance(value, Path):
+        hasher.update(hash_file(value).encode())
+    elif isinstance(value, ManimColor):
+        hasher.update(value.to_hex(with_alpha=True).encode())
+    elif isinstance(value, np.ndarray):
+        hasher.update(str(value.shape).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, Mobject):
+        update_hasher_with_mobject(hasher, value)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(str(len(value)).encode())
+        for item in value:
+            update_hasher(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(str(len(value)).encode())
+        for key in sorted(value, key=repr):
+            update_hasher(hasher, key)
+            update_hasher(hasher, value[key])
+    elif hasattr(value, "get_fingerprint_inputs"):
+        update_hasher(hasher, value.get_fingerprint_inputs())
+    else:
+        raise TypeError(f"Cannot fingerprint a value of type {type(value)}")
+
+
+def update_hasher_with_mobject(hasher, mobject: Mobject) -> None:
+    """
+    Feed a mobject into a hasher: the type, points and colors of every member of its family
+    (and the source string of Text and MathTex objects).
+
+    Args:
+        hasher: A hashlib hash object.
+        mobject: The mobject to hash.
+    """
+    for m_object in mobject.get_family():
+        hasher.update(type(m_object).__name__.encode())
+        if isinstance(m_object, Text):
+            hasher.update(m_object.text.encode())
+        elif isinstance(m_object, SingleStringMathTex):
+            hasher.update(m_object.tex_string.encode())
+        for attribute in ("points", "fill_rgbas", "stroke_rgbas", "pixel_array"):
+            array = getattr(m_object, attribute, None)
+            if isinstance(array, np.ndarray):
+                update_hasher(hasher, array)
+
+
+def fingerprint(*values) -> str:
+    """
+    Compute a stable fingerprint of the given values (see update_hasher for what is supported).
+
+    Args:
+        *values: The values to fingerprint.
+
+    Returns:
+        The hexadecimal fingerprint.
+    """
+    hasher = hashlib.sha256()
+    update_hasher(hasher, FINGERPRINT_VERSION)
+    for value in values:
+        update_hasher(hasher, value)
+    return hasher.hexdigest()
@@ -1,17 +1,39 @@
+from functools import partial
+from typing import Callable, List
+
 from manim import (
     Scene,
     ORIGIN,
-    SVGMobject,
-    Text,
-    BLACK,
     VGroup,
-    ImageMobject,
     Group,
     FadeIn,
     DOWN,
     Create,
     Write,
+    Text,
 )
+from manim.utils.images import get_full_raster_image_path
+
+from manim_beamer.assets import cache_scaled_image, prefetch_svg
+from manim_beamer.assets import load_image_mobject, load_svg_mobject
+from manim_beamer.text_factory import text_factory
+from manim_beamer.theme import get_theme
+from manim_beamer.tracing import traced
+
+
+def make_caption(caption: str) -> Text:
+    """
+    Construct the caption of an image (a copy of it, see TextFactory).
+
+    Args:
+        caption: The caption.
+
+    Returns:
+        The caption's Text object.
+    """
+    return text_factory.text(
+        caption, font="TeX Gyre Termes", color=get_theme().foreground
+    ).scale(0.7)
 
 
 class CaptionedSVG(Scene):
@@ -23,13 +45,18 @@ class CaptionedSVG(Scene):
     def construct(self, origin=ORIGIN, scale=1.0):
         self.draw(origin, scale)
 
+    def get_prefetch_tasks(self) -> List[Callable[[], object]]:
+        """
+        Get the I/O that drawing needs and that can run in a background thread (see
+        SlideShow.prefetch): hashing the SVG file (see prefetch_svg).
+        """
+        return [partial(prefetch_svg, self.path)]
+
+    @traced()
     def draw(self, origin, scale, target_scene=None, animate=True):
-        svg = SVGMobject(self.path).scale(2)
-        text = (
-            Text(self.caption, font="TeX Gyre Termes", color=BLACK)
-            .scale(0.7)
-            .next_to(svg, DOWN)
-        )
+        # a copy of the parsed SVG (see manim_beamer.assets)
+        svg = load_svg_mobject(self.path).scale(2)
+        text = make_caption(self.caption).next_to(svg, DOWN)
         group = VGroup(svg, text)
         group.scale(scale_factor=scale).move_to(origin)
         if target_scene is None:
@@ -50,13 +77,18 @@ class CaptionedJPG(Scene):
     def construct(self, origin=ORIGIN, scale=1.0):
         self.draw(origin, scale)
 
+    def get_prefetch_tasks(self) -> List[Callable[[], object]]:
+        """
+        Get the I/O that drawing needs and that can run in a background thread (see
+        SlideShow.prefetch): decoding (and downsampling) the image into the asset cache.
+        """
+        return [partial(cache_scaled_image, get_full_raster_image_path(self.path))]
+
+    @traced()
     def draw(self, origin, scale, target_scene=None, animate=True):
-        jpg = ImageMobject(self.path).scale(self.original_image_scale)
-        text = (
-            Text(self.caption, font="TeX Gyre Termes", color=BLACK)
-            .scale(0.7)
-            .next_to(jpg, DOWN)
-        )
+        # a downsampled copy of the image (see manim_beamer.assets) of the same size
+        jpg = load_image_mobject(self.path).scale(self.original_image_scale)
+        text = make_caption(self.caption).next_to(jpg, DOWN)
         group = Group(jpg, text)
         group.scale(scale_factor=scale).move_to(origin)
         if target_scene is None:
@@ -0,0 +1,377 @@
+"""
+Implements batched LaTeX compilation, so that the MathTex/Tex expressions of a whole deck are
+typeset with a single LaTeX run (and a single dvisvgm run) instead of one pair of subprocesses
+per expression.
+
+The SVG of every expression is written where manim's own tex_to_svg_file looks for it (i.e.,
+named after the hash of the expression's .tex file in config.tex_dir), so constructing the
+corresponding MathTex/Tex objects afterward is a cache hit. The expressions are predicted
+from the strings given to MathTex/Tex with the same clean-up that manim applies (mirrored
+here, as of manim 0.18, rather than calling manim's private methods). Should a prediction
+ever differ from what manim compiles, its SVG is merely written under a name that manim
+does not look up, and manim compiles that expression itself; the output is never wrong.
+
+Only the expressions of MathTex/Tex objects that are yet to be constructed benefit: those
+that are constructed before the batch is compiled (e.g., a MathTex passed to a slide) have
+been compiled one at a time already. To batch those too, add their strings to a TexBatch
+(see add_math_tex and add_tex) and compile it before constructing them.
+"""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Union, Dict, List, Iterable, Tuple
+
+from manim import config, logger, Mobject, SingleStringMathTex
+from manim.utils.tex import TexTemplate
+from manim.utils.tex_file_writing import (
+    tex_hash,
+    compile_tex,
+    tex_to_svg_file,
+    delete_nonsvg_files,
+)
+
+from manim_beamer.tracing import traced
+
+# the environment that wraps each expression in the batched document (one page each)
+BATCH_PAGE_ENVIRONMENT = "manimbeamerpage"
+# matches the document class of templates that can be batched, e.g., manim's default template
+STANDALONE_PATTERN = re.compile(r"\\documentclass(?:\[(.*?)\])?\{standalone\}")
+
+
+def remove_stray_braces(tex: str) -> str:
+    """
+    Balance the braces of a TeX string, as SingleStringMathTex does (e.g., for the parts of
+    MathTex("e^{i", "x} = 1")).
+
+    Args:
+        tex: The TeX string.
+
+    Returns:
+        The TeX string with balanced braces.
+    """
+    # "\{" is a brace literal, but "\\{" is a line break followed by a brace
+    num_lefts = tex.count("{") - tex.count("\\{") + tex.count("\\\\{")
+    num_rights = tex.count("}") - tex.count("\\}") + tex.count("\\\\}")
+    if num_rights > num_lefts:
+        tex = "{" * (num_rights - num_lefts) + tex
+    elif num_lefts > num_rights:
+        tex = tex + "}" * (num_lefts - num_rights)
+    return tex
+
+
+def get_modified_expression(tex_string: str) -> str:
+    """
+    Apply the same clean-up to a TeX string that SingleStringMathTex applies before compiling
+    it (e.g., adding fillers or removing stray braces), without constructing the mobject.
+
+    Args:
+        tex_string: The TeX string.
+
+    Returns:
+        The TeX string that SingleStringMathTex would compile.
+    """
+    tex = tex_string.strip()
+    if tex in ("\\over", "\\overline", "\\sqrt", "\\sqrt{") or tex.endswith(
+        ("_", "^", "dot")
+    ):
+        tex += "{\\quad}"  # e.g., a fraction line needs something to be over
+    if tex in ("\\substack", ""):
+        tex = "\\quad"
+    if tex.startswith("\\\\"):  # keeps the file from starting with a line break
+        tex = tex.replace("\\\\", "\\quad\\\\")
+    num_lefts, num_rights = (
+        len(
+            [
+                part
+                for part in tex.split(command)[1:]
+                if part and part[0] in "(){}[]|.\\"
+            ]
+        )
+        for command in ("\\left", "\\right")
+    )
+    if num_lefts != num_rights:
+        tex = tex.replace("\\left", "\\big").replace("\\right", "\\big")
+    tex = remove_stray_braces(tex)
+    if ("\\begin{array}" in tex) != ("\\end{array}" in tex):
+        tex = ""  # a part of an array cannot be compiled on its own
+    return tex
+
+
+def break_up_tex_strings(
+    tex_strings: Iterable[str], substrings_to_isolate: Iterable[str]
+) -> List[str]:
+    """
+    Split the strings given to MathTex into its parts, as MathTex does: at double braces
+    (e.g., "{{ a }} + {{ b }}") and around the substrings to isolate.
+
+    Args:
+        tex_strings: The strings given to MathTex.
+        substrings_to_isolate: The substrings to isolate (including the keys of the
+            tex_to_color_map).
+
+    Returns:
+        The (non-empty) parts.
+    """
+    parts: List[str] = [
+        part
+        for tex_string in tex_strings
+        for part in re.split("{{(.*?)}}", str(tex_string))
+    ]
+    pattern = "|".join(
+        f"({re.escape(substring)})" for substring in substrings_to_isolate
+    )
+    if pattern:
+        parts = [piece for part in parts for piece in re.split(pattern, part)]
+    return [part for part in parts if part]
+
+
+def get_environment_delimiters(environment: str) -> Tuple[str, str]:
+    """
+    Get the \\begin and \\end commands of a TeX environment, accepting the same formats
+    as TexTemplate (e.g., "align*", "{align*}" or "{tabular}[t]{cccl}").
+
+    Args:
+        environment: The environment.
+
+    Returns:
+        The \\begin command (with the environment's arguments) and the \\end command.
+    """
+    if environment.startswith("\\begin"):
+        environment = environment[len("\\begin") :]
+    if environment.startswith("{"):
+        environment = environment[1:]
+    begin = "\\begin{" + environment
+    if not begin.endswith(("}", "]")):
+        begin += "}"
+    end = "\\end{" + environment.split("}", 1)[0] + "}"
+    return begin, end
+
+
+class TexBatch:
+    """
+    The TexBatch collects the expressions that MathTex/Tex objects will compile, and then
+    compiles all the ones that are not cached yet in one go (see the compile method).
+    """
+
+    def __init__(self, tex_template: Union[None, TexTemplate] = None):
+        """
+        Create an empty batch.
+
+        Args:
+            tex_template: The template to typeset the expressions with. If None, the template
+                in manim's config is used (as MathTex does by default).
+        """
+        self.tex_template: TexTemplate = (
+            config["tex_template"] if tex_template is None else tex_template
+        )
+        # each expression (and its environment), keyed by the hash of its full .tex source,
+        # i.e., the name manim gives to its .tex and .svg files
+        self.expressions: Dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.expressions)
+
+    def add_expression(self, expression: str, environment: Union[None, str]) -> None:
+        """
+        Add a single expression, exactly as it is passed to manim's tex_to_svg_file.
+
+        Args:
+            expression: The (already modified, see get_modified_expression) expression.
+            environment: The environment the expression is typeset in, e.g., "align*".
+        """
+        if environment is None:
+            tex_source = self.tex_template.get_texcode_for_expression(expression)
+        else:
+            tex_source = self.tex_template.get_texcode_for_expression_in_env(
+                expression, environment
+            )
+        self.expressions[tex_hash(tex_source)] = (expression, environment)
+
+    def add_math_tex(
+        self,
+        *tex_strings: str,
+        arg_separator: str = " ",
+        substrings_to_isolate: Union[None, Iterable[str]] = None,
+        tex_to_color_map: Union[None, dict] = None,
+        tex_environment: str = "align*",
+    ) -> None:
+        """
+        Add every expression that constructing MathTex(*tex_strings, ...) would compile, i.e.,
+        the joined string and each of its parts. The arguments have the same meaning as for
+        manim's MathTex.
+        """
+        parts: List[str] = break_up_tex_strings(
+            tex_strings,
+            list(substrings_to_isolate or []) + list(tex_to_color_map or {}),
+        )
+        for tex_string in [arg_separator.join(parts)] + parts:
+            self.add_expression(get_modified_expression(tex_string), tex_environment)
+
+    def add_tex(self, *tex_strings: str, **kwargs) -> None:
+        """
+        Add every expression that constructing Tex(*tex_strings, ...) (e.g., a Title) would
+        compile. The arguments have the same meaning as for manim's Tex.
+        """
+        kwargs.setdefault("arg_separator", "")
+        kwargs.setdefault("tex_environment", "center")
+        self.add_math_tex(*tex_strings, **kwargs)
+
+    def add_mobject(self, mobject: Mobject) -> None:
+        """
+        Add the expressions of every MathTex/Tex object within the mobject's family (e.g., the
+        math within a TextWithMath item or the cells of a MathTable).
+
+        Args:
+            mobject: The mobject to search.
+        """
+        for m_object in mobject.get_family():
+            if isinstance(m_object, SingleStringMathTex):
+                self.add_expression(
+                    get_modified_expression(m_object.tex_string),
+                    m_object.tex_environment,
+                )
+
+    def get_svg_path(self, key: str) -> Path:
+        """
+        Get the path where manim looks for the SVG of the expression with the given key.
+
+        Args:
+            key: The hash of the expression's .tex source.
+
+        Returns:
+            The path to the SVG file.
+        """
+        return config.get_dir("tex_dir") / f"{key}.svg"
+
+    @traced(describe=lambda self: {"expressions": len(self.expressions)})
+    def compile(self) -> int:
+        """
+        Compile all the expressions whose SVG is not cached yet: they are typeset as the pages
+        of a single document, which is then split into one SVG per expression.
+
+        Templates that do not use the standalone document class cannot be split into pages
+        reliably, so their expressions are compiled one at a time (by manim) instead.
+
+        Returns:
+            The number of expressions that were compiled (in the batch, or one at a time).
+        """
+        missing: List[str] = [
+            key for key in self.expressions if not self.get_svg_path(key).exists()
+        ]
+        if len(missing) == 0:
+            return 0
+        if (
+            STANDALONE_PATTERN.match(self.tex_template.documentclass.strip()) is None
+            or len(missing) == 1
+        ):
+            for key in missing:
+                expression, environment = self.expressions[key]
+                tex_to_svg_file(expression, environment, self.tex_template)
+            return len(missing)
+
+        tex_dir = config.get_dir("tex_dir")
+        tex_dir.mkdir(parents=True, exist_ok=True)
+        batch_file = tex_dir / f"batch_{tex_hash(''.join(missing))}.tex"
+        batch_file.write_text(self.get_batch_source(missing), encoding="utf-8")
+        try:
+            dvi_file = compile_tex(
+                batch_file,
+                self.tex_template.tex_compiler,
+                self.tex_template.output_format,
+            )
+        except ValueError:
+            # e.g., an invalid expression; manim reports it when that MathTex is constructed
+            logger.warning(
+                "Batched LaTeX failed for %(count)d expressions, they are compiled one at "
+                "a time instead (see %(log)s)",
+                {"count": len(missing), "log": batch_file.with_suffix(".log")},
+            )
+            return 0
+        # convert every page with a single dvisvgm invocation
+        result = subprocess.run(
+            [
+                "dvisvgm",
+                *(["--pdf"] if self.tex_template.output_format == ".pdf" else []),
+                f"--page=1-{len(missing)}",
+                "-n",
+                "-v",
+                "0",
+                "-o",
+                f"{batch_file.stem}-%p.svg",
+                dvi_file.name,
+            ],
+            cwd=tex_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            # the pages that were converted are still used, manim compiles the others
+            logger.warning(
+                "dvisvgm failed (exit code %(code)d) on %(file)s: %(error)s",
+                {
+                    "code": result.returncode,
+                    "file": dvi_file.name,
+                    "error": result.stderr.strip(),
+                },
+            )
+        compiled: int = 0
+        for page, key in enumerate(missing, start=1):
+            page_file = tex_dir / f"{batch_file.stem}-{page}.svg"
+            if page_file.exists():
+                os.replace(page_file, self.get_svg_path(key))
+                compiled += 1
+            else:
+                # e.g., an expression that does not produce any output; let manim handle it
+                logger.info(
+                    "Batched LaTeX produced no page for %(expression)s",
+                    {"expression": self.expressions[key][0]},
+                )
+        if not config["no_latex_cleanup"]:
+            delete_nonsvg_files()
+        return compiled
+
+    def get_batch_source(self, keys: List[str]) -> str:
+        """
+        Get the .tex source of a document that typesets the given expressions one per page.
+
+        Args:
+            keys: The keys of the expressions.
+
+        Returns:
+            The .tex source of the document.
+        """
+        # the template's class options (e.g., preview, which sizes every page just like the
+        # expression's own document) are kept, and only the multi-page mode is enabled, in
+        # which each page environment is typeset (and cropped) on its own
+        template = self.tex_template.copy()
+        match = STANDALONE_PATTERN.match(template.documentclass.strip())
+        options: List[str] = [
+            option.strip()
+            for option in (match.group(1) or "").split(",")
+            if option.strip() != ""
+        ]
+        if "multi" not in options:
+            template.documentclass = r"\documentclass[%s]{standalone}" % ",".join(
+                options + ["multi"]
+            )
+        template.add_to_preamble(
+            r"\newenvironment{%s}{}{}" % BATCH_PAGE_ENVIRONMENT
+            + "\n"
+            + r"\standaloneenv{%s}" % BATCH_PAGE_ENVIRONMENT
+        )
+        pages: List[str] = []
+        for key in keys:
+            expression, environment = self.expressions[key]
+            if environment is not None:
+                begin, end = get_environment_delimiters(environment)
+                expression = f"{begin}\n{expression}\n{end}"
+            pages.append(
+                r"\begin{%s}" % BATCH_PAGE_ENVIRONMENT
+                + f"\n{expression}\n"
+                + r"\end{%s}" % BATCH_PAGE_ENVIRONMENT
+            )
+        return template.get_texcode_for_expression("\n".join(pages))
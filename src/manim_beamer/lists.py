@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Union, Dict, List, Tuple
 
 from manim import (
     VGroup,
@@ -7,12 +8,17 @@ from manim import (
     LEFT,
     RIGHT,
     DOWN,
-    BLACK,
     MathTex,
     Cross,
     StealthTip,
+    VMobject,
 )
 
+from manim_beamer.text_factory import text_factory, TextFactory
+from manim_beamer.text_metrics import text_metrics
+from manim_beamer.theme import get_theme
+from manim_beamer.tracing import traced
+
 
 class TextWithMath(VGroup):
     def __init__(self, **kwargs):
@@ -20,16 +26,23 @@ class TextWithMath(VGroup):
 
 
 class BeamerList:
-    def __init__(self, items, font_size=30, list_color=BLACK):
+    def __init__(self, items, font_size=30, list_color=None, max_item_width=None):
         super().__init__()
         self.items = items
         self.font_size = font_size
         self._list_color = list_color
+        # if given, the string items are wrapped to this width (see manim_beamer.text_metrics)
+        self.max_item_width: Union[None, float] = max_item_width
         self.max_allowed_lists = 3  # this includes the main list and all sublists
         self.item_vertical_spacing = 0.25  # vertical spacing between items in the list
+        # the sizes of the (top-level) items, keyed by scale factor, see measure_items
+        self._item_sizes: Dict[float, List[Tuple[float, float]]] = {}
 
     @property
     def list_color(self):
+        # if no color was given, the list follows the foreground color of the current theme
+        if self._list_color is None:
+            return get_theme().foreground
         return self._list_color
 
     @list_color.setter
@@ -40,46 +53,128 @@ class BeamerList:
     def list_color(self):
         del self._list_color
 
+    def get_fingerprint_inputs(self) -> tuple:
+        """
+        Get the inputs that determine how the list is drawn (see manim_beamer.fingerprint).
+
+        Returns:
+            The inputs of the list.
+        """
+        return (
+            type(self),
+            self.items,
+            self.font_size,
+            self.list_color,
+            self.max_allowed_lists,
+            self.item_vertical_spacing,
+            self.max_item_width,
+        )
+
+    def add_tex_expressions(self, tex_batch) -> None:
+        """
+        Add the MathTex/Tex expressions of the list's items (and sublists) to a TexBatch.
+
+        Args:
+            tex_batch: The manim_beamer.latex.TexBatch to add the expressions to.
+        """
+        for item in self.items:
+            if isinstance(item, tuple):
+                item = item[0]
+            if isinstance(item, BeamerList):
+                item.add_tex_expressions(tex_batch)
+            elif isinstance(item, VGroup):
+                tex_batch.add_mobject(item)
+
     @abstractmethod
     def get_item_marker(self, scale_factor: float):
         raise NotImplementedError("This method must be implemented in a subclass")
 
-    def get_list(self, scale_factor: float, depth=0):
-        # Create a VGroup to contain the items and item_markers
-        list_group = VGroup()
-        for index, item in enumerate(self.items):
-            # default values for the font color and opacity of the item marker
-            font_color = BLACK
-            item_marker_opacity: float = 1.0 - (depth / (self.max_allowed_lists + 1))
+    def get_cached_item_marker(self, scale_factor: float, opacity: float) -> VMobject:
+        """
+        Get a copy of the item marker prototype for this kind of list, building the prototype
+        only once per (class, color, font size, scale factor, opacity). All lists (e.g., nested
+        sublists sharing a color) reuse the same prototypes, which are kept in the
+        size-bounded cache of the text factory.
 
-            if isinstance(item, tuple):
-                # if the item is a tuple, it should contain the text, font color, and
-                # opacity of the item marker
-                item, font_color, item_marker_opacity = item[0], item[1], item[2]
-            if isinstance(item, str) or isinstance(item, VGroup):
-                if isinstance(item, str):
-                    # if the item is a string, create a Text object
-                    text = Text(f"{item}", color=font_color, font_size=self.font_size)
-                else:
-                    text = self.parse_vgroup(font_color, item)
-
-                item_marker = self.get_item_marker(
-                    scale_factor=scale_factor,
-                ).copy()
-                # set the opacity of the item_marker based on the depth of the list
-                item_marker.set_opacity(item_marker_opacity)
-                item_marker.next_to(text, LEFT, buff=0.25)
-                item_group = VGroup(text, item_marker)
-            elif isinstance(item, BeamerList):
-                item_group = item.get_list(
-                    scale_factor=scale_factor,
-                    depth=depth + 1,
+        Args:
+            scale_factor: The scale factor of the list.
+            opacity: The opacity of the item marker.
+
+        Returns:
+            A copy of the item marker.
+        """
+        key = (
+            "item_marker",
+            type(self),
+            TextFactory.color_key(self.list_color),
+            self.font_size,
+            scale_factor,
+            opacity,
+        )
+
+        def make_item_marker() -> VMobject:
+            item_marker = self.get_item_marker(scale_factor=scale_factor)
+            item_marker.set_opacity(opacity)
+            return item_marker
+
+        return text_factory.get(key, make_item_marker)
+
+    def get_item_group(self, item, scale_factor: float, depth: int = 0) -> VGroup:
+        """
+        Construct the mobjects of one item of the list: its text and item marker, or the
+        whole sublist if the item is a BeamerList.
+
+        Args:
+            item: The item (a string, a VGroup, a BeamerList, or a tuple of one of these with
+                the font color and the opacity of the item marker).
+            scale_factor: The scale factor of the list.
+            depth: The depth of this list within the outermost list.
+
+        Returns:
+            The mobjects of the item.
+        """
+        # default values for the font color and opacity of the item marker
+        font_color = get_theme().foreground
+        item_marker_opacity: float = 1.0 - (depth / (self.max_allowed_lists + 1))
+
+        if isinstance(item, tuple):
+            # if the item is a tuple, it should contain the text, font color, and
+            # opacity of the item marker
+            item, font_color, item_marker_opacity = item[0], item[1], item[2]
+        if isinstance(item, str) or isinstance(item, VGroup):
+            if isinstance(item, str):
+                item = self.wrap_item(item)
+                # if the item is a string, create a Text object
+                text = text_factory.text(
+                    f"{item}", color=font_color, font_size=self.font_size
                 )
             else:
-                raise ValueError(
-                    f"Invalid item type {type(item)}. Must be a string or a BeamerList object"
-                )
-            list_group.add(item_group)
+                text = self.parse_vgroup(font_color, item)
+
+            # the opacity of the item_marker is based on the depth of the list
+            item_marker = self.get_cached_item_marker(
+                scale_factor=scale_factor, opacity=item_marker_opacity
+            )
+            item_marker.next_to(text, LEFT, buff=0.25)
+            return VGroup(text, item_marker)
+        if isinstance(item, BeamerList):
+            return item.get_list(
+                scale_factor=scale_factor,
+                depth=depth + 1,
+            )
+        raise ValueError(
+            f"Invalid item type {type(item)}. Must be a string or a BeamerList object"
+        )
+
+    @traced()
+    def get_list(self, scale_factor: float, depth=0):
+        # Create a VGroup to contain the items and item_markers
+        list_group = VGroup(
+            *[
+                self.get_item_group(item, scale_factor=scale_factor, depth=depth)
+                for item in self.items
+            ]
+        )
 
         # Arrange the items vertically, and appropriately indent if it's a sublist
         list_group.arrange(
@@ -100,6 +195,152 @@ class BeamerList:
 
         return list_group
 
+    @property
+    def item_gap(self) -> float:
+        """
+        The vertical gap between two consecutive items, as arranged by get_list.
+        """
+        return 0.5 * self.item_vertical_spacing
+
+    def wrap_item(self, item: str) -> str:
+        """
+        Wrap a string item to the maximum item width, if any.
+
+        Args:
+            item: The string.
+
+        Returns:
+            The wrapped string.
+        """
+        if self.max_item_width is None:
+            return item
+        return text_metrics.wrap(item, self.max_item_width, font_size=self.font_size)
+
+    def measure_item(self, item, scale_factor: float) -> Tuple[float, float]:
+        """
+        Measure the size of one item of the list, as drawn by get_item_group. A string is
+        measured with the text metrics, and a sublist from the sizes of its own items, so
+        neither is constructed (only the shared item marker prototypes are); any other
+        mobjects (e.g., a TextWithMath) are constructed to be measured.
+
+        Args:
+            item: The item (see get_item_group).
+            scale_factor: The scale factor of the list.
+
+        Returns:
+            The width and height of the item.
+        """
+        item_marker_opacity: float = 1.0
+        if isinstance(item, tuple):
+            item, item_marker_opacity = item[0], item[2]
+        if isinstance(item, str):
+            text = self.wrap_item(item)
+            item_marker = self.get_cached_item_marker(
+                scale_factor=scale_factor, opacity=item_marker_opacity
+            )
+            # the item marker is next to the text, vertically centered on it
+            width = (
+                item_marker.width
+                + 0.25
+                + text_metrics.get_width(text, font_size=self.font_size)
+            )
+            height = max(
+                item_marker.height,
+                text_metrics.get_height(text, font_size=self.font_size),
+            )
+            return width, height
+        if isinstance(item, BeamerList):
+            sizes = item.measure_items(scale_factor)
+            # the items of a sublist are indented (see get_list)
+            width = 1.0 + max((size[0] for size in sizes), default=0.0)
+            height = sum(size[1] for size in sizes)
+            return width, height + item.item_gap * max(len(sizes) - 1, 0)
+        item_group = self.get_item_group(item, scale_factor=scale_factor)
+        return item_group.width, item_group.height
+
+    def measure_items(self, scale_factor: float) -> List[Tuple[float, float]]:
+        """
+        Measure the size of every (top-level) item of the list, as drawn by get_list, without
+        constructing the items (see measure_item). The sizes are measured once per scale
+        factor.
+
+        Args:
+            scale_factor: The scale factor of the list.
+
+        Returns:
+            The width and height of every item; a sublist counts as a single item.
+        """
+        if scale_factor not in self._item_sizes:
+            self._item_sizes[scale_factor] = [
+                self.measure_item(item, scale_factor=scale_factor)
+                for item in self.items
+            ]
+        return self._item_sizes[scale_factor]
+
+    def paginate(
+        self, max_height: float, scale_factor: float = 1.0
+    ) -> List["BeamerList"]:
+        """
+        Split the list into pages that are at most max_height tall (when drawn with get_list),
+        without constructing any of their mobjects. A sublist is never split, and stays on the
+        same page as the item it follows; an item (with its sublists) that is taller than
+        max_height gets a page of its own.
+
+        Args:
+            max_height: The maximum height of a page (before the list is scaled).
+            scale_factor: The scale factor of the list.
+
+        Returns:
+            The pages, as lists of the same kind (and style) as this list.
+        """
+        heights = [size[1] for size in self.measure_items(scale_factor)]
+        # group every item with the sublists that follow it, as they are kept together
+        units: List[List[int]] = []
+        for index, item in enumerate(self.items):
+            if isinstance(item, tuple):
+                item = item[0]
+            if isinstance(item, BeamerList) and len(units) > 0:
+                units[-1].append(index)
+            else:
+                units.append([index])
+
+        pages: List[List[int]] = [[]]
+        page_height: float = 0.0
+        for unit in units:
+            unit_height = sum(heights[index] for index in unit)
+            unit_height += self.item_gap * (len(unit) - 1)
+            if (
+                len(pages[-1]) > 0
+                and page_height + self.item_gap + unit_height > max_height
+            ):
+                pages.append([])
+            if len(pages[-1]) == 0:
+                page_height = unit_height
+            else:
+                page_height += self.item_gap + unit_height
+            pages[-1].extend(unit)
+        return [self.make_page([self.items[index] for index in page]) for page in pages]
+
+    def make_page(self, items: list) -> "BeamerList":
+        """
+        Make a list of the same kind and style as this one, but with other items.
+
+        Args:
+            items: The items of the page.
+
+        Returns:
+            The list.
+        """
+        page = type(self)(
+            items,
+            font_size=self.font_size,
+            list_color=self._list_color,
+            max_item_width=self.max_item_width,
+        )
+        page.max_allowed_lists = self.max_allowed_lists
+        page.item_vertical_spacing = self.item_vertical_spacing
+        return page
+
     def parse_vgroup(self, font_color, item):
         text = TextWithMath()
         if isinstance(item, Cross):
@@ -111,7 +352,9 @@ class BeamerList:
         for sub_item in item:
             if isinstance(sub_item, str):
                 # if the item is a string, create a Text object
-                sub_text = Text(f"{item}", color=font_color, font_size=self.font_size)
+                sub_text = text_factory.text(
+                    f"{item}", color=font_color, font_size=self.font_size
+                )
             elif isinstance(sub_item, Text) or isinstance(sub_item, MathTex):
                 sub_text = sub_item
                 sub_text.set_color(font_color)
@@ -149,14 +392,20 @@ class ItemizedList(BeamerList):
 
 class BulletedList(BeamerList):
     def get_item_marker(self, scale_factor: float = 1.0):
-        return Text("•", color=self.list_color, font_size=self.font_size).scale(1.5)
+        return text_factory.text(
+            "•", color=self.list_color, font_size=self.font_size
+        ).scale(1.5)
 
 
 class AdvantagesList(BeamerList):
     def get_item_marker(self, scale_factor: float = 1.0):
-        return Text("+", color=self.list_color, font_size=self.font_size).scale(1.25)
+        return text_factory.text(
+            "+", color=self.list_color, font_size=self.font_size
+        ).scale(1.25)
 
 
 class DisadvantagesList(BeamerList):
     def get_item_marker(self, scale_factor: float = 1.0):
-        return Text("-", color=self.list_color, font_size=self.font_size).scale(1.25)
+        return text_factory.text(
+            "-", color=self.list_color, font_size=self.font_size
+        ).scale(1.25)
@@ -1,4 +1,9 @@
-from typing import Union, List, Type
+import gc
+import os
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Union, Callable, Iterable, Iterator, List, Sequence, Tuple, Type
 
 from manim import (
     ORIGIN,
@@ -14,37 +19,382 @@ from manim import (
     Group,
     Create,
     AnimationGroup,
-    BLACK,
+    LaggedStart,
     UP,
     DOWN,
     RIGHT,
+    Scene,
     Table,
     MathTex,
+    DEFAULT_WAIT_TIME,
+    config,
+    logger,
 )
 from manim_slides import Slide
 
-from manim_beamer import MANIM_BLUE
+from manim_beamer.theme import (
+    Theme,
+    LIGHT_THEME,
+    apply_theme,
+    get_theme,
+    paint,
+    using_theme,
+)
+from manim_beamer.bibtex import BibTexManager
 from manim_beamer.blocks import Block
 from manim_beamer.lists import BeamerList
 from manim_beamer.images import CaptionedJPG
+from manim_beamer.latex import TexBatch
+from manim_beamer.fingerprint import fingerprint
+from manim_beamer.text_factory import text_factory
+from manim_beamer.tracing import (
+    traced,
+    count_mobjects,
+    count_points,
+    format_memory_report,
+    get_rss,
+)
+
+COMPACT_WAITS_ENV_VAR = "MANIM_BEAMER_COMPACT_WAITS"
+
+
+def describe_play(scene, *animations, **kwargs) -> dict:
+    """
+    Describe a call to play for its trace span (see manim_beamer.tracing).
+    """
+    return {"animations": [type(animation).__name__ for animation in animations]}
+
+
+class TracedScene:
+    """
+    A mixin for scenes that records a span around every play and wait when tracing is enabled
+    (see manim_beamer.tracing); this covers camera moves and the rendering of their frames.
+    """
+
+    @traced(name="Scene.play", describe=describe_play)
+    def play(self, *args, **kwargs):
+        return super().play(*args, **kwargs)
+
+    @traced(name="Scene.wait")
+    def wait(self, *args, **kwargs):
+        return super().wait(*args, **kwargs)
+
+
+class HoldFrameScene:
+    """
+    A mixin for slides that can compact their static holds (i.e., the waits around
+    next_slide). With compact_waits, a wait is deferred until the scene knows what follows
+    it: a hold directly before a next_slide (or the end of the scene) is dropped, as the
+    presentation pauses there anyway, and any other hold is rendered as usual, so the timing
+    of the presentation is unchanged.
+
+    Two holds before a next_slide are still rendered:
+
+    - if the slide that the hold ends loops or advances on its own (the loop or auto_next
+      that was given to the next_slide call starting it), as its duration is then part of
+      the presentation;
+    - if the slide has no animation besides the hold (e.g., a wait between two next_slide
+      calls), as manim-slides would otherwise skip the slide; it is rendered as a single
+      frame, since the presentation pauses on it anyway.
+
+    Compacting is enabled by passing compact_waits=True or by setting the
+    MANIM_BEAMER_COMPACT_WAITS environment variable (e.g., for manim's command line).
+    """
+
+    compact_waits: bool = bool(os.environ.get(COMPACT_WAITS_ENV_VAR))
+
+    def __init__(self, *args, compact_waits: Union[None, bool] = None, **kwargs):
+        if compact_waits is not None:
+            self.compact_waits = compact_waits
+        # the duration of the hold that is waiting for the next animation or slide
+        self.pending_hold: float = 0.0
+        # the total duration of the dropped holds
+        self.dropped_hold_time: float = 0.0
+        self._in_next_slide: bool = False
+        super().__init__(*args, **kwargs)
+
+    def has_slide_animations(self) -> bool:
+        """
+        Whether anything was played since the last next_slide (see manim-slides).
+        """
+        return getattr(self, "_current_animation", 0) > getattr(
+            self, "_start_animation", 0
+        )
+
+    def slide_advances(self) -> bool:
+        """
+        Whether the current slide (the one the next next_slide call ends) loops or advances
+        on its own; in manim-slides, the options given to next_slide apply to the slide that
+        it starts.
+        """
+        slide_config = getattr(self, "_base_slide_config", None)
+        return slide_config is not None and bool(
+            slide_config.loop or slide_config.auto_next
+        )
+
+    def flush_hold(self, duration: Union[None, float] = None) -> None:
+        """
+        Render the pending hold.
+
+        Args:
+            duration: The duration to render it with; if None, its own duration.
+        """
+        if duration is None:
+            duration = self.pending_hold
+        self.pending_hold = 0.0
+        # the wait's play call comes back through play, with no pending hold
+        super().wait(duration)
+
+    def drop_hold(self) -> None:
+        """
+        Drop the pending hold before a next_slide (or the end of the scene), unless it has
+        to be rendered (see the class docstring).
+        """
+        if self.slide_advances():
+            self.flush_hold()
+            return
+        if not self.has_slide_animations():
+            self.flush_hold(1 / config.frame_rate)  # keeps the slide, as a single frame
+            return
+        self.dropped_hold_time += self.pending_hold
+        self.pending_hold = 0.0
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None, **kwargs):
+        if not self.compact_waits or stop_condition is not None or self._in_next_slide:
+            if self.pending_hold > 0.0:
+                self.flush_hold()
+            return super().wait(duration, stop_condition=stop_condition, **kwargs)
+        self.pending_hold += duration
 
+    def play(self, *args, **kwargs):
+        if self.pending_hold > 0.0:
+            self.flush_hold()
+        return super().play(*args, **kwargs)
 
-class SlideShow(Slide, MovingCameraScene):
+    def next_slide(self, *args, **kwargs):
+        if self.pending_hold > 0.0:
+            self.drop_hold()
+        self._in_next_slide = True  # e.g., manim-slides' wait_time_between_slides
+        try:
+            return super().next_slide(*args, **kwargs)
+        finally:
+            self._in_next_slide = False
+
+    def tear_down(self):
+        if self.pending_hold > 0.0:
+            self.drop_hold()  # the presentation ends on the last frame
+        if self.dropped_hold_time > 0.0:
+            logger.info(
+                "Dropped %(duration).1f s of holds before slide boundaries",
+                {"duration": self.dropped_hold_time},
+            )
+        super().tear_down()
+
+
+# a slide (any scene with a draw method, e.g., a BeamerSlide or a CaptionedSVG), or a spec of
+# one: a callable that creates it (e.g., functools.partial(SlideWithList, title=...,
+# beamer_list=...)), so that it is only constructed when it is about to be drawn
+SlideSpec = Union[Scene, Callable[[], Scene]]
+
+
+def make_slide(slide_or_spec: SlideSpec) -> Scene:
+    """
+    Get the slide that a deck entry stands for, creating it if the entry is a spec.
+
+    Args:
+        slide_or_spec: The slide, or a callable that creates it.
+
+    Returns:
+        The slide.
+    """
+    if isinstance(slide_or_spec, Scene) or hasattr(slide_or_spec, "draw"):
+        return slide_or_spec
+    return slide_or_spec()
+
+
+class SlideShow(HoldFrameScene, TracedScene, Slide, MovingCameraScene):
     """
     A class to create a slide show of multiple Slide objects.
+
+    The slides may also be given as specs (see SlideSpec) or by a generator, in which case
+    every slide is only created right before it is drawn, and dropped right after it: the
+    start-up time and the memory in use then depend on the slide being rendered rather than
+    on the length of the deck.
+
+    With prefetch set, the I/O of the next slide (e.g., compiling its LaTeX and decoding its
+    images, see get_prefetch_tasks) is done in a background thread while the current one is
+    animated and rendered.
     """
 
-    def __init__(self, slides, zoom_with_height: bool = False, **kwargs):
+    def __init__(
+        self,
+        slides: Iterable[SlideSpec],
+        zoom_with_height: bool = False,
+        batch_tex: bool = True,
+        theme: Union[None, Theme] = None,
+        release_slides: bool = False,
+        prefetch: bool = False,
+        **kwargs
+    ):
+        # before the camera is created, as it reads the background color
+        self.theme: Theme = apply_theme(theme)  # if None, the current theme is kept
         super().__init__(**kwargs)
-        self.slides: List[Type[Slide]] = slides
+        self.slides: Iterable[SlideSpec] = slides
         self.zoom_with_height: bool = zoom_with_height
+        # whether to compile the deck's LaTeX in a single run before drawing any slide
+        self.batch_tex: bool = batch_tex
+        # whether to release the mobjects each slide keeps once its section is rendered, so
+        # that the memory in use does not grow with the length of the deck
+        self.release_slides: bool = release_slides
+        # whether to do the next slide's I/O in a background thread, see iter_prepared_slides
+        self.prefetch: bool = prefetch
+        # the memory in use after each slide, see measure_slide
+        self.memory_report: List[dict] = []
+
+    @traced()
+    def compile_tex(self) -> int:
+        """
+        Compile every MathTex/Tex expression the slides will use (e.g., block titles and the
+        math within lists, blocks and tables) with a single LaTeX run, so that constructing
+        them while drawing the slides is a cache hit.
+
+        Returns:
+            The number of expressions that had to be compiled.
+        """
+        tex_batch = TexBatch()
+        if isinstance(self.slides, Sequence):  # a generator cannot be looked ahead into
+            for slide in self.slides:
+                # the slides given as specs are compiled when they are created instead
+                if isinstance(slide, BeamerSlide):
+                    slide.add_tex_expressions(tex_batch)
+        return tex_batch.compile()
+
+    def iter_slides(self) -> Iterator[Slide]:
+        """
+        Iterate over the slides of the show, creating those given as specs one at a time.
+
+        Returns:
+            The slides, in order.
+        """
+        for slide_or_spec in self.slides:
+            yield make_slide(slide_or_spec)
+
+    def get_prefetch_tasks(self, slide: Slide) -> List[Callable[[], object]]:
+        """
+        Get the I/O that drawing a slide needs, as callables that only read and write files
+        (and run subprocesses), so that they can run in a background thread: compiling the
+        slide's LaTeX if batch_tex is set (what compile_tex compiled already is skipped, so
+        this covers the slides given as specs or by a generator), and the slide's own tasks
+        (e.g., decoding its images, see CaptionedJPG.get_prefetch_tasks).
+
+        Args:
+            slide: The slide.
+
+        Returns:
+            The tasks.
+        """
+        tasks: List[Callable[[], object]] = []
+        if self.batch_tex and isinstance(slide, BeamerSlide):
+            tex_batch = TexBatch()
+            slide.add_tex_expressions(tex_batch)
+            if len(tex_batch) > 0:
+                tasks.append(tex_batch.compile)
+        if hasattr(slide, "get_prefetch_tasks"):
+            tasks += slide.get_prefetch_tasks()
+        return tasks
+
+    @staticmethod
+    def run_tasks(tasks: List[Callable[[], object]]) -> None:
+        for task in tasks:
+            task()
+
+    @traced()
+    def prepare_slide(self, slide: Slide) -> Slide:
+        """
+        Switch a slide to the theme of the show and lay it out (the layout is kept by the
+        slide, so drawing it reuses these mobjects instead of rebuilding them).
+
+        Args:
+            slide: The slide.
+
+        Returns:
+            The slide.
+        """
+        if isinstance(slide, BeamerSlide):
+            if slide.theme != self.theme:
+                slide.recolor(self.theme)  # no need to construct it again
+            slide.layout(origin=ORIGIN, scale=1.0)
+        return slide
+
+    def iter_prepared_slides(self) -> Iterator[Slide]:
+        """
+        Iterate over the slides of the show, ready to be drawn: their I/O is done (see
+        get_prefetch_tasks) and they are prepared (see prepare_slide).
+
+        With prefetch set, the I/O of every slide runs in a background thread while the
+        previous slide is drawn and rendered. The slides and their mobjects are still only
+        created in the calling (i.e., the scene's) thread, as manim, Pango and Cairo are not
+        known to be thread-safe.
+
+        Returns:
+            The prepared slides, in order.
+        """
+        slides = self.iter_slides()
+        if not self.prefetch:
+            for slide in slides:
+                self.run_tasks(self.get_prefetch_tasks(slide))
+                yield self.prepare_slide(slide)
+            return
+        # a single worker, so the I/O of the slides is done in order
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            previous: Union[None, Tuple[Slide, Future]] = None
+            for slide in chain(slides, [None]):  # None marks the end of the slides
+                if slide is not None:
+                    # this slide's I/O is done while the previous one is drawn (and rendered)
+                    io = executor.submit(self.run_tasks, self.get_prefetch_tasks(slide))
+                if previous is not None:
+                    previous_slide, previous_io = previous
+                    previous_io.result()
+                    yield self.prepare_slide(previous_slide)
+                previous = None if slide is None else (slide, io)
+
+    def measure_slide(self, slide, rss_before: int) -> dict:
+        """
+        Measure the memory in use after a slide was drawn and faded out (and, if
+        release_slides is set, released), and add it to the memory report.
+
+        Args:
+            slide: The slide.
+            rss_before: The resident set size before the slide was drawn, in bytes.
+
+        Returns:
+            The entry of the report: the slide's title (or class), the resident set size
+            after the slide and its change, and the number of mobjects and points that
+            the slide keeps.
+        """
+        kept = slide.get_themed_mobjects() if isinstance(slide, BeamerSlide) else []
+        rss_after = get_rss()
+        entry = {
+            "slide": getattr(slide, "title_str", None) or type(slide).__name__,
+            "rss_before": rss_before,
+            "rss_after": rss_after,
+            "rss_delta": rss_after - rss_before,
+            "mobjects": sum(count_mobjects(m_object) for m_object in kept),
+            "points": sum(count_points(m_object) for m_object in kept),
+        }
+        self.memory_report.append(entry)
+        return entry
 
     def construct(self):
-        for slide in self.slides:
-            # see what the content will be like in advance
-            content = slide.draw(
-                origin=ORIGIN, scale=1.0, target_scene=None, animate=False
-            )
+        if self.batch_tex:
+            self.compile_tex()
+        for slide in self.iter_prepared_slides():
+            rss_before = get_rss()
+            # see what the content will be like in advance (the layout was kept by the
+            # slide, so the animated pass below reuses these mobjects instead of rebuilding)
+            content = None
+            if isinstance(slide, BeamerSlide):
+                content = slide.layout(origin=ORIGIN, scale=1.0)
             if content is not None:
                 # focus the camera on the entire slide
                 self.camera.frame.move_to(content.get_center()).set(
@@ -58,10 +408,20 @@ class SlideShow(Slide, MovingCameraScene):
             self.next_slide()
             # fade out the slide content
             self.play(*[FadeOut(m_object) for m_object in self.mobjects])
+            if self.release_slides and isinstance(slide, BeamerSlide):
+                slide.release()
+                gc.collect()  # reclaim the slide's mobjects before the next one is drawn
+            self.measure_slide(slide, rss_before)
+        if self.release_slides:
+            logger.info(
+                "Memory in use after each slide:\n"
+                + format_memory_report(self.memory_report)
+            )
 
 
-class PromptSlide(Slide):
+class PromptSlide(HoldFrameScene, Slide):
     def __init__(self, prompt: str, skip: bool = False, **kwargs):
+        apply_theme()  # before the camera is created, as it reads the background color
         super().__init__(**kwargs)
         # self.title_str: str = title
         self.prompt_str: str = prompt
@@ -83,15 +443,34 @@ class PromptSlide(Slide):
         self.play(FadeOut(Group(*self.mobjects)))
         self.wait(2)
 
+    def get_fingerprint_inputs(self) -> tuple:
+        return (self.prompt_str,)
+
+    def fingerprint(self) -> str:
+        """
+        Get a stable fingerprint of everything that determines how the slide is drawn.
+
+        Returns:
+            The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            type(self).__name__,
+            self.get_fingerprint_inputs(),
+            get_theme(),
+            config.background_color,
+        )
+
+    def make_prompt_text(self) -> Text:
+        return text_factory.text(
+            self.prompt_str, color=get_theme().foreground, slant=ITALIC
+        )
+
+    @traced()
     def draw(self, origin, scale, target_scene=None, animate=True):
         if target_scene is None:
             target_scene = self
 
-        prompt_text = (
-            Text(self.prompt_str, color=BLACK, slant=ITALIC)
-            .move_to(origin)
-            .scale(scale)
-        )
+        prompt_text = self.make_prompt_text().move_to(origin).scale(scale)
 
         if animate:
             target_scene.play(Write(prompt_text))
@@ -100,7 +479,7 @@ class PromptSlide(Slide):
             target_scene.add(prompt_text)
 
 
-class BeamerSlide(MovingCameraScene, Slide):
+class BeamerSlide(HoldFrameScene, TracedScene, MovingCameraScene, Slide):
     def __init__(
         self,
         title: str,
@@ -109,46 +488,88 @@ class BeamerSlide(MovingCameraScene, Slide):
         height_buffer: float = 1.0,
         **kwargs
     ):
+        apply_theme()  # before the camera is created, as it reads the background color
         super().__init__(**kwargs)
+        # the theme the slide's mobjects are constructed with, see the recolor method
+        self.theme: Theme = get_theme()
         self.title_str: str = title
         self.subtitle_str: str = subtitle
         self.width_buffer = width_buffer
         self.height_buffer = height_buffer
 
-        # create the manim objects for the slide title
-        self.title_text: Text = Text(
-            self.title_str,
-            font="TeX Gyre Termes",
-            color=BLACK,
-            font_size=60,
-            weight=BOLD,
-        ).to_edge(UP)
-        if self.subtitle_str is not None:
-            self.subtitle_text: Text = Text(
+        # the manim objects for the slide title, constructed when first needed (i.e., when
+        # the slide is laid out), see the title_text and subtitle_text properties
+        self._title_text: Union[None, Text] = None
+        self._subtitle_text: Union[None, Text] = None
+
+        # the final arrangement of the slide's mobjects, see the layout method
+        self._layout: Union[None, VGroup] = None
+        self._layout_key: Union[None, tuple] = None
+
+    @property
+    def title_text(self) -> Text:
+        """
+        The title of the slide (constructed on first access).
+        """
+        if self._title_text is None:
+            self._title_text = text_factory.text(
+                self.title_str,
+                font="TeX Gyre Termes",
+                color=self.theme.foreground,
+                font_size=60,
+                weight=BOLD,
+            ).to_edge(UP)
+        return self._title_text
+
+    @property
+    def subtitle_text(self) -> Union[None, Text]:
+        """
+        The subtitle of the slide (constructed on first access), or None if it has none.
+        """
+        if self._subtitle_text is None and self.subtitle_str is not None:
+            self._subtitle_text = text_factory.text(
                 self.subtitle_str,
                 font="TeX Gyre Termes",
-                color=BLACK,
+                color=self.theme.foreground,
                 font_size=30,
                 slant=ITALIC,
             ).next_to(self.title_text, DOWN)
+        return self._subtitle_text
 
-    def inner_draw(self, origin, scale, target_scene=None, animate=True) -> VGroup:
+    def layout(self, origin, scale: float) -> VGroup:
         """
-        Draw the slide content (title and subtitle - if applicable) on the scene
-        and then return the last displayed text object.
+        Compute the final arrangement of the slide's content without drawing it. The result
+        is kept, so any later call with the same origin and scale (e.g., the animated pass of
+        a SlideShow) reuses the very same mobjects instead of constructing them again.
 
         Args:
             origin: The origin of the slide.
             scale: The scale factor to apply to the slide content.
-            target_scene: The scene to draw the slide on. If None, the current scene is used.
-            animate: Whether to animate the drawing of the slide.
 
         Returns:
-            The current text objects displayed on the scene.
+            The slide content (title, subtitle - if applicable - and body) in its final position.
         """
-        if target_scene is None:
-            target_scene = self
+        key = (tuple(origin), scale)
+        if self._layout is None or self._layout_key != key:
+            # whatever is constructed now must match the theme of the slide's other mobjects
+            with using_theme(self.theme):
+                self._layout = self.make_layout(origin, scale)
+            self._layout_key = key
+        return self._layout
 
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        """
+        Construct and position the slide content. Subclasses extend this to add their body
+        beneath the title (and subtitle); use the layout method to get the cached result.
+
+        Args:
+            origin: The origin of the slide.
+            scale: The scale factor to apply to the slide content.
+
+        Returns:
+            The slide content in its final position.
+        """
         # make local copies to avoid modifying the original objects
         title_text = self.title_text.copy()
         subtitle_text = (
@@ -163,6 +584,137 @@ class BeamerSlide(MovingCameraScene, Slide):
         # position and scale the content
         content.move_to(origin)
         content.scale(scale)
+        return content
+
+    def get_fingerprint_inputs(self) -> tuple:
+        """
+        Get the inputs that determine how the slide is drawn (e.g., its title, list items,
+        block contents or table data). Subclasses extend this with the inputs of their body.
+
+        Returns:
+            The inputs of the slide.
+        """
+        return (
+            self.title_str,
+            self.subtitle_str,
+            self.width_buffer,
+            self.height_buffer,
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Get a stable fingerprint of everything that determines how the slide is drawn, so that
+        builds can reuse the rendered video of slides that have not changed.
+
+        Returns:
+            The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            type(self).__name__,
+            self.get_fingerprint_inputs(),
+            self.theme,
+            config.background_color,
+        )
+
+    def get_themed_mobjects(self) -> list:
+        """
+        Get the mobjects that the slide constructed with its theme and keeps (e.g., its title
+        and its layout). Subclasses extend this with the mobjects of their body.
+
+        Returns:
+            The mobjects.
+        """
+        # only those that were constructed so far
+        return [
+            m_object
+            for m_object in (self._title_text, self._subtitle_text, self._layout)
+            if m_object is not None
+        ]
+
+    def recolor(self, theme: Theme) -> None:
+        """
+        Switch the slide to another theme by recoloring the mobjects it keeps in place (see
+        Theme.recolor); nothing is constructed or laid out again.
+
+        Args:
+            theme: The theme to switch to.
+        """
+        for m_object in self.get_themed_mobjects():
+            theme.recolor(m_object, self.theme)
+        self.theme = theme
+
+    def release(self) -> None:
+        """
+        Forget the mobjects the slide constructed to be drawn (e.g., its layout), once it has
+        been drawn; they are constructed again if the slide is drawn again. Subclasses extend
+        this with the mobjects of their body.
+        """
+        self._title_text = self._subtitle_text = None
+        self._layout = None
+        self._layout_key = None
+
+    def add_tex_expressions(self, tex_batch: TexBatch) -> None:
+        """
+        Add the MathTex/Tex expressions that drawing this slide will compile to a TexBatch.
+        Subclasses extend this with the expressions of their body.
+
+        Args:
+            tex_batch: The TexBatch to add the expressions to.
+        """
+
+    @staticmethod
+    def get_frame_height(frame_width: float) -> float:
+        """
+        Get the height of the camera frame once it is fitted to the given width (as the draw
+        methods do); the frame keeps the aspect ratio of the output.
+
+        Args:
+            frame_width: The width of the frame.
+
+        Returns:
+            The height of the frame.
+        """
+        return frame_width * config.frame_height / config.frame_width
+
+    @property
+    def num_of_title_objects(self) -> int:
+        """
+        The number of leading mobjects in the layout that belong to the title (and subtitle).
+        """
+        return 1 if self.subtitle_str is None else 2
+
+    @traced()
+    def inner_draw(
+        self,
+        origin,
+        scale,
+        target_scene=None,
+        animate=True,
+        content: Union[None, VGroup] = None,
+    ) -> VGroup:
+        """
+        Draw the slide content (title and subtitle - if applicable) on the scene
+        and then return the slide content.
+
+        Args:
+            origin: The origin of the slide.
+            scale: The scale factor to apply to the slide content.
+            target_scene: The scene to draw the slide on. If None, the current scene is used.
+            animate: Whether to animate the drawing of the slide.
+            content: The slide content as returned by the layout method. If None, the
+                layout is computed (or reused) here.
+
+        Returns:
+            The slide content; only its title objects are displayed on the scene.
+        """
+        if target_scene is None:
+            target_scene = self
+        if content is None:
+            content = self.layout(origin, scale)
+
+        title_text = content[0]
+        subtitle_text = content[1] if self.subtitle_str is not None else None
+        titles = VGroup(*content[: self.num_of_title_objects])
 
         if animate:
             target_scene.wait(1)
@@ -171,7 +723,7 @@ class BeamerSlide(MovingCameraScene, Slide):
             target_scene.play(
                 Succession(
                     target_scene.camera.frame.animate.set(
-                        width=content.width
+                        width=titles.width
                         + self.width_buffer,  # height=content.height + 1
                     ),
                     Write(title_text),
@@ -196,6 +748,9 @@ class BeamerSlide(MovingCameraScene, Slide):
 
 
 class SlideWithList(BeamerSlide):
+    # the vertical gap between the titles and the list (before it is scaled)
+    buffer_with_prev_object: float = 0.5
+
     def __init__(
         self,
         title: str,
@@ -203,7 +758,22 @@ class SlideWithList(BeamerSlide):
         beamer_list: BeamerList,
         width_buffer: float = 3.0,
         height_buffer: float = 1.0,
+        paginate: bool = False,
+        max_list_height: Union[None, float] = None,
     ):
+        """
+        Args:
+            title: The title of the slide.
+            subtitle: The subtitle of the slide, if any.
+            beamer_list: The list shown by the slide.
+            width_buffer: The horizontal buffer around the slide content.
+            height_buffer: The vertical buffer around the slide content.
+            paginate: Whether to split a list that does not fit in the frame into pages
+                (revealed one at a time with next_slide), rather than zooming out on it.
+            max_list_height: The maximum height of a page of the list; if None, the height
+                left beneath the title (and subtitle) in the frame, once it is fitted to the
+                page's width (see draw).
+        """
         super().__init__(
             title=title,
             subtitle=subtitle,
@@ -211,38 +781,148 @@ class SlideWithList(BeamerSlide):
             height_buffer=height_buffer,
         )
         self.beamer_list: BeamerList = beamer_list
+        self.paginate: bool = paginate
+        self.max_list_height: Union[None, float] = max_list_height
+        # the pages of the list (a single page, unless paginated), set by make_layout
+        self.pages: List[BeamerList] = [beamer_list]
+
+    def get_fingerprint_inputs(self) -> tuple:
+        return super().get_fingerprint_inputs() + (
+            self.beamer_list,
+            self.paginate,
+            self.max_list_height,
+        )
+
+    def add_tex_expressions(self, tex_batch: TexBatch) -> None:
+        self.beamer_list.add_tex_expressions(tex_batch)
+
+    def release(self) -> None:
+        self.pages = [self.beamer_list]
+        super().release()
 
     def construct(self):
         self.draw(ORIGIN, 1.0, target_scene=self)
 
+    def place_list(
+        self, beamer_list: BeamerList, titles: VGroup, scale: float
+    ) -> VGroup:
+        """
+        Construct the mobjects of a list (or page of a list) and position them beneath the
+        titles.
+
+        Args:
+            beamer_list: The list.
+            titles: The title (and subtitle) of the slide, in their final position.
+            scale: The scale factor to apply to the slide content.
+
+        Returns:
+            The list's mobjects.
+        """
+        list_group = beamer_list.get_list(scale_factor=scale)
+        list_group.scale(scale_factor=scale).next_to(
+            titles, DOWN, buff=self.buffer_with_prev_object * scale
+        )
+        return list_group
+
+    def fit_list_height(self, titles: VGroup, scale: float) -> float:
+        """
+        Get the maximum height of a page of the list: the frame is fitted to the page's width
+        (see draw), and the page beneath the titles must fit in its height. As every page
+        is at least as wide as the titles and as its narrowest item, the frame is at least
+        as tall as it is when fitted to that width. The items are measured without
+        constructing them (see BeamerList.measure_items).
+
+        Args:
+            titles: The title (and subtitle) of the slide, in their final position.
+            scale: The scale factor to apply to the slide content.
+
+        Returns:
+            The maximum height of a page (before the list is scaled).
+        """
+        sizes = self.beamer_list.measure_items(scale_factor=scale)
+        min_item_width = min((size[0] for size in sizes), default=0.0)
+        page_width = max(titles.width, min_item_width * scale)
+        frame_height = self.get_frame_height(page_width + 2)
+        available_height = frame_height - 2 * self.height_buffer - titles.height
+        return available_height / scale - self.buffer_with_prev_object
+
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        content: VGroup = super().make_layout(origin, scale)
+        if self.paginate:
+            max_list_height = self.max_list_height
+            if max_list_height is None:
+                max_list_height = self.fit_list_height(content, scale)
+            self.pages = self.beamer_list.paginate(max_list_height, scale_factor=scale)
+        else:
+            self.pages = [self.beamer_list]
+        # only the first page is part of the layout, the others are constructed when drawn
+        content.add(self.place_list(self.pages[0], content, scale))
+        return content
+
+    @traced()
     def draw(
         self, origin, scale: float, target_scene: Union[None, Slide], animate=True
     ) -> VGroup:
         if target_scene is None:
             target_scene = self
-        content: VGroup = self.inner_draw(origin, scale, target_scene=target_scene)
-        # create the list object
-        list_group = self.beamer_list.get_list(scale_factor=scale)
-        buffer_with_prev_object = 0.5
-        list_group.scale(scale_factor=scale).next_to(
-            content, DOWN, buff=buffer_with_prev_object * scale
+        content: VGroup = self.inner_draw(
+            origin, scale, target_scene=target_scene, animate=animate
         )
-        content.add(list_group)
+        list_group = content[-1]
         if animate:
-            target_scene.play(
-                Create(list_group),
-                self.camera.frame.animate.move_to(content.get_center()).set(
-                    width=content.width + 2,  # height=all_content.height + 2
-                ),
-            )
-            target_scene.wait(2)
-            target_scene.next_slide()
+            titles = VGroup(*content[: self.num_of_title_objects]).copy()
+            for index, page in enumerate(self.pages):
+                if index > 0:
+                    target_scene.play(FadeOut(list_group))
+                    # the page is constructed only now that it is shown
+                    with using_theme(self.theme):
+                        list_group = self.place_list(page, titles, scale)
+                page_content = VGroup(*titles, list_group)
+                target_scene.play(
+                    Create(list_group),
+                    target_scene.camera.frame.animate.move_to(
+                        page_content.get_center()
+                    ).set(
+                        width=page_content.width + 2,  # height=all_content.height + 2
+                    ),
+                )
+                target_scene.wait(2)
+                target_scene.next_slide()
             target_scene.wait(2)
         else:
             target_scene.add(list_group)
         return content
 
 
+def themed_table(table: Table, theme: Union[None, Theme] = None) -> Table:
+    """
+    Apply a theme to the table: its lines and entries are painted in the theme's foreground
+    color with one vectorized assignment (see manim_beamer.theme.paint), rather than one
+    set_color call per entry.
+
+    Args:
+        table: A manim Table object.
+        theme: The theme; if None, the current theme is used.
+
+    Returns:
+        The table with the theme applied.
+    """
+    if theme is None:
+        theme = get_theme()
+    table.get_col_labels().set_weight("bold")
+    # make lines & text the foreground color
+    paint(
+        VGroup(
+            table.get_horizontal_lines(),
+            table.get_vertical_lines(),
+            table.get_entries(),
+        ),
+        theme.foreground,
+    )
+    return table
+
+
 def light_themed_table(table: Table) -> Table:
     """
     Apply a light theme to the table.
@@ -253,13 +933,7 @@ def light_themed_table(table: Table) -> Table:
     Returns:
         The table with a light theme applied.
     """
-    # make lines & text black
-    table.get_col_labels().set_weight("bold")
-    table.get_horizontal_lines().set_color(BLACK)
-    table.get_vertical_lines().set_color(BLACK)
-    for entry in table.get_entries():
-        entry.set_color(BLACK)
-    return table
+    return themed_table(table, LIGHT_THEME)
 
 
 class SlideWithTable(BeamerSlide):
@@ -279,28 +953,66 @@ class SlideWithTable(BeamerSlide):
             width_buffer=width_buffer,
             height_buffer=height_buffer,
         )
-        self.table: Table = light_themed_table(table)
+        # the table is themed when first needed, see the table property
+        self._table: Table = table
+        self._table_is_themed: bool = False
         self.caption = caption
         self.highlighted_columns = highlighted_columns
 
+    @property
+    def table(self) -> Table:
+        """
+        The table, with the slide's theme applied (on first access, see themed_table).
+        """
+        if not self._table_is_themed:
+            themed_table(self._table, self.theme)
+            self._table_is_themed = True
+        return self._table
+
+    def get_fingerprint_inputs(self) -> tuple:
+        return super().get_fingerprint_inputs() + (
+            self.table,
+            self.caption,
+            self.highlighted_columns,
+        )
+
+    def get_themed_mobjects(self) -> list:
+        themed = [self._table] if self._table_is_themed else []
+        return super().get_themed_mobjects() + themed
+
+    def add_tex_expressions(self, tex_batch: TexBatch) -> None:
+        tex_batch.add_mobject(self.table)
+
     def construct(self):
         self.draw(ORIGIN, 1.0, target_scene=self)
 
-    def draw(
-        self, origin, scale: float, target_scene: Union[None, Slide], animate=True
-    ) -> VGroup:
-        if target_scene is None:
-            target_scene = self
-        content: VGroup = self.inner_draw(origin, scale, target_scene=target_scene)
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        content: VGroup = super().make_layout(origin, scale)
         buffer_with_prev_object = 0.5
         table = self.table.copy()
-        caption = Text(self.caption, color=BLACK).scale(0.5)
+        caption = text_factory.text(self.caption, color=get_theme().foreground).scale(
+            0.5
+        )
         caption.next_to(table, DOWN, buff=0.5)
         captioned_table = VGroup(table, caption)
         captioned_table.scale(scale_factor=scale).next_to(
             content, DOWN, buff=buffer_with_prev_object * scale
         )
         content.add(captioned_table)
+        return content
+
+    @traced()
+    def draw(
+        self, origin, scale: float, target_scene: Union[None, Slide], animate=True
+    ) -> VGroup:
+        if target_scene is None:
+            target_scene = self
+        content: VGroup = self.inner_draw(
+            origin, scale, target_scene=target_scene, animate=animate
+        )
+        captioned_table = content[-1]
+        table = captioned_table[0]
         if animate:
             target_scene.play(
                 Write(captioned_table),
@@ -314,7 +1026,7 @@ class SlideWithTable(BeamerSlide):
                 animations.append(
                     Circumscribe(
                         table.get_columns()[col_idx],
-                        color=MANIM_BLUE,
+                        color=self.theme.accent,
                         stroke_width=15 * scale,
                         run_time=1,
                     ),
@@ -329,6 +1041,204 @@ class SlideWithTable(BeamerSlide):
         return content
 
 
+class SlideWithPaginatedTable(BeamerSlide):
+    """
+    A slide that shows a large table from its raw rows: the rows are split across pages (one
+    next_slide step each), and only the cells of the rows on a page are ever constructed
+    (each page once the previous one has been shown).
+    """
+
+    # the number of rows of the sample table that fit_rows_per_page measures
+    num_of_sample_rows: int = 5
+
+    def __init__(
+        self,
+        title: str,
+        subtitle: Union[None, str],
+        rows: Sequence[Sequence[str]],
+        col_labels: Sequence[str],
+        caption: str,
+        highlighted_columns: List[int],
+        rows_per_page: Union[None, int] = None,
+        table_kwargs: Union[None, dict] = None,
+        width_buffer: float = 3.0,
+        height_buffer: float = 1.0,
+    ):
+        """
+        Args:
+            title: The title of the slide.
+            subtitle: The subtitle of the slide, if any.
+            rows: The rows of the table, each a sequence of cell strings.
+            col_labels: The column labels, repeated on every page.
+            caption: The caption of the table; the page number is appended to it.
+            highlighted_columns: The indices of the columns to highlight on every page.
+            rows_per_page: The maximum number of rows on a page; if None, as many as fit in
+                the frame (see fit_rows_per_page).
+            table_kwargs: Additional keyword arguments for the manim Table of each page.
+            width_buffer: The horizontal buffer around the slide content.
+            height_buffer: The vertical buffer around the slide content.
+        """
+        super().__init__(
+            title=title,
+            subtitle=subtitle,
+            width_buffer=width_buffer,
+            height_buffer=height_buffer,
+        )
+        self.rows: List[List[str]] = [[str(cell) for cell in row] for row in rows]
+        self.col_labels: List[str] = list(col_labels)
+        self.caption = caption
+        self.highlighted_columns = highlighted_columns
+        self.rows_per_page: Union[None, int] = rows_per_page
+        self.table_kwargs: dict = {} if table_kwargs is None else table_kwargs
+        # the number of rows on a page, fitted to the frame by make_layout (if not given)
+        self.page_size: int = 10 if rows_per_page is None else rows_per_page
+
+    @property
+    def num_of_pages(self) -> int:
+        return max(1, -(-len(self.rows) // self.page_size))
+
+    def get_fingerprint_inputs(self) -> tuple:
+        return super().get_fingerprint_inputs() + (
+            self.rows,
+            self.col_labels,
+            self.caption,
+            self.highlighted_columns,
+            self.rows_per_page,
+            self.table_kwargs,
+        )
+
+    def construct(self):
+        self.draw(ORIGIN, 1.0, target_scene=self)
+
+    @traced()
+    def make_page(self, page: int, titles: VGroup, scale: float) -> VGroup:
+        """
+        Construct the captioned table of one page, positioned beneath the titles.
+
+        Args:
+            page: The index of the page.
+            titles: The title (and subtitle) of the slide, in their final position.
+            scale: The scale factor to apply to the slide content.
+
+        Returns:
+            The table and its caption.
+        """
+        start = page * self.page_size
+        return self.make_captioned_table(
+            self.rows[start : start + self.page_size], page, titles, scale
+        )
+
+    def make_captioned_table(
+        self, rows: List[List[str]], page: int, titles: VGroup, scale: float
+    ) -> VGroup:
+        table = themed_table(
+            Table(
+                rows,
+                col_labels=[
+                    text_factory.text(label, color=self.theme.foreground)
+                    for label in self.col_labels
+                ],
+                **self.table_kwargs,
+            ),
+            self.theme,
+        )
+        caption_str = self.caption
+        if self.num_of_pages > 1:
+            caption_str += f" ({page + 1}/{self.num_of_pages})"
+        caption = text_factory.text(caption_str, color=self.theme.foreground).scale(0.5)
+        caption.next_to(table, DOWN, buff=0.5)
+        captioned_table = VGroup(table, caption)
+        buffer_with_prev_object = 0.5
+        captioned_table.scale(scale_factor=scale).next_to(
+            titles, DOWN, buff=buffer_with_prev_object * scale
+        )
+        return captioned_table
+
+    @traced()
+    def fit_rows_per_page(self, titles: VGroup, scale: float) -> int:
+        """
+        Estimate how many rows fit on a page: the frame is fitted to the page's width (see
+        draw), and the rows beneath the titles must fit in its height. The width and the row
+        height are measured on a sample table of the first few rows.
+
+        Args:
+            titles: The title (and subtitle) of the slide, in their final position.
+            scale: The scale factor to apply to the slide content.
+
+        Returns:
+            The number of rows on a page (at least 1).
+        """
+        sample_rows = self.rows[: self.num_of_sample_rows]
+        if len(sample_rows) == 0:
+            return 1
+        sample = self.make_captioned_table(sample_rows, 0, titles, scale)
+        page_content = VGroup(*titles, sample)
+        frame_height = self.get_frame_height(page_content.width + self.width_buffer)
+        # the height of a row, and that of everything but the rows (titles, labels, caption)
+        row_height = sample[0].height / (len(sample_rows) + 1)
+        other_height = page_content.height - row_height * len(sample_rows)
+        available_height = frame_height - self.height_buffer - other_height
+        return max(1, int(available_height // row_height))
+
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        content: VGroup = super().make_layout(origin, scale)
+        if self.rows_per_page is None:
+            self.page_size = self.fit_rows_per_page(content.copy(), scale)
+        # only the first page is part of the layout, the others are constructed when drawn
+        content.add(self.make_page(0, content.copy(), scale))
+        return content
+
+    def highlight_columns(self, table: Table, scale: float, target_scene) -> None:
+        animations = [
+            Circumscribe(
+                table.get_columns()[col_idx],
+                color=self.theme.accent,
+                stroke_width=15 * scale,
+                run_time=1,
+            )
+            for col_idx in self.highlighted_columns
+        ]
+        if len(animations) > 0:
+            target_scene.wait(1)
+            target_scene.next_slide(loop=True)
+            target_scene.play(AnimationGroup(*animations))
+
+    @traced()
+    def draw(
+        self, origin, scale: float, target_scene: Union[None, Slide], animate=True
+    ) -> VGroup:
+        if target_scene is None:
+            target_scene = self
+        content: VGroup = self.inner_draw(
+            origin, scale, target_scene=target_scene, animate=animate
+        )
+        titles = VGroup(*content[: self.num_of_title_objects]).copy()
+        if not animate:
+            target_scene.add(content)
+            return content
+
+        captioned_table = content[-1]
+        for page in range(self.num_of_pages):
+            if page > 0:
+                target_scene.wait(1)
+                target_scene.next_slide()
+                target_scene.play(FadeOut(captioned_table))
+                # the page is constructed only now that it is shown
+                with using_theme(self.theme):
+                    captioned_table = self.make_page(page, titles, scale)
+            page_content = VGroup(*titles, captioned_table)
+            target_scene.play(
+                Write(captioned_table),
+                target_scene.camera.frame.animate.move_to(
+                    page_content.get_center()
+                ).set(width=page_content.width + self.width_buffer),
+            )
+            self.highlight_columns(captioned_table[0], scale, target_scene)
+        target_scene.wait(1)
+        return content
+
+
 class SlideWithTables(BeamerSlide):
     """
     A slide that shows multiple tables side by side.
@@ -353,34 +1263,55 @@ class SlideWithTables(BeamerSlide):
             width_buffer=width_buffer,
             height_buffer=height_buffer,
         )
-        self.tables: List[Table] = []
-        for table in tables:
-            self.tables.append(light_themed_table(table))
+        # the tables are themed when first needed, see the tables property
+        self._tables: List[Table] = list(tables)
+        self._tables_are_themed: bool = False
         self.captions = captions
         self.highlighted_columns = highlighted_columns
 
+    def get_fingerprint_inputs(self) -> tuple:
+        return super().get_fingerprint_inputs() + (
+            self.tables,
+            self.captions,
+            self.highlighted_columns,
+        )
+
+    @property
+    def tables(self) -> List[Table]:
+        """
+        The tables, with the slide's theme applied (on first access, see themed_table).
+        """
+        if not self._tables_are_themed:
+            for table in self._tables:
+                themed_table(table, self.theme)
+            self._tables_are_themed = True
+        return self._tables
+
+    def get_themed_mobjects(self) -> list:
+        themed = self._tables if self._tables_are_themed else []
+        return super().get_themed_mobjects() + themed
+
+    def add_tex_expressions(self, tex_batch: TexBatch) -> None:
+        for table in self.tables:
+            tex_batch.add_mobject(table)
+
     def construct(self):
         self.draw(ORIGIN, 1.0, target_scene=self)
 
-    def draw(
-        self, origin, scale: float, target_scene: Union[None, Slide], animate=True
-    ) -> VGroup:
-        if target_scene is None:
-            target_scene = self
-        content: VGroup = self.inner_draw(origin, scale, target_scene=target_scene)
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        content: VGroup = super().make_layout(origin, scale)
         len_of_titles = len(content)
         buffer_with_prev_object = 0.5
-        captioned_tables: List[VGroup] = []
         prev_table = None
         for caption, table in zip(self.captions, self.tables):
             table_copy = table.copy()
-            caption_text = Text(caption, color=BLACK)
+            caption_text = text_factory.text(caption, color=get_theme().foreground)
             caption_text.next_to(table_copy, DOWN, buff=0.5)
             captioned_table = VGroup(table_copy, caption_text)
             captioned_table.scale(scale_factor=scale).next_to(
                 content, DOWN, buff=buffer_with_prev_object * scale
             )
-            captioned_tables.append(captioned_table)
             if prev_table is not None:
                 captioned_table.next_to(prev_table, RIGHT)
             content.add(captioned_table)
@@ -390,6 +1321,18 @@ class SlideWithTables(BeamerSlide):
         content[len_of_titles:].next_to(
             content[:len_of_titles], DOWN, buff=buffer_with_prev_object * scale
         )
+        return content
+
+    @traced()
+    def draw(
+        self, origin, scale: float, target_scene: Union[None, Slide], animate=True
+    ) -> VGroup:
+        if target_scene is None:
+            target_scene = self
+        content: VGroup = self.inner_draw(
+            origin, scale, target_scene=target_scene, animate=animate
+        )
+        captioned_tables: List[VGroup] = list(content[self.num_of_title_objects :])
 
         if animate:
             target_scene.play(
@@ -405,7 +1348,7 @@ class SlideWithTables(BeamerSlide):
             # for col_idx in self.highlighted_columns:
             #     animations.append(
             #         Circumscribe(
-            #             table.get_columns()[col_idx], color=MANIM_BLUE,
+            #             table.get_columns()[col_idx], color=self.theme.accent,
             #             stroke_width=15 * scale, run_time=1
             #         ),
             #     )
@@ -436,33 +1379,68 @@ class SlideWithBlocks(BeamerSlide):
         )
         self.blocks: List[Type[Block]] = blocks
 
+    def get_fingerprint_inputs(self) -> tuple:
+        return super().get_fingerprint_inputs() + (self.blocks,)
+
+    def get_themed_mobjects(self) -> list:
+        return super().get_themed_mobjects() + [
+            block for block in self.blocks if not isinstance(block, Block)
+        ]
+
+    def recolor(self, theme: Theme) -> None:
+        for block in self.blocks:
+            if isinstance(block, Block):
+                block.recolor(theme, self.theme)
+        super().recolor(theme)
+
+    def release(self) -> None:
+        for block in self.blocks:
+            if isinstance(block, Block):
+                block.release()
+        super().release()
+
+    def add_tex_expressions(self, tex_batch: TexBatch) -> None:
+        for block in self.blocks:
+            if isinstance(block, Block):
+                block.add_tex_expressions(tex_batch)
+            else:
+                tex_batch.add_mobject(block)
+
+    @traced()
     def make_block_and_focus(
         self,
-        block: Block,
-        scale: float,
-        below: Union[None, Text, Block],
+        block_vgroup: VGroup,
         target_scene: Union[None, Slide],
         animate=True,
     ):
+        """
+        Draw a block that has already been laid out (see Block.get_animation with
+        animate=False) and, if animated, focus the camera on it.
+
+        Args:
+            block_vgroup: The block's background and text group, in their final position.
+            target_scene: The scene to draw the block on. If None, the current scene is used.
+            animate: Whether to animate the drawing of the block.
+        """
         if target_scene is None:
             target_scene = self
+        block_background, text_group = block_vgroup[0], block_vgroup[1]
         if animate:
             target_scene.play(
-                block.get_animation(scale_factor=scale, below=below, animate=animate),
+                LaggedStart(
+                    Create(block_background),
+                    Create(text_group),
+                ),
                 target_scene.camera.frame.animate.move_to(
-                    block.block_background.get_center()
+                    block_background.get_center()
                 ).set(
-                    width=block.block_background.width + self.width_buffer,
-                    # height=block.block_background.height + 3
+                    width=block_background.width + self.width_buffer,
+                    # height=block_background.height + 3
                 ),
             )
         else:
-            # this returns a VGroup instead of an animation and then adds it to the scene
-            block_vgroup: VGroup = block.get_animation(
-                scale_factor=scale, below=below, animate=animate
-            )
-            target_scene.add(block_vgroup[0])  # add the background first
-            target_scene.add(block_vgroup[1])  # add the text group
+            target_scene.add(block_background)  # add the background first
+            target_scene.add(text_group)  # add the text group
 
     def construct(self):
         animate = True
@@ -470,26 +1448,19 @@ class SlideWithBlocks(BeamerSlide):
         if not animate:
             self.play(self.camera.frame.animate.move_to(ORIGIN))
 
-    def draw(self, origin, scale, target_scene: Union[None, Slide], animate=True):
-        if target_scene is None:
-            target_scene = self
-        content: VGroup = self.inner_draw(
-            origin, scale, target_scene=target_scene, animate=animate
-        )
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        content: VGroup = super().make_layout(origin, scale)
         m_object_to_be_below = content
-        # iterate over the blocks and create them
+        # iterate over the blocks and position them
         for block in self.blocks:
-            # for block in content[1:]:
             if isinstance(block, Block):
-                self.make_block_and_focus(
-                    block,
-                    scale=scale,
-                    below=m_object_to_be_below,
-                    target_scene=target_scene,
-                    animate=animate,
+                # this returns a VGroup instead of an animation
+                block_vgroup: VGroup = block.get_animation(
+                    scale_factor=scale, below=m_object_to_be_below, animate=False
                 )
-                content.add(block.get_vgroup())
-                m_object_to_be_below = block.block_background
+                content.add(block_vgroup)
+                m_object_to_be_below = block_vgroup[0]  # the block background
             elif (
                 isinstance(block, Text)
                 or isinstance(block, MathTex)
@@ -498,16 +1469,32 @@ class SlideWithBlocks(BeamerSlide):
                 block.scale(scale_factor=scale).next_to(
                     m_object_to_be_below, DOWN, buff=0.5
                 )
-                if animate:
-                    target_scene.play(Write(block))
-                    target_scene.wait(1)
-                else:
-                    target_scene.add(block)
                 content.add(block)
                 m_object_to_be_below = block
             else:
                 # raise an error if the block is not a 'Block' object
                 raise ValueError("Invalid block type. Must be a 'Block' object")
+        return content
+
+    @traced()
+    def draw(self, origin, scale, target_scene: Union[None, Slide], animate=True):
+        if target_scene is None:
+            target_scene = self
+        content: VGroup = self.inner_draw(
+            origin, scale, target_scene=target_scene, animate=animate
+        )
+        # iterate over the (already positioned) blocks and draw them
+        for block, m_object in zip(self.blocks, content[self.num_of_title_objects :]):
+            if isinstance(block, Block):
+                self.make_block_and_focus(
+                    m_object, target_scene=target_scene, animate=animate
+                )
+            else:
+                if animate:
+                    target_scene.play(Write(m_object))
+                    target_scene.wait(1)
+                else:
+                    target_scene.add(m_object)
             if animate:
                 target_scene.wait(1)
                 target_scene.next_slide()
@@ -520,6 +1507,177 @@ class SlideWithBlocks(BeamerSlide):
                 )
             )
             target_scene.wait(3)
+        return content
+
+
+class SlideWithReferences(BeamerSlide):
+    """
+    A bibliography slide: the entries cited (with BibTexManager.slide_short_cite) by the deck
+    are sorted, de-duplicated and laid out in columns, over as many pages (one next_slide
+    step each) as needed. Every column is a single Text, so the bibliography is rendered with
+    a few Text objects rather than one per entry.
+    """
+
+    def __init__(
+        self,
+        bib_manager: BibTexManager,
+        title: str = "References",
+        subtitle: Union[None, str] = None,
+        num_of_columns: int = 2,
+        lines_per_column: int = 24,
+        num_of_words: int = 8,
+        column_width: Union[None, float] = 6.0,
+        font_size: float = 20,
+        width_buffer: float = 3.0,
+        height_buffer: float = 1.0,
+    ):
+        """
+        Args:
+            bib_manager: The BibTexManager whose cited entries are listed. The entries are
+                collected when the slide is laid out, so it may be created before the slides
+                that cite them.
+            title: The title of the slide.
+            subtitle: The subtitle of the slide, if any.
+            num_of_columns: The number of columns per page.
+            lines_per_column: The maximum number of lines of a column.
+            num_of_words: The number of words to wrap the titles of the entries by, if no
+                column_width is given.
+            column_width: The maximum width of a column (before the slide is scaled); the
+                entries are wrapped to it (see manim_beamer.text_metrics).
+            font_size: The font size of the entries.
+            width_buffer: The horizontal buffer around the slide content.
+            height_buffer: The vertical buffer around the slide content.
+        """
+        super().__init__(
+            title=title,
+            subtitle=subtitle,
+            width_buffer=width_buffer,
+            height_buffer=height_buffer,
+        )
+        self.bib_manager: BibTexManager = bib_manager
+        self.num_of_columns: int = num_of_columns
+        self.lines_per_column: int = lines_per_column
+        self.num_of_words: int = num_of_words
+        self.column_width: Union[None, float] = column_width
+        self.font_size: float = font_size
+        # the columns (strings) of every page, set by make_layout
+        self.pages: List[List[str]] = []
+
+    def get_fingerprint_inputs(self) -> tuple:
+        return super().get_fingerprint_inputs() + (
+            self.get_references(),
+            self.column_width,
+            self.num_of_columns,
+            self.lines_per_column,
+            self.font_size,
+        )
+
+    def construct(self):
+        self.draw(ORIGIN, 1.0, target_scene=self)
+
+    def release(self) -> None:
+        self.pages = []
+        super().release()
+
+    def get_references(self) -> List[str]:
+        return self.bib_manager.get_references(
+            num_of_words=self.num_of_words,
+            max_width=self.column_width,
+            font_size=self.font_size,
+        )
+
+    def get_pages(self) -> List[List[str]]:
+        """
+        Split the references into columns of at most lines_per_column lines (an entry is
+        never split), and the columns into pages.
+
+        Returns:
+            The columns of every page; each column is a string of blank-line separated entries.
+        """
+        columns: List[List[str]] = []
+        num_of_lines: int = 0
+        for reference in self.get_references():
+            height = reference.count("\n") + 1
+            if len(columns) == 0 or num_of_lines + 1 + height > self.lines_per_column:
+                columns.append([reference])
+                num_of_lines = height
+            else:
+                columns[-1].append(reference)
+                num_of_lines += 1 + height  # with a blank line between the entries
+        column_strs = ["\n\n".join(column) for column in columns]
+        return [
+            column_strs[index : index + self.num_of_columns]
+            for index in range(0, len(column_strs), self.num_of_columns)
+        ]
+
+    @traced()
+    def make_page(self, columns: List[str], titles: VGroup, scale: float) -> VGroup:
+        """
+        Construct the columns of one page and position them beneath the titles.
+
+        Args:
+            columns: The columns of the page, see get_pages.
+            titles: The title (and subtitle) of the slide, in their final position.
+            scale: The scale factor to apply to the slide content.
+
+        Returns:
+            The columns' Text objects.
+        """
+        page = VGroup(
+            *[
+                text_factory.text(
+                    column, color=self.theme.foreground, font_size=self.font_size
+                )
+                for column in columns
+            ]
+        ).arrange(RIGHT, aligned_edge=UP, buff=1.0)
+        buffer_with_prev_object = 0.5
+        page.scale(scale_factor=scale).next_to(
+            titles, DOWN, buff=buffer_with_prev_object * scale
+        )
+        return page
+
+    @traced()
+    def make_layout(self, origin, scale: float) -> VGroup:
+        content: VGroup = super().make_layout(origin, scale)
+        self.pages = self.get_pages()
+        # only the first page is part of the layout, the others are constructed when drawn
+        if len(self.pages) > 0:
+            content.add(self.make_page(self.pages[0], content, scale))
+        return content
+
+    @traced()
+    def draw(
+        self, origin, scale: float, target_scene: Union[None, Slide], animate=True
+    ) -> VGroup:
+        if target_scene is None:
+            target_scene = self
+        content: VGroup = self.inner_draw(
+            origin, scale, target_scene=target_scene, animate=animate
+        )
+        if len(self.pages) == 0:
+            return content
+        page_group = content[-1]
+        if not animate:
+            target_scene.add(page_group)
+            return content
+
+        titles = VGroup(*content[: self.num_of_title_objects]).copy()
+        for index, columns in enumerate(self.pages):
+            if index > 0:
+                target_scene.play(FadeOut(page_group))
+                # the page is constructed only now that it is shown
+                page_group = self.make_page(columns, titles, scale)
+            page_content = VGroup(*titles, page_group)
+            target_scene.play(
+                Write(page_group),
+                target_scene.camera.frame.animate.move_to(
+                    page_content.get_center()
+                ).set(width=page_content.width + self.width_buffer),
+            )
+            target_scene.wait(2)
+            target_scene.next_slide()
+        return content
 
 
 class SlideDiagram(Slide):
@@ -528,11 +1686,42 @@ class SlideDiagram(Slide):
         self.path = path
         self.caption = caption
         self.original_image_scale = original_image_scale
-        self.captioned_jpg: CaptionedJPG = self.get_diagram()
+        # the captioned image (a scene of its own) is created when first drawn
+        self._captioned_jpg: Union[None, CaptionedJPG] = None
+
+    @property
+    def captioned_jpg(self) -> CaptionedJPG:
+        """
+        The captioned image (created on first access).
+        """
+        if self._captioned_jpg is None:
+            self._captioned_jpg = self.get_diagram()
+        return self._captioned_jpg
 
     def construct(self, origin=ORIGIN, scale=1.0):
         self.draw(origin, scale, target_scene=self)
 
+    def get_fingerprint_inputs(self) -> tuple:
+        return (Path(self.path), self.caption, self.original_image_scale)
+
+    def fingerprint(self) -> str:
+        """
+        Get a stable fingerprint of everything that determines how the slide is drawn
+        (including the contents of the image file).
+
+        Returns:
+            The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            type(self).__name__,
+            self.get_fingerprint_inputs(),
+            config.background_color,
+        )
+
+    def get_prefetch_tasks(self) -> List[Callable[[], object]]:
+        return self.captioned_jpg.get_prefetch_tasks()
+
+    @traced()
     def draw(self, origin, scale, target_scene=None, animate=True):
         self.captioned_jpg.draw(
             origin, scale, target_scene=target_scene, animate=animate
@@ -0,0 +1,130 @@
+"""
+Implements a memoized factory for the Text objects (and other small prototypes, such as list
+item markers) created by manim-beamer, so that identical strings are only rendered (through
+Pango) once per session.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Union, Tuple
+
+from manim import (
+    Text,
+    ManimColor,
+    NORMAL,
+    DEFAULT_FONT_SIZE,
+    VMobject,
+)
+
+from manim_beamer.tracing import tracer
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TextFactory:
+    """
+    The TextFactory creates Text objects (and other small prototypes, see get) and keeps the
+    most recently used ones in a size-bounded (least recently used) cache. Every request
+    returns a copy of the cached object, so callers are free to move, scale or recolor what
+    they are given.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Create a factory whose cache holds at most maxsize objects.
+
+        Args:
+            maxsize: The maximum number of objects kept in the cache.
+        """
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: OrderedDict = OrderedDict()
+        # slides may construct their next page in a background thread, see SlideWithPaginatedTable
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def color_key(color) -> Union[None, str]:
+        """
+        Convert a color to a hashable representation that is suitable for a cache key.
+
+        Args:
+            color: A color (e.g., a ManimColor or a hex string) or None.
+
+        Returns:
+            The hex representation of the color, or None if no color was given.
+        """
+        return None if color is None else ManimColor(color).to_hex()
+
+    def get(self, key: Tuple, constructor) -> VMobject:
+        """
+        Get a copy of the object cached under the given key, constructing it if necessary.
+
+        Args:
+            key: The cache key.
+            constructor: A callable (without arguments) that constructs the object.
+
+        Returns:
+            A copy of the cached object.
+        """
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+            else:
+                self.misses += 1
+                with tracer.span(f"TextFactory.{key[0]}", text=str(key[1])):
+                    self._cache[key] = constructor()
+                if len(self._cache) > self.maxsize:
+                    # evict the least recently used object
+                    self._cache.popitem(last=False)
+            return self._cache[key].copy()
+
+    def text(
+        self,
+        text: str,
+        font: str = "",
+        font_size: float = DEFAULT_FONT_SIZE,
+        color=None,
+        weight: str = NORMAL,
+        slant: str = NORMAL,
+    ) -> Text:
+        """
+        Get a Text object; the arguments have the same meaning as for manim's Text.
+
+        Returns:
+            A (copy of a cached) Text object.
+        """
+        key = ("Text", text, font, font_size, self.color_key(color), weight, slant)
+        return self.get(
+            key,
+            lambda: Text(
+                text,
+                font=font,
+                font_size=font_size,
+                color=color,
+                weight=weight,
+                slant=slant,
+            ),
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report the cache statistics, in the same format as functools.lru_cache.
+
+        Returns:
+            The number of hits and misses, the maximum size and the current size of the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Empty the cache and reset its statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+# the factory shared by all of manim-beamer's components
+text_factory: TextFactory = TextFactory()
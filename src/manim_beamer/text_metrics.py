@@ -0,0 +1,282 @@
+"""
+Implements the measurement of text without constructing Text objects: the advance (width) and
+the vertical extent of every printable ASCII character, as well as the distance between two
+lines, are measured once per font (from a single Pango render), kept in memory and in an
+on-disk cache. The width of a string is then the sum of the advances of its characters, and
+its height follows from the extents of its characters and its number of lines. Text can thus
+be wrapped to a width in one pass, rather than by rendering it, checking its width and
+rendering it again, and its height is known before it is rendered.
+"""
+
+import json
+import hashlib
+import threading
+import unicodedata
+from typing import Dict, List, Tuple
+
+from manim import Text, NORMAL, DEFAULT_FONT_SIZE
+
+from manim_beamer.cache import atomic_write, get_cache_dir
+
+# bump this whenever a change alters the measured advances
+METRICS_VERSION: int = 2
+
+# the characters whose advances are measured (the printable ASCII characters)
+SAMPLE_CHARS: str = "".join(chr(code) for code in range(32, 127))
+
+# the font size the advances are measured (and stored) at; they scale linearly with it
+REFERENCE_FONT_SIZE: float = 48.0
+
+# the number of sample characters per line of the measurement render
+SAMPLE_LINE_LENGTH: int = 16
+
+
+def measure_font(font: str, weight: str, slant: str) -> dict:
+    """
+    Measure the advance and vertical extent of every sample character with a single Text
+    render. Every character is placed between two "H"s: the distance between the left edges
+    of those "H"s is the advance of the character plus that of an "H" (which is measured from
+    a leading "HH"), no matter how the glyphs are drawn within their advance. The bottom of
+    an "H" is on the baseline, from which the top and bottom of every glyph are measured;
+    the distance between the baselines of two lines is the line pitch.
+
+    Args:
+        font: The font, as for manim's Text.
+        weight: The weight, as for manim's Text.
+        slant: The slant, as for manim's Text.
+
+    Returns:
+        The "advances", "tops" and "bottoms" of the sample characters (the whitespace
+        characters have no extent), and the "line_pitch", at the reference font size (in
+        scene units).
+    """
+    lines = [
+        SAMPLE_CHARS[index : index + SAMPLE_LINE_LENGTH]
+        for index in range(0, len(SAMPLE_CHARS), SAMPLE_LINE_LENGTH)
+    ]
+    sample = "\n".join("HH" + "".join(char + "H" for char in line) for line in lines)
+    text = Text(
+        sample,
+        font=font,
+        font_size=REFERENCE_FONT_SIZE,
+        weight=weight,
+        slant=slant,
+    )
+    # the whitespace characters have no glyph (and no ligatures form between "H"s)
+    glyphs = text.submobjects
+    if len(glyphs) != len(sample) - sum(char.isspace() for char in sample):
+        raise ValueError(
+            f"Cannot measure the font {font!r}: the render has {len(glyphs)} glyphs"
+        )
+    lefts = [glyph.get_left()[0] for glyph in glyphs]
+
+    advances: Dict[str, float] = {}
+    tops: Dict[str, float] = {}
+    bottoms: Dict[str, float] = {}
+    baselines: List[float] = []
+    index = 0  # the index of the current glyph
+    for line in lines:
+        h_advance = lefts[index + 1] - lefts[index]
+        baseline = glyphs[index].get_bottom()[1]
+        baselines.append(baseline)
+        previous_h = index + 1
+        index += 2
+        for char in line:
+            if not char.isspace():
+                tops[char] = glyphs[index].get_top()[1] - baseline
+                bottoms[char] = glyphs[index].get_bottom()[1] - baseline
+                index += 1
+            advances[char] = lefts[index] - lefts[previous_h] - h_advance
+            previous_h = index
+            index += 1
+    return {
+        "advances": advances,
+        "tops": tops,
+        "bottoms": bottoms,
+        "line_pitch": (baselines[0] - baselines[-1]) / (len(baselines) - 1),
+    }
+
+
+class TextMetrics:
+    """
+    The TextMetrics measures the width and height of strings (as Text objects would have)
+    from cached tables of character metrics, one per font, weight and slant.
+    """
+
+    def __init__(self):
+        self._tables: Dict[Tuple[str, str, str], dict] = {}
+        # slides may be prepared in a background thread, see TextFactory
+        self._lock = threading.Lock()
+
+    def get_font_metrics(
+        self, font: str = "", weight: str = NORMAL, slant: str = NORMAL
+    ) -> dict:
+        """
+        Get the metrics of a font (see measure_font), measuring them only if they are neither
+        in memory nor in the on-disk cache.
+
+        Args:
+            font: The font, as for manim's Text.
+            weight: The weight, as for manim's Text.
+            slant: The slant, as for manim's Text.
+
+        Returns:
+            The metrics, at the reference font size.
+        """
+        key = (font, weight, slant)
+        with self._lock:
+            if key not in self._tables:
+                digest = hashlib.sha256(
+                    f"{METRICS_VERSION}:{font}:{weight}:{slant}".encode()
+                ).hexdigest()
+                cache_path = get_cache_dir("metrics") / f"{digest[:32]}.json"
+                if cache_path.exists():
+                    table = json.loads(cache_path.read_text(encoding="utf-8"))
+                else:
+                    table = measure_font(font, weight, slant)
+                    with atomic_write(cache_path, "w") as file:
+                        json.dump(table, file)
+                self._tables[key] = table
+            return self._tables[key]
+
+    def get_advances(
+        self, font: str = "", weight: str = NORMAL, slant: str = NORMAL
+    ) -> Dict[str, float]:
+        """
+        Get the advances of the sample characters of a font.
+
+        Args:
+            font: The font, as for manim's Text.
+            weight: The weight, as for manim's Text.
+            slant: The slant, as for manim's Text.
+
+        Returns:
+            The advance of every sample character, at the reference font size.
+        """
+        return self.get_font_metrics(font, weight, slant)["advances"]
+
+    @staticmethod
+    def get_advance(advances: Dict[str, float], char: str) -> float:
+        """
+        Get the advance of a character; a character that was not measured is measured as its
+        base character (e.g., "e" for "é") or, failing that, as an "M".
+
+        Args:
+            advances: The advances of the sample characters.
+            char: The character.
+
+        Returns:
+            The advance of the character.
+        """
+        advance = advances.get(char, None)
+        if advance is None:
+            base = unicodedata.normalize("NFKD", char)[:1]
+            advance = advances.get(base, advances["M"])
+        return advance
+
+    def get_width(
+        self,
+        text: str,
+        font_size: float = DEFAULT_FONT_SIZE,
+        font: str = "",
+        weight: str = NORMAL,
+        slant: str = NORMAL,
+    ) -> float:
+        """
+        Get the width a Text object of the given string would have (that of its longest
+        line); the arguments have the same meaning as for manim's Text.
+
+        Returns:
+            The width, in scene units (before the Text is scaled).
+        """
+        advances = self.get_advances(font, weight, slant)
+        width = max(
+            sum(self.get_advance(advances, char) for char in line)
+            for line in text.split("\n")
+        )
+        return width * font_size / REFERENCE_FONT_SIZE
+
+    def get_height(
+        self,
+        text: str,
+        font_size: float = DEFAULT_FONT_SIZE,
+        font: str = "",
+        weight: str = NORMAL,
+        slant: str = NORMAL,
+    ) -> float:
+        """
+        Get the height a Text object of the given string would have (from the top of its
+        highest glyph to the bottom of its lowest one); the arguments have the same meaning
+        as for manim's Text. A character that was not measured is assumed to be as tall and
+        as deep as the tallest and deepest sample characters.
+
+        Returns:
+            The height, in scene units (before the Text is scaled).
+        """
+        metrics = self.get_font_metrics(font, weight, slant)
+        tops, bottoms = metrics["tops"], metrics["bottoms"]
+        max_top, min_bottom = max(tops.values()), min(bottoms.values())
+        line_tops: List[float] = []
+        line_bottoms: List[float] = []
+        for index, line in enumerate(text.split("\n")):
+            chars = [char for char in line if not char.isspace()]
+            if len(chars) == 0:
+                continue
+            # the baseline of the line, relative to that of the first line
+            baseline = -index * metrics["line_pitch"]
+            line_tops.append(baseline + max(tops.get(char, max_top) for char in chars))
+            line_bottoms.append(
+                baseline + min(bottoms.get(char, min_bottom) for char in chars)
+            )
+        if len(line_tops) == 0:
+            return 0.0  # only whitespace, which has no glyphs
+        return (max(line_tops) - min(line_bottoms)) * font_size / REFERENCE_FONT_SIZE
+
+    def wrap(
+        self,
+        text: str,
+        max_width: float,
+        font_size: float = DEFAULT_FONT_SIZE,
+        font: str = "",
+        weight: str = NORMAL,
+        slant: str = NORMAL,
+    ) -> str:
+        """
+        Wrap a string at its spaces, so that no line of a Text object of it is wider than
+        max_width (unless a single word is). Every word is measured once; existing line
+        breaks are kept.
+
+        Args:
+            text: The string.
+            max_width: The maximum width of a line, in scene units (before the Text is
+                scaled).
+            font_size: The font size, as for manim's Text.
+            font: The font, as for manim's Text.
+            weight: The weight, as for manim's Text.
+            slant: The slant, as for manim's Text.
+
+        Returns:
+            The wrapped string.
+        """
+        advances = self.get_advances(font, weight, slant)
+        max_width *= REFERENCE_FONT_SIZE / font_size  # compare at the reference size
+        space = self.get_advance(advances, " ")
+        lines: List[str] = []
+        for paragraph in text.split("\n"):
+            words: List[str] = []
+            line_width: float = 0.0
+            for word in paragraph.split():
+                word_width = sum(self.get_advance(advances, char) for char in word)
+                if len(words) > 0 and line_width + space + word_width > max_width:
+                    lines.append(" ".join(words))
+                    words, line_width = [], 0.0
+                if len(words) > 0:
+                    line_width += space
+                words.append(word)
+                line_width += word_width
+            lines.append(" ".join(words))
+        return "\n".join(lines)
+
+
+# the text metrics shared by all of manim-beamer's components
+text_metrics: TextMetrics = TextMetrics()
@@ -0,0 +1,274 @@
+"""
+Contains the constant colors and the themes (color palettes) of manim beamer.
+
+Nothing is configured at import time: apply_theme (or use_light_theme) is called explicitly, and
+SlideShow, BeamerSlide and PromptSlide apply the current theme when they are created. Mobjects
+that were constructed with one theme can be switched to another with Theme.recolor, which
+recolors whole mobject families with a few array operations (and without any re-layout).
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, astuple, replace
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+from manim import BLACK, WHITE, ManimColor, VMobject, config
+
+MANIM_BLUE = ManimColor("#58C4DD")
+
+light_theme_style = {
+    "fill_color": BLACK,
+    "background_stroke_color": WHITE,
+}
+
+# the color attributes of a VMobject, each holding one RGBA row per color (or gradient stop)
+RGBA_ATTRIBUTES = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+@dataclass(frozen=True)
+class Theme:
+    """
+    A color palette. Every color is a hex string, e.g., "#000000".
+    """
+
+    name: str
+    background: str  # the background of the slides
+    foreground: str  # text, list markers and table lines
+    accent: str  # highlights, e.g., the circumscribed table columns
+    citation: str  # the citations within lists (see BibTexManager.slide_short_cite)
+    remark_block: Tuple[str, str]  # the foreground and background of RemarkBlock
+    example_block: Tuple[str, str]  # the foreground and background of ExampleBlock
+    alert_block: Tuple[str, str]  # the foreground and background of AlertBlock
+
+    def get_fingerprint_inputs(self) -> tuple:
+        return astuple(self)
+
+    def get_color_roles(self) -> Dict[str, str]:
+        """
+        Get every color of the theme, keyed by its role (e.g., "foreground" or
+        "alert_block.background").
+
+        Returns:
+            The colors of the theme.
+        """
+        roles = {
+            "background": self.background,
+            "foreground": self.foreground,
+            "accent": self.accent,
+            "citation": self.citation,
+        }
+        for block in ("remark_block", "example_block", "alert_block"):
+            foreground, background = getattr(self, block)
+            roles[f"{block}.foreground"] = foreground
+            roles[f"{block}.background"] = background
+        return roles
+
+    def get_color_map(self, source: "Theme") -> Dict[str, str]:
+        """
+        Get the color replacements that turn mobjects colored with the source theme into
+        mobjects colored with this theme (matching the colors by their role).
+
+        Args:
+            source: The theme the mobjects were colored with.
+
+        Returns:
+            The target color of every source color that changes.
+        """
+        targets = self.get_color_roles()
+        return {
+            color: targets[role]
+            for role, color in source.get_color_roles().items()
+            if color.lower() != targets[role].lower()
+        }
+
+    def recolor(self, m_object, source: "Theme"):
+        """
+        Switch a mobject (and its whole family) from the source theme to this theme, in place.
+
+        Args:
+            m_object: The mobject, e.g., the laid-out content of a slide.
+            source: The theme the mobject was colored with.
+
+        Returns:
+            The mobject.
+        """
+        return recolor(m_object, self.get_color_map(source))
+
+
+LIGHT_THEME = Theme(
+    name="light",
+    background="#FFFFFF",
+    foreground="#000000",
+    accent=MANIM_BLUE.to_hex(),
+    citation="#236B8E",  # manim's DARK_BLUE
+    remark_block=("#bf0040", "#f9e6ec"),
+    example_block=("#007f5f", "#e5f9f6"),
+    alert_block=("#ff0f20", "#ffe6e6"),
+)
+
+DARK_THEME = Theme(
+    name="dark",
+    background="#000000",
+    foreground="#FFFFFF",
+    accent=MANIM_BLUE.to_hex(),
+    citation="#9CDCEB",  # manim's BLUE_A
+    remark_block=("#ff4d80", "#33111c"),
+    example_block=("#2ed3a3", "#0c2b24"),
+    alert_block=("#ff5a5f", "#3a1012"),
+)
+
+# the theme that manim beamer's components are constructed with, see apply_theme
+_current_theme: List[Theme] = [LIGHT_THEME]
+
+
+def get_theme() -> Theme:
+    """
+    Get the current theme (the light theme, unless another one was applied).
+
+    Returns:
+        The current theme.
+    """
+    return _current_theme[0]
+
+
+def apply_theme(theme: Union[None, Theme] = None) -> Theme:
+    """
+    Make a theme the current one (for the components constructed from now on), and configure
+    manim's background color accordingly.
+
+    Args:
+        theme: The theme; if None, the current theme is (re-)applied.
+
+    Returns:
+        The applied theme.
+    """
+    if theme is not None:
+        _current_theme[0] = theme
+    config.background_color = get_theme().background
+    return get_theme()
+
+
+@contextmanager
+def using_theme(theme: Theme):
+    """
+    Make a theme the current one within the body of the context manager only (e.g., while a
+    slide that was created with that theme is laid out), without touching manim's config.
+
+    Args:
+        theme: The theme.
+
+    Yields:
+        The theme.
+    """
+    previous_theme = _current_theme[0]
+    _current_theme[0] = theme
+    try:
+        yield theme
+    finally:
+        _current_theme[0] = previous_theme
+
+
+def use_light_theme() -> None:
+    """
+    Configure manim for the light theme of manim beamer (i.e., a white background, on which
+    the black text of slides, lists and blocks is drawn).
+    """
+    apply_theme(LIGHT_THEME)
+
+
+def make_theme(name: str, base: Theme = LIGHT_THEME, **colors) -> Theme:
+    """
+    Make a custom theme by overriding some colors of another theme.
+
+    Args:
+        name: The name of the custom theme.
+        base: The theme to start from.
+        **colors: The colors to override, e.g., accent="#FF8800".
+
+    Returns:
+        The custom theme.
+    """
+    return replace(base, name=name, **colors)
+
+
+def get_vmobjects(m_object) -> List[VMobject]:
+    return [member for member in m_object.get_family() if isinstance(member, VMobject)]
+
+
+def recolor(m_object, color_map: Dict[str, str]):
+    """
+    Replace colors throughout a mobject's family, in place: the RGBA rows of all its members
+    are gathered into one array per attribute, every replacement is a single vectorized
+    comparison and assignment, and the rows are then handed back. The opacities are kept.
+
+    The replacements are simultaneous, so, e.g., swapping black and white is possible.
+
+    Args:
+        m_object: The mobject.
+        color_map: The target color of every source color (as hex strings or ManimColors).
+
+    Returns:
+        The mobject.
+    """
+    if len(color_map) == 0:
+        return m_object
+    sources = np.array([ManimColor(color).to_rgb() for color in color_map])
+    targets = np.array([ManimColor(color).to_rgb() for color in color_map.values()])
+    members = get_vmobjects(m_object)
+    for attribute in RGBA_ATTRIBUTES:
+        update_rgbas(members, attribute, sources, targets)
+    return m_object
+
+
+def update_rgbas(
+    members: List[VMobject],
+    attribute: str,
+    sources: Union[None, np.ndarray],
+    targets: np.ndarray,
+) -> None:
+    """
+    Replace (or, if sources is None, paint over) the colors of one RGBA attribute of the
+    given mobjects with vectorized operations.
+
+    Args:
+        members: The mobjects.
+        attribute: The RGBA attribute, e.g., "fill_rgbas".
+        sources: The source colors (one RGB row each), or None to paint every row.
+        targets: The target color of every source color (one RGB row each).
+    """
+    arrays = [getattr(member, attribute) for member in members]
+    if len(arrays) == 0:
+        return
+    rgbas = np.concatenate(arrays)
+    if sources is None:
+        rgbas[:, :3] = targets[0]
+    else:
+        # find all the matches before replacing anything, so the replacements do not chain
+        matches = [
+            np.all(np.isclose(rgbas[:, :3], source, atol=1e-3), axis=1)
+            for source in sources
+        ]
+        for match, target in zip(matches, targets):
+            rgbas[match, :3] = target
+    offsets = np.cumsum([len(array) for array in arrays])[:-1]
+    for member, array in zip(members, np.split(rgbas, offsets)):
+        setattr(member, attribute, array)
+
+
+def paint(m_object, color):
+    """
+    Set the color of a mobject's whole family in place (like set_color, which is called per
+    member, but with a single vectorized assignment per attribute). The opacities are kept.
+
+    Args:
+        m_object: The mobject.
+        color: The color.
+
+    Returns:
+        The mobject.
+    """
+    target = np.array([ManimColor(color).to_rgb()])
+    members = get_vmobjects(m_object)
+    for attribute in ("fill_rgbas", "stroke_rgbas"):
+        update_rgbas(members, attribute, None, target)
+    return m_object
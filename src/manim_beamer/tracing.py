@@ -0,0 +1,257 @@
+"""
+Implements opt-in tracing of deck builds: spans are recorded around the drawing of slides,
+lists and blocks, the construction of text and each play/wait, and written as a Chrome trace
+(open it with chrome://tracing or https://ui.perfetto.dev).
+
+Tracing is disabled by default, and a disabled span costs a single attribute lookup. Enable it
+with the tracing context manager, or by setting the MANIM_BEAMER_TRACE environment variable to
+the path of the trace file to write when the process exits.
+
+It also provides the measurements (resident set size, mobject and point counts) of the
+per-slide memory report of SlideShow.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import functools
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+from typing import Union, Callable, List
+
+TRACE_ENV_VAR = "MANIM_BEAMER_TRACE"
+
+
+def count_points(m_object) -> int:
+    """
+    Count the points of a mobject and its whole family (i.e., how much geometry it carries).
+
+    Args:
+        m_object: The mobject.
+
+    Returns:
+        The number of points, or 0 if the object is not a mobject.
+    """
+    if not hasattr(m_object, "get_family"):
+        return 0
+    return sum(len(member.points) for member in m_object.get_family())
+
+
+def count_mobjects(m_object) -> int:
+    """
+    Count the mobjects of a mobject's whole family (including itself).
+
+    Args:
+        m_object: The mobject.
+
+    Returns:
+        The number of mobjects, or 0 if the object is not a mobject.
+    """
+    if not hasattr(m_object, "get_family"):
+        return 0
+    return len(m_object.get_family())
+
+
+def get_rss() -> int:
+    """
+    Get the resident set size (i.e., the physical memory in use) of this process. Where
+    /proc is not available (e.g., on macOS), the peak resident set size is returned instead.
+
+    Returns:
+        The resident set size, in bytes.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024  # bytes vs. KiB
+
+
+def format_memory_report(report: List[dict]) -> str:
+    """
+    Format a memory report (see SlideShow.memory_report) as a table.
+
+    Args:
+        report: The entries of the report, one per slide.
+
+    Returns:
+        The table.
+    """
+    lines: List[str] = [
+        f"{'slide':<40} {'RSS (MiB)':>10} {'delta (MiB)':>12} {'mobjects':>9} {'points':>9}"
+    ]
+    for entry in report:
+        lines.append(
+            f"{entry['slide'][:40]:<40} {entry['rss_after'] / 2**20:>10.1f} "
+            f"{entry['rss_delta'] / 2**20:>+12.1f} {entry['mobjects']:>9} "
+            f"{entry['points']:>9}"
+        )
+    return "\n".join(lines)
+
+
+class Tracer:
+    """
+    The Tracer records spans (named, timed intervals with arguments) as Chrome trace events.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.events: List[dict] = []
+        self.origin: int = time.perf_counter_ns()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self.events = []
+        self.origin = time.perf_counter_ns()
+
+    def record(self, name: str, start: int, end: int, args: dict) -> None:
+        """
+        Record a span.
+
+        Args:
+            name: The name of the span.
+            start: The start of the span, as given by time.perf_counter_ns.
+            end: The end of the span, as given by time.perf_counter_ns.
+            args: The arguments of the span (e.g., the title of the slide).
+        """
+        self.events.append(
+            {
+                "name": name,
+                "cat": name.split(".")[0],
+                "ph": "X",  # a complete event, i.e., with a duration
+                "ts": (start - self.origin) / 1000,  # microseconds
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    @contextmanager
+    def _span(self, name: str, args: dict):
+        start = time.perf_counter_ns()
+        try:
+            yield args  # the caller may add arguments while the span is open
+        finally:
+            self.record(name, start, time.perf_counter_ns(), args)
+
+    def span(self, name: str, **args):
+        """
+        Get a context manager that records a span around its body (or does nothing if
+        tracing is disabled).
+
+        Args:
+            name: The name of the span.
+            **args: The arguments of the span.
+
+        Returns:
+            The context manager; it yields the (mutable) arguments of the span.
+        """
+        if not self.enabled:
+            return nullcontext(args)
+        return self._span(name, args)
+
+    def write(self, path: Union[str, Path]) -> Path:
+        """
+        Write the recorded spans as a Chrome trace file.
+
+        Args:
+            path: The path to the trace file (usually ending with .json).
+
+        Returns:
+            The path to the trace file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+        return path
+
+
+# the tracer shared by all of manim-beamer's components
+tracer: Tracer = Tracer()
+
+
+def traced(
+    name: Union[None, str] = None,
+    describe: Union[None, Callable[..., dict]] = None,
+):
+    """
+    Decorate a function (or method) so that every call is recorded as a span when tracing is
+    enabled. The span records the slide title (if the function is a method of a slide) and
+    the number of points of the returned mobject (if any).
+
+    Args:
+        name: The name of the span; defaults to the qualified name of the function, e.g.,
+            "SlideWithList.draw".
+        describe: An optional callable that receives the call's arguments and returns
+            additional arguments for the span.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(function):
+        span_name = function.__qualname__ if name is None else name
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            span_args = {}
+            if len(args) > 0:
+                title = getattr(args[0], "title_str", None)
+                if title is not None:
+                    span_args["title"] = title
+            if describe is not None:
+                span_args.update(describe(*args, **kwargs))
+            with tracer.span(span_name, **span_args) as span_args:
+                result = function(*args, **kwargs)
+                points = count_points(result)
+                if points > 0:
+                    span_args["points"] = points
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def tracing(path: Union[None, str, Path] = None):
+    """
+    Enable tracing within the body of the context manager, and then write the trace file.
+
+    Args:
+        path: The path to the trace file; if None, nothing is written (the spans remain
+            available in tracer.events).
+
+    Yields:
+        The tracer.
+    """
+    tracer.clear()
+    tracer.enable()
+    try:
+        yield tracer
+    finally:
+        tracer.disable()
+        if path is not None:
+            tracer.write(path)
+
+
+if os.environ.get(TRACE_ENV_VAR):
+    tracer.enable()
+    atexit.register(tracer.write, os.environ[TRACE_ENV_VAR])
@@ -0,0 +1,246 @@
+import os
+import pickle
+
+import pytest
+
+from manim_beamer.bibtex import (
+    BibTexIndex,
+    BibTexManager,
+    get_trigrams,
+    normalize_words,
+)
+from manim_beamer.cache import CACHE_DIR_ENV_VAR
+
+BIB_SOURCE = r"""@string{jmlr = {Journal of Machine Learning Research}}
+
+@article{smith2020fuzzy,
+  author = {John Smith and Jane {van der Berg}},
+  title = {Fuzzy Reinforcement Learning},
+  journal = jmlr,
+  year = {2020}
+}
+
+@inproceedings{Lee2019Graph,
+  author = {K. Lee},
+  title = {{G}{\"o}del and Graph Neural Networks},
+  booktitle = {Proc.},
+  year = 2019
+}
+
+@comment{this is not an entry}
+
+@article{zhang2021policy,
+  author = {A. Zhang and B. Smith and C. Chi},
+  title = {Policy Gradients},
+  journal = jmlr,
+  year = {2021}
+}
+
+@article{smith2020fuzzy,
+  author = {Someone Else},
+  title = {A Duplicate Key},
+  year = {1999}
+}
+"""
+
+SHORT_CITES = {
+    "smith2020fuzzy": "[Smith and van der Berg (2020)]",
+    "Lee2019Graph": "[Lee (2019)]",
+    "zhang2021policy": "[Zhang et al. (2021)]",
+}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # keep the on-disk caches out of the user's cache directory
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def bib_path(tmp_path):
+    path = tmp_path / "references.bib"
+    path.write_text(BIB_SOURCE, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def bib_manager(bib_path):
+    return BibTexManager(bib_path, use_cache=False)
+
+
+def test_normalize_words_ignores_case_accents_braces_and_punctuation():
+    assert normalize_words(r"{G}{\"o}del's Theorem") == ["godel", "s", "theorem"]
+    assert normalize_words("Gödel s theorem") == ["godel", "s", "theorem"]
+    assert normalize_words("{van der Berg}") == ["van", "der", "berg"]
+
+
+def test_get_trigrams_pads_the_lowercase_key():
+    assert get_trigrams("Ab") == {"  a", " ab", "ab "}
+
+
+def test_intersect_starts_from_the_smallest_set():
+    assert BibTexIndex.intersect([{"a", "b", "c"}, {"b"}, {"b", "c"}]) == {"b"}
+    assert BibTexIndex.intersect([]) == set()
+
+
+def test_find_prefix():
+    strings = ["apple", "graph", "graphs", "gray", "policy"]
+    assert BibTexIndex.find_prefix(strings, "grap") == ["graph", "graphs"]
+    assert BibTexIndex.find_prefix(strings, "z") == []
+
+
+def test_the_first_of_duplicate_keys_wins(bib_manager):
+    assert bib_manager.short_cites == SHORT_CITES
+    assert bib_manager["smith2020fuzzy"]["year"] == "2020"
+
+
+def test_search_by_author(bib_manager):
+    assert bib_manager.search(author="berg") == ["smith2020fuzzy"]
+    assert bib_manager.search(author="Van der Berg") == ["smith2020fuzzy"]
+    assert bib_manager.search(author="smith") == ["smith2020fuzzy", "zhang2021policy"]
+    assert bib_manager.search(author="nobody") == []
+
+
+def test_search_by_years(bib_manager):
+    assert bib_manager.search(years=2019) == ["Lee2019Graph"]
+    assert bib_manager.search(years=(2019, 2020)) == ["Lee2019Graph", "smith2020fuzzy"]
+    assert bib_manager.search(years=(1990, 1995)) == []
+
+
+def test_search_by_title(bib_manager):
+    assert bib_manager.search(title="godel") == ["Lee2019Graph"]
+    assert bib_manager.search(title="fuzzy learning") == ["smith2020fuzzy"]
+    # only the last keyword may be a prefix
+    assert bib_manager.search(title="god") == []
+    assert bib_manager.search(title="gr", prefix=True) == [
+        "Lee2019Graph",
+        "zhang2021policy",
+    ]
+    assert bib_manager.search(title="fuz learning", prefix=True) == []
+
+
+def test_search_combines_the_criteria(bib_manager):
+    assert bib_manager.search(author="smith", years=2021) == ["zhang2021policy"]
+    assert bib_manager.search(author="smith", title="fuzzy", years=2021) == []
+    assert bib_manager.search() == []
+
+
+def test_find_by_key_prefix_ignores_the_case(bib_manager):
+    assert bib_manager.index.find_by_key_prefix("LEE") == ["Lee2019Graph"]
+    assert bib_manager.index.find_by_key_prefix("") == [
+        "Lee2019Graph",
+        "smith2020fuzzy",
+        "zhang2021policy",
+    ]
+
+
+def test_find_similar_keys_tolerates_typos(bib_manager):
+    index = bib_manager.index
+    assert index.find_similar_keys("smtih2020fuzy")[0] == "smith2020fuzzy"
+    assert index.find_similar_keys("zhang2021") == ["zhang2021policy"]
+    assert index.find_similar_keys("qqqqqqqq") == []
+    assert len(index.find_similar_keys("2020", limit=1, cutoff=0.0)) == 1
+
+
+def test_lazy_mode_indexes_offsets_without_parsing(bib_path):
+    bib_manager = BibTexManager(bib_path, use_cache=False, lazy=True)
+    assert list(bib_manager.entry_offsets) == [
+        "smith2020fuzzy",
+        "Lee2019Graph",
+        "zhang2021policy",
+    ]
+    assert bib_manager.entries_by_key == {}
+    source = bib_path.read_bytes()
+    start, end = bib_manager.entry_offsets["Lee2019Graph"]
+    assert source[start:end].startswith(b"@inproceedings{Lee2019Graph,")
+    assert b"@comment" not in source[start:end]
+
+
+def test_lazy_mode_parses_entries_on_demand(bib_path, bib_manager):
+    lazy_manager = BibTexManager(bib_path, use_cache=False, lazy=True)
+    entry = lazy_manager["smith2020fuzzy"]
+    # the @string definitions are resolved, and the first duplicate wins
+    assert entry["journal"] == "Journal of Machine Learning Research"
+    assert entry["year"] == "2020"
+    assert list(lazy_manager.entries_by_key) == ["smith2020fuzzy"]
+    assert lazy_manager["missing"] is None
+    for key in SHORT_CITES:
+        lazy_manager[key]
+    assert lazy_manager.short_cites == bib_manager.short_cites
+    assert lazy_manager.author_last_names == bib_manager.author_last_names
+
+
+def test_lazy_mode_parses_the_whole_file_for_queries(bib_path):
+    bib_manager = BibTexManager(bib_path, use_cache=False, lazy=True)
+    assert bib_manager.search(author="chi") == ["zhang2021policy"]
+
+
+def test_lazy_mode_handles_an_empty_file(tmp_path):
+    path = tmp_path / "empty.bib"
+    path.write_bytes(b"")
+    bib_manager = BibTexManager(path, use_cache=False, lazy=True)
+    assert bib_manager.entry_offsets == {}
+    assert bib_manager["anything"] is None
+
+
+def count_parses(monkeypatch) -> list:
+    parses = []
+    parse = BibTexManager.parse
+
+    def counting_parse(self):
+        parses.append(self.path)
+        return parse(self)
+
+    monkeypatch.setattr(BibTexManager, "parse", counting_parse)
+    return parses
+
+
+def test_the_cache_is_reused(bib_path, monkeypatch):
+    parses = count_parses(monkeypatch)
+    BibTexManager(bib_path)
+    bib_manager = BibTexManager(bib_path)
+    assert len(parses) == 1
+    assert bib_manager.short_cites == SHORT_CITES
+    assert bib_manager.search(author="berg") == ["smith2020fuzzy"]
+
+
+def test_the_cache_survives_a_touch(bib_path, monkeypatch):
+    parses = count_parses(monkeypatch)
+    BibTexManager(bib_path)
+    stat = bib_path.stat()
+    os.utime(bib_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    BibTexManager(bib_path)
+    BibTexManager(bib_path)
+    assert len(parses) == 1
+    with open(BibTexManager(bib_path).cache_path, "rb") as file:
+        assert pickle.load(file)["mtime_ns"] == bib_path.stat().st_mtime_ns
+
+
+def test_the_cache_is_invalidated_by_a_change(bib_path, monkeypatch):
+    parses = count_parses(monkeypatch)
+    BibTexManager(bib_path)
+    bib_path.write_text(
+        BIB_SOURCE.replace("Policy Gradients", "Value Functions"), encoding="utf-8"
+    )
+    stat = bib_path.stat()
+    os.utime(bib_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    bib_manager = BibTexManager(bib_path)
+    assert len(parses) == 2
+    assert bib_manager.search(title="value") == ["zhang2021policy"]
+
+
+@pytest.mark.parametrize(
+    "contents", [b"", b"not a pickle", pickle.dumps({"version": -1})]
+)
+def test_an_unreadable_cache_is_ignored(bib_path, monkeypatch, contents):
+    parses = count_parses(monkeypatch)
+    BibTexManager(bib_path).cache_path.write_bytes(contents)
+    bib_manager = BibTexManager(bib_path)
+    assert len(parses) == 2
+    assert bib_manager.short_cites == SHORT_CITES
+
+
+def test_the_cache_is_not_used_if_disabled(bib_path, cache_dir):
+    BibTexManager(bib_path, use_cache=False)
+    assert not (cache_dir / "bibtex").exists()
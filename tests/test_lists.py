@@ -0,0 +1,100 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim_beamer.lists import BulletedList, ItemizedList  # noqa: E402
+
+
+class FixedSizeList(BulletedList):
+    """
+    A list whose items are measured from their text (e.g., "a:2" is 2 units tall), so that the
+    pagination is tested without rendering anything.
+    """
+
+    def measure_item(self, item, scale_factor: float):
+        if isinstance(item, tuple):
+            item = item[0]
+        if isinstance(item, FixedSizeList):
+            sizes = item.measure_items(scale_factor)
+            height = sum(size[1] for size in sizes)
+            return 1.0, height + item.item_gap * (len(sizes) - 1)
+        return 1.0, float(item.split(":")[1])
+
+
+def get_page_items(pages) -> list:
+    return [
+        [item.items if isinstance(item, FixedSizeList) else item for item in page.items]
+        for page in pages
+    ]
+
+
+def test_paginate_fills_pages_up_to_the_maximum_height():
+    beamer_list = FixedSizeList(["a:1", "b:1", "c:1", "d:1"])
+    gap = beamer_list.item_gap  # 0.125
+    pages = beamer_list.paginate(max_height=2 + gap)
+    assert get_page_items(pages) == [["a:1", "b:1"], ["c:1", "d:1"]]
+    pages = beamer_list.paginate(max_height=3 + 2 * gap)
+    assert get_page_items(pages) == [["a:1", "b:1", "c:1"], ["d:1"]]
+
+
+def test_paginate_keeps_a_list_that_fits_on_one_page():
+    beamer_list = FixedSizeList(["a:1", "b:1"])
+    assert get_page_items(beamer_list.paginate(max_height=100)) == [["a:1", "b:1"]]
+
+
+def test_paginate_keeps_an_item_with_its_sublists():
+    sublist = FixedSizeList(["x:1", "y:1"])
+    beamer_list = FixedSizeList(["a:1", "b:1", sublist, "c:1"])
+    pages = beamer_list.paginate(max_height=3)
+    # "b" and its sublist (2.125 tall) do not fit after "a", so they start a new page
+    assert get_page_items(pages) == [["a:1"], ["b:1", ["x:1", "y:1"]], ["c:1"]]
+
+
+def test_paginate_gives_a_tall_item_a_page_of_its_own():
+    beamer_list = FixedSizeList(["a:1", "b:5", "c:1"])
+    pages = beamer_list.paginate(max_height=2)
+    assert get_page_items(pages) == [["a:1"], ["b:5"], ["c:1"]]
+
+
+def test_paginate_handles_tuple_items_and_a_leading_sublist():
+    sublist = FixedSizeList(["x:1"])
+    beamer_list = FixedSizeList([sublist, ("a:1", "#ff0000", 0.5), "b:1"])
+    pages = beamer_list.paginate(max_height=1)
+    assert get_page_items(pages) == [[["x:1"]], [("a:1", "#ff0000", 0.5)], ["b:1"]]
+
+
+def test_pages_keep_the_style_of_the_list():
+    beamer_list = FixedSizeList(
+        ["a:1", "b:1"], font_size=20, list_color="#123456", max_item_width=4.0
+    )
+    beamer_list.item_vertical_spacing = 0.5
+    pages = beamer_list.paginate(max_height=1)
+    assert len(pages) == 2
+    for page in pages:
+        assert type(page) is FixedSizeList
+        assert page.font_size == 20
+        assert page.list_color == "#123456"
+        assert page.max_item_width == 4.0
+        assert page.item_vertical_spacing == 0.5
+
+
+def test_the_item_sizes_are_measured_once_per_scale_factor():
+    measured = []
+
+    class CountingList(FixedSizeList):
+        def measure_item(self, item, scale_factor: float):
+            measured.append(item)
+            return super().measure_item(item, scale_factor)
+
+    beamer_list = CountingList(["a:1", "b:1"])
+    beamer_list.paginate(max_height=1)
+    beamer_list.paginate(max_height=5)
+    assert measured == ["a:1", "b:1"]
+    beamer_list.paginate(max_height=1, scale_factor=0.5)
+    assert len(measured) == 4
+
+
+def test_the_item_gap_follows_the_vertical_spacing():
+    beamer_list = ItemizedList(["a"])
+    beamer_list.item_vertical_spacing = 0.4
+    assert beamer_list.item_gap == pytest.approx(0.2)
@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import NORMAL  # noqa: E402
+
+from manim_beamer.text_metrics import (  # noqa: E402
+    REFERENCE_FONT_SIZE,
+    SAMPLE_CHARS,
+    TextMetrics,
+)
+
+
+@pytest.fixture
+def text_metrics() -> TextMetrics:
+    """
+    Text metrics of a made-up monospaced font (every character is 1 unit wide at the
+    reference font size), so that nothing is rendered.
+    """
+    text_metrics = TextMetrics()
+    text_metrics._tables[("", NORMAL, NORMAL)] = {
+        "advances": {char: 1.0 for char in SAMPLE_CHARS},
+        "tops": {char: 0.5 if char.islower() else 0.75 for char in SAMPLE_CHARS},
+        "bottoms": {char: -0.25 if char in "gjpqy" else 0.0 for char in SAMPLE_CHARS},
+        "line_pitch": 1.5,
+    }
+    return text_metrics
+
+
+def test_get_width_is_the_width_of_the_longest_line(text_metrics):
+    assert text_metrics.get_width("abc", font_size=REFERENCE_FONT_SIZE) == 3.0
+    assert text_metrics.get_width("ab\nabcd", font_size=REFERENCE_FONT_SIZE) == 4.0
+    # the advances scale linearly with the font size
+    assert text_metrics.get_width("abcd", font_size=REFERENCE_FONT_SIZE / 2) == 2.0
+
+
+def test_unmeasured_characters_fall_back_to_their_base_character(text_metrics):
+    advances = text_metrics.get_advances()
+    advances["e"] = 0.5
+    assert TextMetrics.get_advance(advances, "é") == 0.5
+    assert TextMetrics.get_advance(advances, "中") == advances["M"]
+
+
+def test_wrap_breaks_lines_at_spaces(text_metrics):
+    wrap = text_metrics.wrap
+    size = REFERENCE_FONT_SIZE
+    assert wrap("aa bb cc", 5, font_size=size) == "aa bb\ncc"
+    assert wrap("aa bb cc", 8, font_size=size) == "aa bb cc"
+    # a word that is wider than the line is kept whole
+    assert wrap("a bbbbbbbb c", 3, font_size=size) == "a\nbbbbbbbb\nc"
+    # the existing line breaks are kept, and repeated spaces collapse
+    assert wrap("aa  bb\ncc dd", 5, font_size=size) == "aa bb\ncc dd"
+    # the width is compared at the given font size
+    assert wrap("aa bb cc", 5, font_size=size / 2) == "aa bb cc"
+
+
+def test_get_height_spans_the_glyphs_of_all_lines(text_metrics):
+    size = REFERENCE_FONT_SIZE
+    assert text_metrics.get_height("ace", font_size=size) == 0.5
+    assert text_metrics.get_height("Ace", font_size=size) == 0.75
+    assert text_metrics.get_height("Ag", font_size=size) == 1.0
+    # from the top of the first line to the bottom of the last (1.5 lower)
+    assert text_metrics.get_height("A\nace", font_size=size) == 0.75 + 1.5
+    assert text_metrics.get_height("A\n\ng", font_size=size) == 0.75 + 3.0 + 0.25
+    assert text_metrics.get_height("Ag", font_size=size / 2) == 0.5
+    assert text_metrics.get_height(" \n ", font_size=size) == 0.0